@@ -1,4 +1,13 @@
 #!/bin/bash
 
+# Prefork children run one task at a time, a persistent connection per child is
+# enough and avoids keeping an idle pool in every child.
+export DATABASE_POOL=${DATABASE_POOL:-false}
+export DATABASE_CONN_MAX_AGE=${DATABASE_CONN_MAX_AGE:-600}
+
+# The Django system checks load the URLconf and every viewset, they already run on
+# deploy with `migrate`.
+export CELERY_SKIP_CHECKS=${CELERY_SKIP_CHECKS:-1}
+
 cd src
 celery -A config worker -l INFO
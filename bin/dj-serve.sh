@@ -0,0 +1,7 @@
+#!/bin/bash
+# Production server: gunicorn with the settings from src/config/gunicorn.py.
+# Send HUP to the master for a graceful reload of the workers.
+
+cd "$(dirname "$0")/../src"
+
+exec uv run gunicorn -c config/gunicorn.py config.wsgi
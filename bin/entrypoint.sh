@@ -5,4 +5,4 @@ echo "Running migrations..."
 uv run src/manage.py migrate
 
 echo "Starting Django app..."
-uv run src/manage.py runserver 0.0.0.0:8000
+exec ./bin/dj-serve.sh
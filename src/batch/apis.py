@@ -0,0 +1,50 @@
+"""
+Batch API ViewSet.
+"""
+
+from typing import Any
+
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from batch.serializers import BatchRequestSerializer, BatchResponseSerializer
+from batch.services import BatchService
+from core.apis import BaseAPIViewSet
+from core.schema import base_responses
+
+
+class BatchViewSet(BaseAPIViewSet):
+    """
+    Run many API calls in one HTTP round trip.
+    """
+
+    resource_name = "batch"
+    permission_classes = [IsAuthenticated]
+    # The sub-requests pin the user themselves when they write.
+    pin_writes = False
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Initialize the BatchViewSet.
+        """
+        super().__init__(**kwargs)
+        self.batch_service = BatchService()
+
+    @extend_schema(request=BatchRequestSerializer, responses={**base_responses, 200: BatchResponseSerializer})
+    def create(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Run the sub-requests as the authenticated user and return their responses, in order.
+
+        A failed sub-request gets its own error status and does not fail the batch.
+        """
+        serializer = BatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        responses = self.batch_service.run(request, data["requests"], parallel=data["parallel"])
+        return self.response_ok(data={"responses": responses})
+
+
+apps = [BatchViewSet]
@@ -0,0 +1,14 @@
+"""
+Django app configuration for the batch application.
+"""
+
+from django.apps import AppConfig
+
+
+class BatchConfig(AppConfig):
+    """
+    Batch application configuration.
+    """
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "batch"
@@ -0,0 +1,59 @@
+"""
+Serializers for the batch application.
+"""
+
+from django.conf import settings
+from rest_framework import serializers
+
+from core.constants import API_ROOT
+from core.exception import BatchErrorMessage
+from core.serializers import BaseSerializer
+
+
+class BatchItemSerializer(BaseSerializer):
+    """
+    Batch sub-request serializer.
+    """
+
+    method = serializers.ChoiceField(
+        choices=["GET", "POST", "PUT", "PATCH", "DELETE"], default="GET", help_text="HTTP method."
+    )
+    path = serializers.CharField(help_text="API path with the query string, e.g. /api/v1/courses/?fields=id,title.")
+    body = serializers.JSONField(required=False, help_text="JSON body of the sub-request.")
+
+    def validate_path(self, value):
+        """
+        Validate the path is an API path.
+        """
+        if not value.startswith(API_ROOT):
+            raise serializers.ValidationError(BatchErrorMessage.INVALID_PATH.format(API_ROOT))
+
+        return value
+
+
+class BatchRequestSerializer(BaseSerializer):
+    """
+    Batch request serializer.
+    """
+
+    requests = BatchItemSerializer(many=True, allow_empty=False, max_length=settings.BATCH_MAX_REQUESTS)
+    parallel = serializers.BooleanField(
+        default=False, help_text="Run the sub-requests in parallel threads, only when they are all GET requests."
+    )
+
+
+class BatchItemResponseSerializer(BaseSerializer):
+    """
+    Batch sub-response serializer.
+    """
+
+    status = serializers.IntegerField(help_text="HTTP status code.")
+    body = serializers.JSONField(help_text="Response body.")
+
+
+class BatchResponseSerializer(BaseSerializer):
+    """
+    Batch response serializer, the responses are in the order of the sub-requests.
+    """
+
+    responses = BatchItemResponseSerializer(many=True)
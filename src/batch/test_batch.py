@@ -0,0 +1,133 @@
+"""
+Test cases for the batch endpoint.
+"""
+
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from batch.apis import BatchViewSet
+from core.constants import API_ROOT, CourseStatus, UserRole
+from core.tests import BaseAPITestCase
+from courses.factories import CategoryFactory, CourseFactory
+from courses.models import Enrollment
+
+
+class BatchAPITestCase(BaseAPITestCase):
+    """
+    Batch endpoint test cases.
+    """
+
+    resource = BatchViewSet
+
+    def setUp(self):
+        """
+        Set up a student and a published course.
+        """
+        super().setUp()
+        self.student = self.make_user(role=UserRole.STUDENT.value)
+        self.instructor = self.make_user(role=UserRole.INSTRUCTOR.value)
+        self.course = CourseFactory(
+            instructor=self.instructor, category=CategoryFactory(), status=CourseStatus.PUBLISHED.value
+        )
+        self.set_authenticate(self.student)
+
+    def test_batch_success(self):
+        """
+        Test the sub-requests run in order, as the authenticated user.
+        """
+        response = self.post_json_ok(
+            data={
+                "requests": [
+                    {"path": f"{API_ROOT}users/me/"},
+                    {"method": "POST", "path": f"{API_ROOT}enrollments/", "body": {"course_id": self.course.id}},
+                    {"path": f"{API_ROOT}enrollments/me/?fields=id"},
+                ]
+            }
+        )
+
+        user, enrollment, enrollments = response.data["responses"]
+        assert user["status"] == 200
+        assert user["body"]["id"] == str(self.student.id)
+        assert enrollment["status"] == 201
+        assert Enrollment.objects.filter(course=self.course, student=self.student).exists()
+        assert enrollments["status"] == 200
+        assert enrollments["body"]["data"] == [{"id": enrollment["body"]["id"]}]
+
+    def test_batch_shares_authentication(self):
+        """
+        Test the sub-requests do not authenticate again.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_json_ok(data={"requests": [{"path": f"{API_ROOT}users/me/"}] * 3})
+
+        assert [item["status"] for item in response.data["responses"]] == [200, 200, 200]
+        assert sum('FROM "users_user"' in query["sql"] for query in queries.captured_queries) == 1
+
+    def test_batch_parallel(self):
+        """
+        Test independent GET requests run in threads and keep their order.
+        """
+        paths = [f"{API_ROOT}users/me/", f"{API_ROOT}users/me/?x=1", f"{API_ROOT}unknown/"]
+
+        response = self.post_json_ok(data={"requests": [{"path": path} for path in paths], "parallel": True})
+
+        assert [item["status"] for item in response.data["responses"]] == [200, 200, 404]
+
+    def test_batch_sub_request_errors(self):
+        """
+        Test a failed sub-request does not fail the batch.
+        """
+        response = self.post_json_ok(
+            data={
+                "requests": [
+                    {"path": f"{API_ROOT}unknown/"},
+                    {"method": "POST", "path": f"{API_ROOT}batch/", "body": {"requests": []}},
+                    {"method": "POST", "path": f"{API_ROOT}enrollments/", "body": {}},
+                ]
+            }
+        )
+
+        assert [item["status"] for item in response.data["responses"]] == [404, 400, 400]
+
+    def test_batch_sub_request_unexpected_error(self):
+        """
+        Test an unexpected error of a sub-request only fails its item.
+        """
+        with patch("courses.apis.CourseViewSet.list", side_effect=RuntimeError("boom")):
+            response = self.post_json_ok(
+                data={
+                    "requests": [
+                        {"method": "POST", "path": f"{API_ROOT}enrollments/", "body": {"course_id": self.course.id}},
+                        {"path": f"{API_ROOT}courses/"},
+                    ]
+                }
+            )
+
+        assert [item["status"] for item in response.data["responses"]] == [201, 500]
+        assert Enrollment.objects.filter(student=self.student, course=self.course).exists()
+
+    def test_batch_invalid(self):
+        """
+        Test invalid batches are rejected.
+        """
+        response = self.post_json_bad_request(data={"requests": [{"path": "/admin/"}]})
+        assert response.status_code == 400
+
+        response = self.post_json_bad_request(data={"requests": []})
+        assert response.status_code == 400
+
+        requests = [{"path": f"{API_ROOT}users/me/"}] * (settings.BATCH_MAX_REQUESTS + 1)
+        response = self.post_json_bad_request(data={"requests": requests})
+        assert response.status_code == 400
+
+    def test_batch_unauthorized(self):
+        """
+        Test the batch requires authentication.
+        """
+        self.auth = None
+
+        response = self.post_json_unauthorized(data={"requests": [{"path": f"{API_ROOT}users/me/"}]})
+        assert response.status_code == 401
@@ -0,0 +1,124 @@
+"""
+Benchmark helpers.
+
+The benchmarks are plain scripts, run them from the `src` folder:
+
+    python -m benchmarks.bench_renderers
+"""
+
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+
+def setup_django(environment: str = "test") -> None:
+    """
+    Configure Django so the benchmarks can import models, serializers and services.
+
+    Args:
+        environment (str): Value for DJANGO_ENV when it is not set yet. Defaults to "test".
+    """
+    import django
+
+    os.environ.setdefault("DJANGO_ENV", environment)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Create a throwaway test database for the duration of the block.
+
+    With the test settings this is an in-memory SQLite database.
+    """
+    from django.db import connection
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timing and memory figures of a benchmarked callable.
+    """
+
+    name: str
+    best: float
+    median: float
+    peak_memory: int
+
+    @property
+    def ops_per_sec(self) -> float:
+        """
+        Number of calls per second based on the best run.
+        """
+        return 1 / self.best if self.best else float("inf")
+
+
+def measure(name: str, func: Callable, repeat: int = 5, number: int = 100) -> BenchmarkResult:
+    """
+    Measure the run time per call and the peak allocated memory of `func`.
+
+    Args:
+        name (str): Label of the benchmark.
+        func (Callable): Callable without arguments to measure.
+        repeat (int): Number of timing rounds. Defaults to 5.
+        number (int): Number of calls per round. Defaults to 100.
+
+    Returns:
+        BenchmarkResult: Seconds per call (best and median round) and peak memory in bytes.
+    """
+    func()  # warm up
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(name=name, best=min(timings), median=statistics.median(timings), peak_memory=peak)
+
+
+def print_results(title: str, results: Iterable[BenchmarkResult], rows: int = None) -> None:
+    """
+    Print benchmark results as a table.
+
+    Args:
+        title (str): Title of the table.
+        results (Iterable[BenchmarkResult]): Results to print.
+        rows (int, optional): Number of rows handled per call, adds a per-row cost column.
+    """
+    print(f"\n{title}")
+    header = f"{'benchmark':<48} {'best (ms)':>10} {'median (ms)':>12} {'ops/sec':>10} {'peak (KiB)':>11}"
+    print(f"{header} {'us/row':>8}" if rows else header)
+    for result in results:
+        line = (
+            f"{result.name:<48} {result.best * 1000:>10.3f} {result.median * 1000:>12.3f} "
+            f"{result.ops_per_sec:>10.1f} {result.peak_memory / 1024:>11.1f}"
+        )
+        print(f"{line} {result.best * 1_000_000 / rows:>8.2f}" if rows else line)
@@ -0,0 +1,78 @@
+"""
+Compare the per-request database cost with and without connection reuse.
+
+Every simulated request goes through the same steps as a Django request: the
+connection is checked at `request_started`, a query runs and the connection is
+released at `request_finished`. Without reuse, each request pays for the TCP, TLS
+and authentication handshake.
+
+Needs a running Postgres configured through the DATABASE_* variables (see `.env.example`).
+
+Usage (from the `src` folder):
+
+    python -m benchmarks.bench_db_pool [--number 200] [--query "SELECT 1"]
+"""
+
+import argparse
+
+from benchmarks import measure, print_results, setup_django
+
+
+def get_variants(pool_options: dict) -> dict[str, dict]:
+    """
+    Get the database settings to compare, applied on top of the default database.
+    """
+    return {
+        "new connection (CONN_MAX_AGE=0)": {"CONN_MAX_AGE": 0, "OPTIONS": {}},
+        "persistent (CONN_MAX_AGE=60)": {"CONN_MAX_AGE": 60, "OPTIONS": {}},
+        "psycopg pool": {"CONN_MAX_AGE": 0, "OPTIONS": {"pool": pool_options}},
+    }
+
+
+def simulate_request(connection, query: str) -> None:
+    """
+    Run `query` the way a view would, between the request signals.
+    """
+    connection.close_if_unusable_or_obsolete()
+    with connection.cursor() as cursor:
+        cursor.execute(query)
+        cursor.fetchall()
+    connection.close_if_unusable_or_obsolete()
+
+
+def main():
+    """
+    Run the connection pool benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200, help="Number of requests per round.")
+    parser.add_argument("--query", default="SELECT 1", help="Query run by each request.")
+    args = parser.parse_args()
+
+    setup_django(environment="local")
+
+    from django.db import connections
+
+    default = connections.settings["default"]
+    if default["ENGINE"] != "django.db.backends.postgresql":
+        raise SystemExit("The connection pool benchmark needs a Postgres database.")
+
+    pool_options = default["OPTIONS"].get("pool") or {"min_size": 1, "max_size": 2}
+
+    results = []
+    for name, overrides in get_variants(pool_options).items():
+        alias = f"bench_{len(results)}"
+        connections.settings[alias] = {**default, **overrides}
+        connection = connections[alias]
+        try:
+            results.append(measure(name, lambda: simulate_request(connection, args.query), number=args.number))
+        finally:
+            connection.close()
+            if overrides["OPTIONS"]:
+                connection.close_pool()
+
+    print_results(f"{args.query!r} per request on {default['HOST']}:{default['PORT']}", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Measure the import time of the processes' cold start with `python -X importtime`.
+
+Each scenario runs in a fresh interpreter, the table shows the total import time,
+the number of imported modules and the wall time of the process.
+
+Usage (from the `src` folder):
+
+    python -m benchmarks.bench_import_time [--repeat 3] [--top 15]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    # What a gunicorn worker loads before serving any request
+    "wsgi application": ("import config.wsgi", {}),
+    # The URLconf and the course viewset, loaded by the first request to /courses/
+    "first /courses/ request": (
+        "import config.wsgi\nfrom django.urls import resolve\nresolve('/api/v1/courses/')",
+        {},
+    ),
+    # Every viewset, e.g. schema generation or a reverse() of any API URL
+    "all viewsets": ("import config.wsgi\nfrom django.urls import reverse\nreverse('courses-list')", {}),
+    # What a Celery worker loads before consuming tasks, as started by bin/dj-celery-worker.sh
+    "celery worker": (
+        "from config.celery import app\napp.loader.import_default_modules()",
+        {"CELERY_SKIP_CHECKS": "1"},
+    ),
+}
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_scenario(code: str, extra_env: dict) -> tuple[float, list[tuple[int, int, str]]]:
+    """
+    Run `code` in a fresh interpreter with `-X importtime`.
+
+    Args:
+        code (str): Code to run.
+        extra_env (dict): Environment variables added to the current ones.
+
+    Returns:
+        tuple: Wall time in seconds and the `(self us, cumulative us, module)` entries.
+    """
+    env = {"DJANGO_ENV": "test", "DJANGO_SETTINGS_MODULE": "config.settings", **os.environ, **extra_env}
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    wall_time = time.perf_counter() - start
+
+    entries = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            entries.append((int(match.group(1)), int(match.group(2)), match.group(4)))
+
+    return wall_time, entries
+
+
+def main():
+    """
+    Run the import time benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario, the median is reported.")
+    parser.add_argument("--top", type=int, default=0, help="Print the slowest project modules of each scenario.")
+    args = parser.parse_args()
+
+    project_packages = set(os.listdir(os.path.dirname(os.path.dirname(__file__))))
+
+    print(f"\n{'scenario':<28} {'imports (ms)':>13} {'modules':>8} {'wall (ms)':>10}")
+    for name, (code, extra_env) in SCENARIOS.items():
+        runs = [run_scenario(code, extra_env) for _ in range(args.repeat)]
+        import_times = [sum(entry[0] for entry in entries) / 1000 for _, entries in runs]
+        wall_times = [wall_time * 1000 for wall_time, _ in runs]
+        entries = runs[0][1]
+
+        print(
+            f"{name:<28} {statistics.median(import_times):>13.1f} {len(entries):>8} "
+            f"{statistics.median(wall_times):>10.1f}"
+        )
+
+        if args.top:
+            project_entries = [entry for entry in entries if entry[2].split(".")[0] in project_packages]
+            for _, cumulative, module in sorted(project_entries, reverse=True, key=lambda entry: entry[1])[: args.top]:
+                print(f"    {module:<44} {cumulative / 1000:>9.1f} ms cumulative")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,427 @@
+"""
+End-to-end load test of the API with realistic traffic.
+
+Boots gunicorn against the local database, signs in students of a `seed_scale`
+dataset and runs one virtual student per client thread. Each iteration a student
+picks a scenario from the traffic mix:
+
+    browse     list the catalog, open a course
+    enroll     enroll in a published course, list its lessons
+    lesson     open a lesson of an enrolled course, complete it
+    quiz       open a quiz of an enrolled course, submit answers
+    dashboard  open the dashboard counters and the enrollments
+
+Throughput and latency percentiles are printed per endpoint and written as JSON
+with `--output`. With `--baseline`, the run is compared to a previous output and
+the script exits with status 1 when an endpoint regressed by more than
+`--tolerance` (total throughput, p95 latency or error rate per endpoint).
+
+Usage (from the `src` folder):
+
+    python manage.py seed_scale --users 2000 --courses 100 --enrollments 10000 --progress 50000
+    python -m benchmarks.bench_load [--concurrency 16] [--duration 30] [--mix browse=50,lesson=20,...]
+    python -m benchmarks.bench_load --output benchmarks/baselines/load.json       # record a baseline
+    python -m benchmarks.bench_load --baseline benchmarks/baselines/load.json     # compare to it
+    python -m benchmarks.bench_load --url http://localhost:8000                   # an already running server
+
+A run only changes the data of the signed in students, seed a fresh dataset to
+compare runs on the same data.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import requests
+
+from benchmarks import setup_django
+from benchmarks.bench_server import get_free_port, get_server_env, start_server, wait_until_ready
+from benchmarks.load import LoadResult, print_load_results
+
+DEFAULT_MIX = {"browse": 50, "enroll": 5, "lesson": 20, "quiz": 10, "dashboard": 15}
+PERCENTILES = (50, 90, 95, 99)
+# Requests under which the p95 of an endpoint is not compared to the baseline.
+MIN_SAMPLES = 100
+PASSWORD = "seed_password"
+API_ROOT = "/api/v1"
+
+
+@dataclass
+class Student:
+    """
+    A signed in student and the work left in the dataset.
+    """
+
+    email: str
+    enrolled: list[int]
+    lessons: list[str]
+    quizzes: list[str]
+    token: str = ""
+
+
+@dataclass
+class Recorder:
+    """
+    Latencies and errors per endpoint, shared by the client threads.
+    """
+
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def merge(self, latencies: dict[str, list[float]], errors: dict[str, int]) -> None:
+        """
+        Add the measures of one client thread.
+        """
+        with self.lock:
+            for label, values in latencies.items():
+                self.latencies[label].extend(values)
+            for label, count in errors.items():
+                self.errors[label] += count
+
+
+class Client:
+    """
+    HTTP client of one virtual student, measuring every request.
+    """
+
+    def __init__(self, base_url: str, student: Student, rng: random.Random):
+        """
+        Initialize the client of `student`.
+        """
+        self.base_url = base_url
+        self.student = student
+        self.rng = rng
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {student.token}"
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def request(self, label: str, method: str, path: str, expected: int = 200, **kwargs) -> dict | None:
+        """
+        Send a request and record its latency under `label`, e.g. `GET /courses/{id}/`.
+
+        Returns:
+            dict | None: The JSON body, None when the request failed.
+        """
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, f"{self.base_url}{API_ROOT}{path}", timeout=30, **kwargs)
+        except requests.RequestException:
+            self.errors[label] += 1
+            return None
+        elapsed = time.perf_counter() - start
+
+        if response.status_code == 401:
+            # The access token expired, sign in again and retry unmeasured.
+            self.student.token = sign_in(self.base_url, self.student.email)
+            self.session.headers["Authorization"] = f"Bearer {self.student.token}"
+            return self.request(label, method, path, expected, **kwargs)
+        if response.status_code != expected:
+            self.errors[label] += 1
+            return None
+
+        self.latencies[label].append(elapsed)
+        return response.json() if response.content else {}
+
+    def browse(self) -> None:
+        """
+        List a page of the catalog and open one of its courses.
+        """
+        page = self.request(
+            "GET /courses/", "GET", "/courses/", params={"limit": 20, "offset": self.rng.randrange(5) * 20}
+        )
+        if page and page["data"]:
+            course = self.rng.choice(page["data"])
+            self.request("GET /courses/{id}/", "GET", f"/courses/{course['id']}/")
+
+    def enroll(self, catalog: list[int]) -> None:
+        """
+        Enroll in a course and list its lessons.
+        """
+        enrolled = set(self.student.enrolled)
+        candidates = [course for course in self.rng.sample(catalog, min(len(catalog), 20)) if course not in enrolled]
+        if not candidates:
+            return self.browse()
+
+        course = candidates[0]
+        if self.request("POST /enrollments/", "POST", "/enrollments/", expected=201, json={"course_id": course}):
+            self.student.enrolled.append(course)
+            lessons = self.request("GET /courses/{id}/lessons/", "GET", f"/courses/{course}/lessons/")
+            if lessons:
+                self.student.lessons.extend(lesson["id"] for lesson in lessons["data"])
+
+    def complete_lesson(self) -> None:
+        """
+        Open a lesson and complete it.
+        """
+        if not self.student.lessons:
+            return self.browse()
+
+        lesson = self.student.lessons.pop(self.rng.randrange(len(self.student.lessons)))
+        self.request("GET /lessons/{id}/", "GET", f"/lessons/{lesson}/")
+        self.request("POST /lessons/{id}/complete/", "POST", f"/lessons/{lesson}/complete/")
+
+    def submit_quiz(self) -> None:
+        """
+        Open a quiz and submit an answer to every question.
+        """
+        if not self.student.quizzes:
+            return self.browse()
+
+        quiz_id = self.student.quizzes.pop(self.rng.randrange(len(self.student.quizzes)))
+        quiz = self.request("GET /quizzes/{id}/", "GET", f"/quizzes/{quiz_id}/")
+        if quiz:
+            answers = [
+                {"question_id": question["id"], "selected_option": self.rng.choice(question["options"])}
+                for question in quiz["questions"]
+            ]
+            self.request(
+                "POST /quizzes/{id}/submit/", "POST", f"/quizzes/{quiz_id}/submit/", json={"answers": answers}
+            )
+
+    def view_dashboard(self) -> None:
+        """
+        Open the dashboard counters and the enrollments.
+        """
+        for path in ("total-enrolled-courses", "completed-courses", "average-quiz-score"):
+            self.request(f"GET /dashboard/{path}/", "GET", f"/dashboard/{path}/")
+        self.request("GET /enrollments/me/", "GET", "/enrollments/me/")
+
+
+def sign_in(base_url: str, email: str) -> str:
+    """
+    Get an access token of a seeded user.
+    """
+    response = requests.post(
+        f"{base_url}{API_ROOT}/auth/signin/", json={"email": email, "password": PASSWORD}, timeout=30
+    )
+    response.raise_for_status()
+
+    return response.json()["access"]
+
+
+def load_students(seed: int, count: int) -> tuple[list[Student], list[int]]:
+    """
+    Get `count` students of the dataset with their pending lessons and quizzes, and the published courses.
+    """
+    from core.constants import CourseStatus, DailyProcessStatus, UserRole
+    from courses.models import Course, Enrollment
+    from lessons.models import Lesson, LessonProgress
+    from quizzes.models import Quiz, QuizSubmission
+    from users.models import User
+
+    users = User.objects.filter(username__startswith=f"seed{seed}-", role=UserRole.STUDENT.value).order_by("id")
+    students = []
+    for user in users[:count]:
+        enrolled = list(Enrollment.objects.filter(student=user).values_list("course_id", flat=True))
+        completed = LessonProgress.objects.filter(user=user, status=DailyProcessStatus.COMPLETED.value)
+        submitted = QuizSubmission.objects.filter(student=user)
+        lessons = Lesson.objects.filter(course__in=enrolled).exclude(id__in=completed.values("lesson_id"))
+        quizzes = Quiz.objects.filter(course__in=enrolled).exclude(id__in=submitted.values("quiz_id"))
+        students.append(
+            Student(
+                email=user.email,
+                enrolled=enrolled,
+                lessons=[str(lesson_id) for lesson_id in lessons.values_list("id", flat=True)],
+                quizzes=[str(quiz_id) for quiz_id in quizzes.values_list("id", flat=True)],
+            )
+        )
+
+    catalog = list(Course.objects.filter(status=CourseStatus.PUBLISHED.value).values_list("id", flat=True))
+    return students, catalog
+
+
+def run_mix(
+    base_url: str, students: list[Student], catalog: list[int], mix: dict[str, int], duration: float, seed: int
+) -> Recorder:
+    """
+    Run one thread per student for `duration` seconds, each drawing its scenarios from `mix`.
+    """
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+    names, weights = list(mix), list(mix.values())
+
+    def run(index: int, student: Student):
+        client = Client(base_url, student, random.Random(f"{seed}:{index}"))
+        scenarios = {
+            "browse": client.browse,
+            "enroll": lambda: client.enroll(catalog),
+            "lesson": client.complete_lesson,
+            "quiz": client.submit_quiz,
+            "dashboard": client.view_dashboard,
+        }
+        with client.session:
+            while time.perf_counter() < deadline:
+                scenarios[client.rng.choices(names, weights)[0]]()
+        recorder.merge(client.latencies, client.errors)
+
+    threads = [threading.Thread(target=run, args=item) for item in enumerate(students)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return recorder
+
+
+def summarize(result: LoadResult) -> dict:
+    """
+    Get the figures of a result, latencies in milliseconds.
+    """
+    total = result.requests + result.errors
+    return {
+        "requests": result.requests,
+        "errors": result.errors,
+        "error_rate": round(result.errors / total, 4) if total else 0.0,
+        "throughput": round(result.throughput, 2),
+        **{f"p{percent}": round(result.percentile(percent) * 1000, 2) for percent in PERCENTILES},
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Print the run next to the baseline and get the regressions.
+
+    The run regresses when the total throughput drops by more than `tolerance`,
+    when the p95 latency of an endpoint grows by more than `tolerance` or when its
+    error rate grows by more than one point. The throughput of an endpoint depends
+    on the draws of the mix and the p95 of a few requests is noise, so endpoints
+    with less than `MIN_SAMPLES` requests are only checked for errors.
+    """
+    regressions = []
+    print(f"\nCompared to the baseline of {baseline['started_at']} (tolerance {tolerance:.0%})")
+    print(f"{'endpoint':<40} {'p95 (ms)':>20} {'req/s':>20} {'errors':>14}")
+    rows = [("total", report["total"], baseline["total"])]
+    rows += [
+        (label, current, baseline["endpoints"][label])
+        for label, current in report["endpoints"].items()
+        if label in baseline["endpoints"]
+    ]
+    for label, current, previous in rows:
+        problems = []
+        enough_samples = min(current["requests"], previous["requests"]) >= MIN_SAMPLES
+        if enough_samples and current["p95"] > previous["p95"] * (1 + tolerance):
+            problems.append("p95")
+        if label == "total" and current["throughput"] < previous["throughput"] * (1 - tolerance):
+            problems.append("throughput")
+        if current["error_rate"] > previous["error_rate"] + 0.01:
+            problems.append("errors")
+        if problems:
+            regressions.append(f"{label}: {', '.join(problems)}")
+
+        print(
+            f"{label:<40} {previous['p95']:>9.2f} -> {current['p95']:>7.2f} "
+            f"{previous['throughput']:>9.1f} -> {current['throughput']:>7.1f} "
+            f"{previous['error_rate']:>5.1%} -> {current['error_rate']:>5.1%}"
+            f"{'  REGRESSED' if problems else ''}"
+        )
+
+    return regressions
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """
+    Parse a traffic mix, e.g. `browse=50,lesson=20`.
+    """
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX or not weight.isdigit():
+            raise argparse.ArgumentTypeError(
+                f"Invalid mix item {item!r}, expected one of {', '.join(DEFAULT_MIX)}=<weight>."
+            )
+        mix[name] = int(weight)
+    return mix
+
+
+def main():
+    """
+    Run the load test.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of virtual students.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load.")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="Weights of the scenarios.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the `seed_scale` dataset.")
+    parser.add_argument("--url", help="Base URL of a running server, instead of booting gunicorn.")
+    parser.add_argument("--workers", type=int, help="Gunicorn workers, defaults to the config value.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare to the JSON results of a previous run.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed regression, 0.1 for 10%%.")
+    args = parser.parse_args()
+
+    setup_django()
+    students, catalog = load_students(args.seed, args.concurrency)
+    if len(students) < args.concurrency:
+        sys.exit(f"Found {len(students)} students of seed {args.seed}, run `python manage.py seed_scale` first.")
+
+    process = None
+    base_url = args.url
+    if base_url is None:
+        port = get_free_port()
+        command = [sys.executable, "-m", "gunicorn", "-c", "config/gunicorn.py", "config.wsgi"]
+        process = start_server(command, get_server_env(port, args.workers))
+        base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        if process is not None:
+            wait_until_ready(f"{base_url}{API_ROOT}/", process)
+        for student in students:
+            student.token = sign_in(base_url, student.email)
+
+        started_at = datetime.now(UTC)
+        recorder = run_mix(base_url, students, catalog, args.mix, args.duration, args.seed)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+            process.log.close()
+
+    results = [
+        LoadResult(name=label, duration=args.duration, latencies=latencies, errors=recorder.errors.get(label, 0))
+        for label, latencies in sorted(recorder.latencies.items())
+    ]
+    results += [
+        LoadResult(name=label, duration=args.duration, errors=errors)
+        for label, errors in sorted(recorder.errors.items())
+        if label not in recorder.latencies
+    ]
+    total = LoadResult(
+        name="total",
+        duration=args.duration,
+        latencies=[latency for result in results for latency in result.latencies],
+        errors=sum(result.errors for result in results),
+    )
+    title = f"{args.concurrency} students for {args.duration:g}s, mix {args.mix}"
+    print_load_results(title, [*results, total], label="endpoint")
+
+    report = {
+        "started_at": started_at.isoformat(),
+        "config": {"concurrency": args.concurrency, "duration": args.duration, "mix": args.mix, "seed": args.seed},
+        "total": summarize(total),
+        "endpoints": {result.name: summarize(result) for result in results},
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(report, json.load(file), args.tolerance)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Overhead of the API latency metrics.
+
+Measures the cost of one `observe()` call, alone and with threads recording
+concurrently (the per-thread shards vs. a histogram behind a single lock), and the
+cost of a `/courses/` request with the metrics enabled and disabled.
+
+Usage (from the `src` folder):
+
+    python -m benchmarks.bench_metrics [--rows 20] [--threads 8]
+"""
+
+import argparse
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import benchmark_database, measure, print_results, setup_django
+
+
+class LockedHistogram:
+    """
+    Histogram guarded by one lock, the straightforward alternative to the shards.
+    """
+
+    def __init__(self, buckets):
+        """
+        Initialize an empty histogram.
+        """
+        self.buckets = buckets
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def observe(self, labels, value):
+        """
+        Record a value under the lock.
+        """
+        with self.lock:
+            values = self.values.get(labels)
+            if values is None:
+                values = self.values[labels] = [0] * (len(self.buckets) + 2)
+            values[bisect_left(self.buckets, value)] += 1
+            values[-1] += value
+
+
+def observe_concurrently(histogram, threads: int, calls: int) -> None:
+    """
+    Record `calls` values from each of `threads` threads.
+    """
+    labels = ("courses", "list", "total")
+
+    def record(_):
+        for index in range(calls):
+            histogram.observe(labels, index / calls)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(record, range(threads)))
+
+
+def main():
+    """
+    Run the metrics benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20, help="Number of courses listed by the request.")
+    parser.add_argument("--threads", type=int, default=8, help="Number of threads recording concurrently.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import RequestFactory, override_settings
+
+    from core.metrics import BUCKETS, Histogram
+    from core.metrics import histogram as api_histogram
+
+    calls = 10_000
+    sharded, locked = Histogram(), LockedHistogram(BUCKETS)
+    labels = ("courses", "list", "total")
+    results = [
+        measure("observe [sharded]", lambda: sharded.observe(labels, 0.02), number=calls),
+        measure("observe [locked]", lambda: locked.observe(labels, 0.02), number=calls),
+        measure(
+            f"{args.threads} threads x {calls} observe [sharded]",
+            lambda: observe_concurrently(Histogram(), args.threads, calls),
+            number=1,
+        ),
+        measure(
+            f"{args.threads} threads x {calls} observe [locked]",
+            lambda: observe_concurrently(LockedHistogram(BUCKETS), args.threads, calls),
+            number=1,
+        ),
+    ]
+    print_results("Recording", results)
+
+    with benchmark_database():
+        from core.constants import CourseStatus, UserRole
+        from courses.apis import CourseViewSet
+        from courses.models import Category, Course
+        from users.models import User
+
+        instructor = User.objects.create(email="instructor@example.com", role=UserRole.INSTRUCTOR.value)
+        category = Category.objects.create(name="Programming")
+        Course.objects.bulk_create(
+            Course(title=f"Course {i}", instructor=instructor, category=category, status=CourseStatus.PUBLISHED.value)
+            for i in range(args.rows)
+        )
+
+        view = CourseViewSet.as_view({"get": "list"})
+        factory = RequestFactory()
+
+        def list_courses():
+            view(factory.get("/api/v1/courses/", {"limit": args.rows})).render()
+
+        results = []
+        for enabled in (False, True):
+            with override_settings(METRICS_ENABLED=enabled):
+                results.append(measure(f"GET /courses/ [metrics {'on' if enabled else 'off'}]", list_courses))
+        api_histogram.clear()
+
+        print_results(f"List {args.rows} courses", results)
+
+
+if __name__ == "__main__":
+    main()
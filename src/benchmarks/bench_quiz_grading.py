@@ -0,0 +1,116 @@
+"""
+Cost of grading a quiz submission: loading the questions vs. the compiled answer key.
+
+Grades a submission answering every question of a quiz of 10, 100 and 1000
+questions, the way `QuizService.submit_quiz` did before the answer keys (load
+every question), then from a cached answer key and from a cold cache (compile
+the key). The submission insert is left out, only the grading is measured.
+
+Usage (from the `src` folder):
+
+    python -m benchmarks.bench_quiz_grading [--sizes 10 100 1000]
+"""
+
+import argparse
+import uuid
+
+from benchmarks import benchmark_database, measure, print_results, setup_django
+
+
+def grade_with_questions(quiz, answers) -> float:
+    """
+    Grade by loading every question, the previous implementation.
+    """
+    questions = {str(question.id): question for question in quiz.questions.all()}
+    correct = sum(
+        1
+        for answer in answers
+        if (question := questions.get(str(answer["question_id"])))
+        and question.correct_answer == answer["selected_option"]
+    )
+    return round(correct / len(questions) * 100, 2)
+
+
+def grade_with_answer_key(service, quiz, answers) -> float:
+    """
+    Grade from the compiled answer key, as `QuizService.submit_quiz` does.
+    """
+    from quizzes.services import hash_answer
+
+    answer_key = service.get(quiz)
+    correct = sum(
+        1
+        for answer in answers
+        if (entry := answer_key.get(answer["question_id"])) and entry.correct == hash_answer(answer["selected_option"])
+    )
+    return round(correct / len(answer_key) * 100, 2)
+
+
+def count_queries(func) -> int:
+    """
+    Count the queries of one call.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as context:
+        func()
+    return len(context.captured_queries)
+
+
+def main():
+    """
+    Run the quiz grading benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Questions per quiz.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    with benchmark_database():
+        from core.constants import UserRole
+        from courses.models import Category, Course
+        from quizzes.models import Question, Quiz
+        from quizzes.services import AnswerKeyService
+        from users.models import User
+
+        instructor = User.objects.create(email="instructor@example.com", role=UserRole.INSTRUCTOR.value)
+        course = Course.objects.create(title="Course", instructor=instructor, category=Category.objects.create())
+        service = AnswerKeyService()
+
+        for size in args.sizes:
+            quiz = Quiz.objects.create(course=course, title=f"Quiz of {size} questions")
+            questions = Question.objects.bulk_create(
+                Question(
+                    id=uuid.uuid4(),
+                    quiz=quiz,
+                    text=f"Question {index}: " + "which option is the right one? " * 5,
+                    options=[f"Option {letter} of question {index}" for letter in "ABCD"],
+                    correct_answer=f"Option A of question {index}",
+                    position=index,
+                )
+                for index in range(size)
+            )
+            answers = [
+                {"question_id": str(question.id), "selected_option": question.correct_answer} for question in questions
+            ]
+            number = max(1000 // size, 1)
+
+            def cold():
+                quiz.answer_key_version += 1
+                return grade_with_answer_key(service, quiz, answers)
+
+            cases = {
+                "load questions": lambda: grade_with_questions(quiz, answers),
+                "answer key [cold cache]": cold,
+                "answer key [cached]": lambda: grade_with_answer_key(service, quiz, answers),
+            }
+            results = [
+                measure(f"{name} ({count_queries(func)} queries)", func, number=number) for name, func in cases.items()
+            ]
+            print_results(f"Grade a quiz of {size} questions", results, rows=size)
+
+
+if __name__ == "__main__":
+    main()
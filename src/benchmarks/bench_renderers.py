@@ -0,0 +1,115 @@
+"""
+Compare DRF's JSONRenderer with the orjson based renderer.
+
+Usage (from the `src` folder):
+
+    python -m benchmarks.bench_renderers [--rows 1000]
+"""
+
+import argparse
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+from benchmarks import measure, print_results, setup_django
+
+
+def build_course_list(rows: int) -> dict:
+    """
+    Build a paginated `/courses/` payload as returned by CourseSerializer.
+    """
+    created_at = timezone.now().isoformat()
+    return {
+        "data": [
+            {
+                "id": i,
+                "title": f"Course {i}",
+                "description": "Learn the fundamentals step by step. " * 20,
+                "instructor": str(uuid.uuid4()),
+                "category": str(uuid.uuid4()),
+                "created_at": created_at,
+                "status": "Published",
+            }
+            for i in range(rows)
+        ],
+        "pagination": {"limit": rows, "offset": 0, "total": rows * 10},
+    }
+
+
+def build_quiz(rows: int) -> dict:
+    """
+    Build a QuizSerializer payload with nested questions.
+    """
+    return {
+        "id": str(uuid.uuid4()),
+        "title": "Final exam",
+        "questions": [
+            {
+                "id": str(uuid.uuid4()),
+                "text": f"Question {i}: which option is the right one?",
+                "options": ["alpha", "beta", "gamma", "delta"],
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+def build_native_types(rows: int) -> list:
+    """
+    Build rows with native Python values (UUID, Decimal, datetime, timedelta).
+
+    These reach the renderer when views return plain dicts, e.g. quiz submissions
+    or the dashboard recent classes.
+    """
+    now = timezone.now()
+    return [
+        {
+            "submission_id": uuid.uuid4(),
+            "score": Decimal("87.50"),
+            "submitted_at": now,
+            "total_minutes": timedelta(minutes=i),
+        }
+        for i in range(rows)
+    ]
+
+
+def main():
+    """
+    Run the renderer benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000, help="Number of rows per payload.")
+    parser.add_argument("--number", type=int, default=20, help="Number of renders per round.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from core.renderers import ORJSONRenderer
+
+    renderers = {"drf": JSONRenderer(), "orjson": ORJSONRenderer()}
+    payloads = {
+        "course list": build_course_list(args.rows),
+        "quiz with questions": build_quiz(args.rows),
+        "native types": build_native_types(args.rows),
+    }
+
+    results = []
+    for payload_name, payload in payloads.items():
+        for renderer_name, renderer in renderers.items():
+            results.append(
+                measure(
+                    f"{payload_name} [{renderer_name}]",
+                    lambda renderer=renderer, payload=payload: renderer.render(payload, "application/json"),
+                    number=args.number,
+                )
+            )
+
+    print_results(f"Render {args.rows} rows", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Per-row serialization cost of the list endpoints: model serializers vs. values() serializers.
+
+Usage (from the `src` folder):
+
+    python -m benchmarks.bench_serializers [--rows 1000]
+"""
+
+import argparse
+import uuid
+
+from django.utils import timezone
+
+from benchmarks import benchmark_database, measure, print_results, setup_django
+
+
+def seed(rows: int):
+    """
+    Create one course with `rows` lessons and enrollments, plus `rows` courses.
+
+    Returns:
+        tuple: The course and the student used by the endpoints.
+    """
+    from certificates.models import Certificate
+    from core.constants import CourseStatus, UserRole
+    from courses.models import Category, Course, Enrollment
+    from lessons.models import Lesson
+    from users.models import User
+
+    instructor = User.objects.create(
+        username="instructor", email="instructor@example.com", role=UserRole.INSTRUCTOR.value
+    )
+    students = User.objects.bulk_create(
+        User(username=f"student-{i}", email=f"student-{i}@example.com", first_name="Student", last_name=str(i))
+        for i in range(rows)
+    )
+    category = Category.objects.create(name="Programming")
+    courses = Course.objects.bulk_create(
+        Course(
+            title=f"Course {i}",
+            description="Learn the fundamentals step by step. " * 20,
+            instructor=instructor,
+            category=category,
+            status=CourseStatus.PUBLISHED.value,
+        )
+        for i in range(rows)
+    )
+    course = Course.objects.order_by("id").first()
+    Lesson.objects.bulk_create(
+        Lesson(
+            id=uuid.uuid4(),
+            course=course,
+            title=f"Lesson {i}",
+            content="Lesson content. " * 50,
+            video_url="https://example.com/video",
+        )
+        for i in range(rows)
+    )
+    Enrollment.objects.bulk_create(Enrollment(id=uuid.uuid4(), course=course, student=s) for s in students)
+    student = students[0]
+    Enrollment.objects.bulk_create(Enrollment(id=uuid.uuid4(), course=c, student=student) for c in courses[1:])
+    Certificate.objects.bulk_create(
+        Certificate(id=uuid.uuid4(), course=c, student=student, issued_at=timezone.now()) for c in courses
+    )
+    return course, student
+
+
+def main():
+    """
+    Run the serializer benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000, help="Number of rows per endpoint.")
+    parser.add_argument("--number", type=int, default=10, help="Number of calls per round.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from certificates.models import Certificate
+    from certificates.serializers import CertificateSerializer, CertificateValuesSerializer
+    from courses.models import Course, Enrollment
+    from courses.serializers import (
+        CourseSerializer,
+        CourseValuesSerializer,
+        EnrollmentStudentSerializer,
+        EnrollmentStudentValuesSerializer,
+        MyEnrollmentSerializer,
+        MyEnrollmentValuesSerializer,
+    )
+    from lessons.serializers import LessonSerializer, LessonValuesSerializer
+
+    with benchmark_database():
+        course, student = seed(args.rows)
+
+        # (endpoint, queryset, model serializer, values serializer)
+        endpoints = [
+            (
+                "GET /courses/",
+                Course.objects.select_related("instructor", "category"),
+                CourseSerializer,
+                CourseValuesSerializer,
+            ),
+            ("GET /courses/{id}/lessons/", course.lessons.all(), LessonSerializer, LessonValuesSerializer),
+            (
+                "GET /courses/{id}/students/",
+                course.enrollments.select_related("student"),
+                EnrollmentStudentSerializer,
+                EnrollmentStudentValuesSerializer,
+            ),
+            (
+                "GET /enrollments/me/",
+                Enrollment.objects.filter(student=student).select_related("course"),
+                MyEnrollmentSerializer,
+                MyEnrollmentValuesSerializer,
+            ),
+            (
+                "GET /certificates/",
+                Certificate.objects.filter(student=student).select_related("course"),
+                CertificateSerializer,
+                CertificateValuesSerializer,
+            ),
+        ]
+
+        serialize_results = []
+        end_to_end_results = []
+        for name, queryset, model_serializer, values_serializer in endpoints:
+            instances = list(queryset.all())
+            rows = list(values_serializer.project(queryset))
+
+            serialize_results += [
+                measure(
+                    f"{name} [model]", lambda s=model_serializer, i=instances: s(i, many=True).data, number=args.number
+                ),
+                measure(
+                    f"{name} [values]", lambda s=values_serializer, r=rows: s(r, many=True).data, number=args.number
+                ),
+            ]
+            end_to_end_results += [
+                measure(
+                    f"{name} [model]",
+                    lambda s=model_serializer, q=queryset: s(list(q.all()), many=True).data,
+                    number=args.number,
+                ),
+                measure(
+                    f"{name} [values]",
+                    lambda s=values_serializer, q=queryset: s(list(s.project(q)), many=True).data,
+                    number=args.number,
+                ),
+            ]
+
+    print_results(f"Serialization only, {args.rows} rows", serialize_results, rows=args.rows)
+    print_results(f"Query + serialization, {args.rows} rows", end_to_end_results, rows=args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Compare the throughput of `manage.py runserver` with the production gunicorn setup.
+
+Both servers are started on a free port with the same settings and the same URL is
+hit from concurrent clients. The default path, the API root, does not touch the
+database, so the numbers reflect the server and the Django/DRF request cycle.
+
+Usage (from the `src` folder):
+
+    python -m benchmarks.bench_server [--path /api/v1/] [--concurrency 16] [--duration 10]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+from decouple import config
+
+from benchmarks.load import print_load_results, run_load
+
+
+def get_free_port() -> int:
+    """
+    Get a free local TCP port.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get_server_env(port: int, workers: int | None) -> dict[str, str]:
+    """
+    Get the environment of the servers.
+
+    Several gunicorn workers need a shared cache, see `core.cache`: without
+    `CACHE_LOCATION` gunicorn is started with one worker, and asking for more exits.
+    """
+    env = {
+        **os.environ,
+        "DJANGO_ENV": os.environ.get("DJANGO_ENV", "test"),
+        "PORT": str(port),
+        "GUNICORN_ACCESS_LOG": "",
+        "GUNICORN_LOG_LEVEL": "warning",
+    }
+    if workers:
+        env["GUNICORN_WORKERS"] = str(workers)
+
+    if not config("CACHE_LOCATION", default=""):
+        if int(env.get("GUNICORN_WORKERS", 1)) > 1:
+            sys.exit("Several gunicorn workers need a shared cache, set CACHE_LOCATION to the Redis URL.")
+        print("CACHE_LOCATION is not set, starting gunicorn with 1 worker.", file=sys.stderr)
+        env["GUNICORN_WORKERS"] = "1"
+
+    return env
+
+
+def start_server(command: list[str], env: dict[str, str]) -> subprocess.Popen:
+    """
+    Start a server, its stderr kept in a temporary file for `wait_until_ready`.
+    """
+    log = tempfile.TemporaryFile(mode="w+")
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=log)
+    process.log = log
+
+    return process
+
+
+def wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    """
+    Wait until the server answers on `url`.
+
+    Raises:
+        RuntimeError: The server exited, with its stderr, or did not answer in time.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            log = getattr(process, "log", None)
+            output = ""
+            if log is not None:
+                log.seek(0)
+                output = log.read().strip()
+            raise RuntimeError(f"Server exited with code {process.returncode}" + (f":\n{output}" if output else ""))
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not answer on {url} in {timeout}s")
+
+
+def get_servers(port: int, workers: str | None) -> dict[str, list[str]]:
+    """
+    Get the commands of the servers to compare.
+    """
+    gunicorn = [sys.executable, "-m", "gunicorn", "-c", "config/gunicorn.py", "config.wsgi"]
+    return {
+        "runserver": [sys.executable, "manage.py", "runserver", "--noreload", f"127.0.0.1:{port}"],
+        f"gunicorn gthread (workers={workers or 'auto'})": gunicorn,
+    }
+
+
+def main():
+    """
+    Run the server benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="/api/v1/", help="Path to request.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of client threads.")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per server.")
+    parser.add_argument("--workers", type=int, help="Gunicorn workers, defaults to the config value.")
+    parser.add_argument("--token", help="JWT access token sent as a Bearer token.")
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else None
+
+    results = []
+    port = get_free_port()
+    env = get_server_env(port, args.workers)
+
+    url = f"http://127.0.0.1:{port}{args.path}"
+    for name, command in get_servers(port, env.get("GUNICORN_WORKERS")).items():
+        process = start_server(command, env)
+        try:
+            wait_until_ready(url, process)
+            results.append(run_load(name, url, args.concurrency, args.duration, headers))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+            process.log.close()
+
+    print_load_results(f"GET {args.path} with {args.concurrency} clients for {args.duration:g}s", results)
+
+
+if __name__ == "__main__":
+    main()
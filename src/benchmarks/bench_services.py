@@ -0,0 +1,312 @@
+"""
+Micro-benchmarks of the hot service methods at several data sizes.
+
+`size` is the number of rows the method works on: questions of the quiz, lessons
+of the course, progress rows of the day, live classes or enrolled students.
+
+Usage (from the repository root):
+
+    DJANGO_ENV=test pytest src/benchmarks/bench_services.py -o addopts="" [-k submit_quiz]
+"""
+
+import logging
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+
+from core.constants import CourseStatus, DailyProcessStatus, UserRole
+
+SIZES = [10, 100, 1000]
+
+pytestmark = pytest.mark.django_db
+
+
+def calls_per_round(size: int) -> int:
+    """
+    Get the number of calls per timing round, fewer for the larger sizes.
+    """
+    return max(1000 // size, 1)
+
+
+def make_users(count: int, role: str = UserRole.STUDENT.value) -> list:
+    """
+    Create `count` users.
+    """
+    from users.models import User
+
+    return User.objects.bulk_create(
+        User(id=uuid.uuid4(), username=f"{role}-{uuid.uuid4()}", email=f"{uuid.uuid4()}@example.com", role=role)
+        for _ in range(count)
+    )
+
+
+def make_courses(count: int, lessons: int = 0) -> list:
+    """
+    Create `count` published courses of one instructor, with `lessons` lessons each.
+    """
+    from courses.models import Category, Course
+    from lessons.models import Lesson
+
+    [instructor] = make_users(1, UserRole.INSTRUCTOR.value)
+    category = Category.objects.create(name="Programming")
+    Course.objects.bulk_create(
+        Course(
+            title=f"Course {index}",
+            description="Course description.",
+            instructor=instructor,
+            category=category,
+            status=CourseStatus.PUBLISHED.value,
+        )
+        for index in range(count)
+    )
+    courses = list(Course.objects.filter(instructor=instructor).order_by("id"))
+    Lesson.objects.bulk_create(
+        Lesson(id=uuid.uuid4(), course=course, title=f"Lesson {index}", duration_minutes=10)
+        for course in courses
+        for index in range(lessons)
+    )
+    return courses
+
+
+def enroll(student, courses: list) -> None:
+    """
+    Enroll `student` in `courses`.
+    """
+    from courses.models import Enrollment
+
+    Enrollment.objects.bulk_create(Enrollment(id=uuid.uuid4(), student=student, course=course) for course in courses)
+
+
+def complete_lessons(student, lessons) -> None:
+    """
+    Record a completed progress row of today per lesson.
+    """
+    from lessons.models import LessonProgress
+
+    LessonProgress.objects.bulk_create(
+        LessonProgress(
+            user=student,
+            lesson=lesson,
+            status=DailyProcessStatus.COMPLETED.value,
+            time_spent=timedelta(minutes=10),
+            date=timezone.localdate(),
+        )
+        for lesson in lessons
+    )
+
+
+def make_live_classes(courses: list, count: int, start=None) -> list:
+    """
+    Create `count` live classes spread over `courses`, one per day from `start`.
+    """
+    from classes.models import LiveClass
+
+    start = start or timezone.now() + timedelta(days=1)
+    return LiveClass.objects.bulk_create(
+        LiveClass(
+            id=uuid.uuid4(),
+            course=courses[index % len(courses)],
+            title=f"Live class {index}",
+            date_time=start + timedelta(days=index),
+            meeting_url="https://meet.example.com/class",
+            created_by=courses[0].instructor,
+        )
+        for index in range(count)
+    )
+
+
+def make_quiz(size: int):
+    """
+    Create a quiz of `size` questions.
+    """
+    from quizzes.models import Question, Quiz
+
+    [course] = make_courses(1)
+    quiz = Quiz.objects.create(course=course, title="Quiz")
+    Question.objects.bulk_create(
+        Question(
+            id=uuid.uuid4(),
+            quiz=quiz,
+            text=f"Question {index}",
+            options=["A", "B", "C"],
+            correct_answer="A",
+            position=index,
+        )
+        for index in range(size)
+    )
+    return quiz
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_submit_quiz(bench, size):
+    """
+    Grade and record a submission answering `size` questions.
+    """
+    from quizzes.services import QuizService
+
+    [student] = make_users(1)
+    quiz = make_quiz(size)
+    answers = [{"question_id": str(question.id), "selected_option": "A"} for question in quiz.questions.all()]
+    service = QuizService()
+
+    bench(lambda: service.submit_quiz(answers, student, quiz), number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_validate_submission_nested_fields(bench, size):
+    """
+    Validate a submission of `size` answers with nested DRF fields, as the submission serializer did.
+    """
+    from rest_framework import serializers
+
+    class NestedSubmissionSerializer(serializers.Serializer):
+        answers = serializers.ListField(child=serializers.DictField(child=serializers.CharField()))
+
+    data = {"answers": [{"question_id": str(uuid.uuid4()), "selected_option": "A"} for _ in range(size)]}
+
+    bench(lambda: NestedSubmissionSerializer(data=data).is_valid(raise_exception=True), number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_validate_submission(bench, size):
+    """
+    Validate a submission answering the `size` questions of a quiz against its answer key.
+    """
+    from quizzes.serializers import QuizSubmissionSerializer
+    from quizzes.services import AnswerKeyService
+
+    quiz = make_quiz(size)
+    answer_key = AnswerKeyService().get(quiz)
+    data = {"answers": [{"question_id": question_id, "selected_option": "A"} for question_id in answer_key]}
+
+    def validate():
+        return QuizSubmissionSerializer(data=data, context={"answer_key": answer_key}).is_valid(raise_exception=True)
+
+    bench(validate, number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_serialize_quiz(bench, size):
+    """
+    Serialize and render a quiz of `size` questions, as the quiz retrieval did per request.
+    """
+    from core.renderers import ORJSONRenderer
+    from quizzes.models import Quiz
+    from quizzes.serializers import QuizSerializer
+
+    quiz = make_quiz(size)
+
+    def serialize():
+        return ORJSONRenderer().render(QuizSerializer(Quiz.objects.get(id=quiz.id)).data)
+
+    bench(serialize, number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_quiz_payload(bench, size):
+    """
+    Get the cached payload of a quiz of `size` questions.
+    """
+    from quizzes.services import QuizPayloadService
+
+    [student] = make_users(1)
+    quiz = make_quiz(size)
+    service = QuizPayloadService()
+
+    bench(lambda: service.get(quiz, student), number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_check_and_mark_course_completion(bench, size):
+    """
+    Check the completion of a course of `size` lessons, all completed.
+    """
+    from courses.services import CourseService
+
+    [student] = make_users(1)
+    [course] = make_courses(1, lessons=size)
+    enroll(student, [course])
+    complete_lessons(student, course.lessons.all())
+    service = CourseService()
+
+    bench(lambda: service.check_and_mark_course_completion(student, course), number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_daily_process_lessons(bench, size):
+    """
+    Summarize `size` progress rows of the day over ten courses.
+    """
+    from lessons.models import Lesson
+    from lessons.services import DailyProcessService
+
+    [student] = make_users(1)
+    courses = make_courses(10, lessons=max(size // 10, 1))
+    enroll(student, courses)
+    complete_lessons(student, Lesson.objects.filter(course__in=courses)[:size])
+    service = DailyProcessService()
+    today = timezone.localdate()
+
+    bench(lambda: list(service.daily_process_lessons(student, today)), number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_recent_classes(bench, size):
+    """
+    Get the recent classes of a student with `size` completed lessons and `size` live classes.
+    """
+    from dashboard.services import DashboardService
+    from lessons.models import Lesson
+
+    [student] = make_users(1)
+    courses = make_courses(10, lessons=max(size // 10, 1))
+    enroll(student, courses)
+    complete_lessons(student, Lesson.objects.filter(course__in=courses)[:size])
+    make_live_classes(courses, size)
+    service = DashboardService()
+
+    bench(lambda: service.get_recent_classes(student), number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_upcoming_classes(bench, size):
+    """
+    List the `size` upcoming live classes of a student enrolled in ten courses.
+    """
+    from classes.services import LiveClassService
+
+    [student] = make_users(1)
+    courses = make_courses(10)
+    enroll(student, courses)
+    make_live_classes(courses, size)
+    make_live_classes(courses, size, start=timezone.now() - timedelta(days=size + 1))
+    service = LiveClassService()
+
+    bench(lambda: list(service.get_upcoming_classes(student)), number=calls_per_round(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_send_class_reminder_email(bench, size):
+    """
+    Send the reminders of a live class to `size` enrolled students.
+    """
+    from classes.tasks import send_class_reminder_email
+
+    [course] = make_courses(1)
+    for student in make_users(size):
+        enroll(student, [course])
+    [live_class] = make_live_classes([course], 1)
+
+    def send():
+        send_class_reminder_email(live_class.id)
+        mail.outbox.clear()
+
+    # One log line per email would flood the output.
+    logging.disable(logging.INFO)
+    try:
+        bench(send, number=calls_per_round(size))
+    finally:
+        logging.disable(logging.NOTSET)
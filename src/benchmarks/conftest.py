@@ -0,0 +1,59 @@
+"""
+Pytest fixtures of the micro-benchmarks.
+
+The micro-benchmarks are pytest modules named `bench_*.py`, so the test run does
+not collect them. Run them explicitly from the repository root, offline on SQLite:
+
+    DJANGO_ENV=test pytest src/benchmarks/bench_services.py -o addopts=""
+
+`-o addopts=""` drops the `--trace` of pytest.ini. A summary of every benchmark
+(ops/sec, queries per call, peak memory) is printed at the end of the session.
+"""
+
+from typing import Callable
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from benchmarks import BenchmarkResult, measure
+
+results: list[tuple[BenchmarkResult, int]] = []
+
+
+@pytest.fixture
+def bench(request) -> Callable:
+    """
+    Measure a callable under the name of the test, e.g. `test_submit_quiz[100]`.
+
+    The fixture returns `run(func, number=100, repeat=5)`, which counts the queries
+    of one call, then measures `func` with `benchmarks.measure` and returns the
+    result and the query count.
+    """
+
+    def run(func: Callable, number: int = 100, repeat: int = 5) -> tuple[BenchmarkResult, int]:
+        with CaptureQueriesContext(connection) as context:
+            func()
+        result = measure(request.node.name, func, repeat=repeat, number=number)
+        results.append((result, len(context.captured_queries)))
+        return result, len(context.captured_queries)
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Print the results of the benchmarks which ran.
+    """
+    if not results:
+        return
+
+    terminalreporter.section("micro-benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<56} {'ops/sec':>10} {'best (ms)':>10} {'median (ms)':>12} {'queries':>8} {'peak (KiB)':>11}"
+    )
+    for result, queries in results:
+        terminalreporter.write_line(
+            f"{result.name:<56} {result.ops_per_sec:>10.1f} {result.best * 1000:>10.3f} "
+            f"{result.median * 1000:>12.3f} {queries:>8} {result.peak_memory / 1024:>11.1f}"
+        )
@@ -0,0 +1,122 @@
+"""
+Minimal HTTP load generator used by the server benchmarks.
+
+Each client thread keeps its own keep-alive session and sends requests back to back
+for the given duration.
+"""
+
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+
+import requests
+
+
+@dataclass
+class LoadResult:
+    """
+    Latencies and errors collected during a load run.
+    """
+
+    name: str
+    duration: float
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        """
+        Number of completed requests.
+        """
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Completed requests per second.
+        """
+        return self.requests / self.duration if self.duration else 0.0
+
+    def percentile(self, percent: int) -> float:
+        """
+        Get a latency percentile in seconds.
+
+        Args:
+            percent (int): Percentile between 1 and 99.
+
+        Returns:
+            float: The latency, 0 when there is no request.
+        """
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[percent - 1]
+
+
+def run_load(name: str, url: str, concurrency: int = 16, duration: float = 10.0, headers: dict = None) -> LoadResult:
+    """
+    Send GET requests to `url` from `concurrency` threads for `duration` seconds.
+
+    Args:
+        name (str): Label of the run.
+        url (str): URL to request.
+        concurrency (int): Number of client threads. Defaults to 16.
+        duration (float): Run time in seconds. Defaults to 10.
+        headers (dict, optional): Extra request headers.
+
+    Returns:
+        LoadResult: The collected latencies and the number of failed requests.
+    """
+    result = LoadResult(name=name, duration=duration)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        latencies, errors = [], 0
+        with requests.Session() as session:
+            session.headers.update(headers or {})
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = session.get(url, timeout=30)
+                except requests.RequestException:
+                    errors += 1
+                    continue
+                if response.status_code >= 500:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        with lock:
+            result.latencies.extend(latencies)
+            result.errors += errors
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return result
+
+
+def print_load_results(title: str, results: list[LoadResult], label: str = "server") -> None:
+    """
+    Print load results as a table.
+
+    Args:
+        title (str): Title of the table.
+        results (list[LoadResult]): Results to print.
+        label (str): Header of the name column. Defaults to "server".
+    """
+    width = max([32, *(len(result.name) + 1 for result in results)])
+    print(f"\n{title}")
+    print(
+        f"{label:<{width}} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<{width}} {result.requests:>9} {result.errors:>7} {result.throughput:>9.1f} "
+            f"{result.percentile(50) * 1000:>9.2f} {result.percentile(95) * 1000:>9.2f} "
+            f"{result.percentile(99) * 1000:>9.2f}"
+        )
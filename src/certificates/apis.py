@@ -10,11 +10,11 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from certificates.models import Certificate
-from certificates.serializers import CertificateSerializer
+from certificates.serializers import CertificateSerializer, CertificateValuesSerializer
 from certificates.services import CertificateService
 from core.apis import BaseAPIViewSet
 from core.exception import CertificateException
-from core.schema import base_responses
+from core.schema import base_responses, build_sparse_fieldset_parameters
 from courses.services import EnrollmentService
 
 
@@ -34,13 +34,19 @@ class CertificateViewSet(BaseAPIViewSet):
         self.enrollment_service = EnrollmentService()
         self.certificate_service = CertificateService()
 
-    @extend_schema(responses={**base_responses, 200: CertificateSerializer(many=True)})
+    @extend_schema(
+        parameters=build_sparse_fieldset_parameters(CertificateValuesSerializer),
+        responses={**base_responses, 200: CertificateValuesSerializer(many=True)},
+    )
     def list(self, request: Request, *args, **kwargs) -> Response:
         """
         Get all certificates for the authenticated student.
         """
-        certificates = Certificate.objects.filter(student=request.user).select_related("course")
-        serializer = CertificateSerializer(certificates, many=True)
+        certificates = Certificate.objects.filter(student=request.user)
+        sparse = self.get_sparse_fieldset(CertificateValuesSerializer)
+        serializer = CertificateValuesSerializer(
+            CertificateValuesSerializer.project(certificates, **sparse), many=True, **sparse
+        )
         return self.response_ok(serializer.data)
 
     @extend_schema(responses={**base_responses, 200: CertificateSerializer})
@@ -5,6 +5,7 @@ Certificate serializers.
 from rest_framework import serializers
 
 from certificates.models import Certificate
+from core.serializers import ValuesSerializer
 
 
 class CertificateSerializer(serializers.ModelSerializer):
@@ -21,3 +22,13 @@ class CertificateSerializer(serializers.ModelSerializer):
 
         model = Certificate
         fields = ["id", "course_title", "issued_at"]
+
+
+class CertificateValuesSerializer(ValuesSerializer):
+    """
+    Read-only certificate serializer for list endpoints, same output as CertificateSerializer.
+    """
+
+    id = serializers.UUIDField()
+    course_title = serializers.CharField(source="course.title")
+    issued_at = serializers.DateTimeField()
@@ -11,11 +11,11 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from classes.models import LiveClass
-from classes.serializers import LiveClassRequestSerializer, LiveClassSerializer
+from classes.serializers import LiveClassRequestSerializer, LiveClassSerializer, LiveClassValuesSerializer
 from classes.services import LiveClassService
 from classes.tasks import send_class_reminder_email
 from core.apis import BaseAPIViewSet
-from core.schema import base_responses
+from core.schema import base_responses, build_sparse_fieldset_parameters
 from courses.permissions import IsEntityCourseOwner
 
 
@@ -54,7 +54,10 @@ class LiveClassViewSet(BaseAPIViewSet):
         instance = serializer.save()
         return self.response_created(data=LiveClassSerializer(instance).data)
 
-    @extend_schema(responses={200: LiveClassSerializer(many=True)})
+    @extend_schema(
+        parameters=build_sparse_fieldset_parameters(LiveClassValuesSerializer),
+        responses={200: LiveClassValuesSerializer(many=True)},
+    )
     @action(detail=False, methods=["get"], url_path="upcoming")
     def upcoming(self, request: Request, *args, **kwargs) -> Response:
         """
@@ -63,8 +66,12 @@ class LiveClassViewSet(BaseAPIViewSet):
         user = request.user
 
         queryset = self.live_class_service.get_upcoming_classes(user)
+        sparse = self.get_sparse_fieldset(LiveClassValuesSerializer)
+        serializer = LiveClassValuesSerializer(
+            LiveClassValuesSerializer.project(queryset, **sparse), many=True, **sparse
+        )
 
-        return self.response_ok(data=LiveClassSerializer(queryset, many=True).data)
+        return self.response_ok(data=serializer.data)
 
     @action(detail=True, methods=["post"], url_path="send-reminder", permission_classes=[IsEntityCourseOwner])
     def send_reminder(self, request: Request, *args, **kwargs) -> Response:
@@ -6,6 +6,7 @@ from django.utils import timezone
 from rest_framework import serializers
 
 from classes.models import LiveClass
+from core.serializers import ValuesSerializer
 from courses.models import Course
 
 
@@ -54,3 +55,29 @@ class LiveClassSerializer(serializers.ModelSerializer):
 
         model = LiveClass
         fields = ["id", "course_id", "title", "date_time", "meeting_url", "created_by", "created_at", "updated_at"]
+
+
+class LiveClassCourseValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for the course of a live class, used on `?expand=course`.
+    """
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+
+
+class LiveClassValuesSerializer(ValuesSerializer):
+    """
+    Read-only live class serializer for list endpoints, same output as LiveClassSerializer.
+    """
+
+    expandable_fields = {"course": LiveClassCourseValuesSerializer()}
+
+    id = serializers.UUIDField()
+    course_id = serializers.IntegerField()
+    title = serializers.CharField()
+    date_time = serializers.DateTimeField()
+    meeting_url = serializers.URLField()
+    created_by = serializers.UUIDField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
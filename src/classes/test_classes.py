@@ -103,6 +103,23 @@ class LiveClassAPITestCase(BaseAPITestCase):
         assert response.status_code == 200
         assert len(response.data) == 1
 
+    def test_upcoming_classes_sparse_fieldset(self):
+        """
+        Test `?fields=` and `?expand=` on the upcoming classes.
+        """
+        LiveClassFactory(
+            course=self.course, title="Upcoming Class", date_time=self.future_time, created_by=self.instructor
+        )
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        response = self.get_json_ok(fragment="upcoming/?fields=title&expand=course")
+        assert response.data == [
+            {"title": "Upcoming Class", "course": {"id": self.course.id, "title": self.course.title}}
+        ]
+
+        self.get_json_bad_request(fragment="upcoming/?fields=secret")
+
     def test_upcoming_empty_for_unenrolled_student(self):
         """
         Test that an unenrolled student sees no upcoming classes.
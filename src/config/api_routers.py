@@ -2,34 +2,34 @@
 Configures the API routers for the Django application.
 """
 
-from importlib import import_module
-
 from django.conf import settings
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
-from rest_framework.routers import DefaultRouter
+from django.utils.functional import lazy
 
-urlpatterns = []
-api_routers = DefaultRouter()
+from core.openapi import get_schema_url
+from core.routers import LazyRouter, lazy_view
 
-for api_app in getattr(settings, "API_APPS", []):
-    api_module = import_module(f"{api_app}.apis", "apps")
+urlpatterns = []
+api_routers = LazyRouter()
 
-    for viewset in api_module.apps:
-        api_routers.register(viewset.resource_name, viewset, viewset.resource_name)
+for prefix, viewset in getattr(settings, "API_ROUTES", []):
+    api_routers.register(prefix, viewset, prefix)
 
 
 if not settings.IS_PROD:
+    # The docs UIs load the precomputed schema through its versioned URL
+    schema_url = lazy(get_schema_url, str)()
+
     urlpatterns = [
-        path("docs/schema/", SpectacularAPIView.as_view(), name="schema"),
+        path("docs/schema/", lazy_view("core.views.OpenAPISchemaView"), name="schema"),
         # Swagger UI for API documentation
         path(
             "docs/swagger/",
-            SpectacularSwaggerView.as_view(url_name="schema"),
+            lazy_view("drf_spectacular.views.SpectacularSwaggerView", url=schema_url),
             name="swagger-ui",
         ),
         # Redoc UI for API documentation
-        path("docs/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+        path("docs/redoc/", lazy_view("drf_spectacular.views.SpectacularRedocView", url=schema_url), name="redoc"),
     ]
 
 urlpatterns += [
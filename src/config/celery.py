@@ -5,6 +5,7 @@ Setup for Celery with Redis as the broker and result backend.
 import os
 
 from celery import Celery
+from celery.signals import worker_init
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
@@ -20,3 +21,13 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def check_cache(**kwargs):
+    """
+    Refuse to start a worker on a process local cache, the tasks fill the cache the API reads.
+    """
+    from core.cache import require_shared_cache
+
+    require_shared_cache("a Celery worker besides the API")
@@ -0,0 +1,98 @@
+"""
+Gunicorn configuration for production.
+
+Usage (from the `src` folder):
+
+    gunicorn -c config/gunicorn.py config.wsgi
+
+Every setting can be overridden with the matching GUNICORN_* environment variable.
+"""
+
+import os
+
+from decouple import config as env
+
+
+def get_cpu_count() -> int:
+    """
+    Get the number of CPUs available to this process.
+
+    Containers limited by cpuset (ECS, Docker `--cpuset-cpus`) report the host CPUs
+    with `os.cpu_count()`, the scheduler affinity reflects the real limit.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+cpu_count = get_cpu_count()
+
+# Server socket
+bind = f"0.0.0.0:{env('PORT', default=8000, cast=int)}"
+backlog = env("GUNICORN_BACKLOG", default=2048, cast=int)
+
+# Worker processes
+# The API is IO bound (database, cache), threaded workers keep a few requests in
+# flight per process while the process count follows the usual (2 x CPU) + 1 rule.
+worker_class = env("GUNICORN_WORKER_CLASS", default="gthread")
+workers = env("GUNICORN_WORKERS", default=cpu_count * 2 + 1, cast=int)
+threads = env("GUNICORN_THREADS", default=4, cast=int)
+worker_connections = env("GUNICORN_WORKER_CONNECTIONS", default=1000, cast=int)
+timeout = env("GUNICORN_TIMEOUT", default=30, cast=int)
+graceful_timeout = env("GUNICORN_GRACEFUL_TIMEOUT", default=30, cast=int)
+keepalive = env("GUNICORN_KEEPALIVE", default=5, cast=int)
+
+# Recycle workers to bound memory growth, the jitter avoids restarting all of
+# them at the same time.
+max_requests = env("GUNICORN_MAX_REQUESTS", default=1000, cast=int)
+max_requests_jitter = env("GUNICORN_MAX_REQUESTS_JITTER", default=100, cast=int)
+
+# Load Django once in the master so workers fork with the app already imported.
+preload_app = env("GUNICORN_PRELOAD_APP", default=True, cast=bool)
+
+# Heartbeat files on tmpfs, /tmp can be a slow overlay filesystem in containers.
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Logging
+accesslog = env("GUNICORN_ACCESS_LOG", default="-") or None  # empty value disables it
+errorlog = "-"
+loglevel = env("GUNICORN_LOG_LEVEL", default="info")
+
+
+def on_starting(server):
+    """
+    Refuse to start several workers on a process local cache.
+
+    The workers share the answer keys, attempt buffers, metrics and replica pins
+    through the cache, see `core.cache`.
+    """
+    if server.cfg.workers > 1:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+        from core.cache import require_shared_cache
+
+        require_shared_cache(f"{server.cfg.workers} gunicorn workers")
+
+
+def post_fork(server, worker):
+    """
+    Drop the database connections inherited from the master process.
+
+    With `preload_app` the master may have opened connections while loading the
+    app, and a socket must not be shared between processes.
+    """
+    from django.db import connections
+
+    connections.close_all()
+
+
+def worker_exit(server, worker):
+    """
+    Keep the API metrics of the worker when it is recycled.
+    """
+    from django.conf import settings
+
+    if settings.METRICS_ENABLED:
+        from core.metrics import archive
+
+        archive()
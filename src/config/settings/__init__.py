@@ -5,7 +5,6 @@ available_environments = ("local", "test", "dev", "stag", "prod")
 
 # Managing environment via DJANGO_ENV variable:
 environment = config("DJANGO_ENV", default="local")
-print(f"Using environment: {environment}")
 
 include(
     "components/common.py",
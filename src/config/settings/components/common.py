@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     "drf_spectacular",
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
+    "core",
 ]
 
 
@@ -50,18 +51,37 @@ API_APPS = [
     "classes",
     "dashboard",
     "certificates",
+    "batch",
 ]
 
 INSTALLED_APPS += API_APPS
 
+# API routes, `(prefix, viewset)`. The viewset modules are imported on the first
+# request to their prefix, see `core.routers.LazyRouter`.
+API_ROUTES = [
+    ("users", "users.apis.UserViewSet"),
+    ("auth", "users.apis.AuthenticationViewSet"),
+    ("courses", "courses.apis.CourseViewSet"),
+    ("enrollments", "courses.apis.EnrollmentViewSet"),
+    ("lessons", "lessons.apis.LessonViewSet"),
+    ("daily-progress", "lessons.apis.DailyProgressViewSet"),
+    ("quizzes", "quizzes.apis.QuizViewSet"),
+    ("classes", "classes.apis.LiveClassViewSet"),
+    ("dashboard", "dashboard.apis.DashboardViewSet"),
+    ("certificates", "certificates.apis.CertificateViewSet"),
+    ("batch", "batch.apis.BatchViewSet"),
+]
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.ProfilerMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.IdentityMapMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -87,9 +107,56 @@ DJANGO_ENV: str = config("DJANGO_ENV", default="dev")
 IS_PROD: bool = DJANGO_ENV == "prod"
 DOMAIN: str = config("DOMAIN", default="http://localhost:8000")
 
+# API latency metrics, see core.metrics
+METRICS_ENABLED: bool = config("METRICS_ENABLED", default=True, cast=bool)
+METRICS_FLUSH_SECONDS: int = config("METRICS_FLUSH_SECONDS", default=10, cast=int)
+METRICS_TOKEN: str = config("METRICS_TOKEN", default="")
+
+# Sampling request profiler, see core.profiling
+PROFILER_SAMPLE_RATE: float = config("PROFILER_SAMPLE_RATE", default=0.0, cast=float)
+PROFILER_TOKEN: str = config("PROFILER_TOKEN", default="")
+PROFILER_INTERVAL: float = config("PROFILER_INTERVAL", default=0.005, cast=float)
+PROFILER_MAX_PROFILES: int = config("PROFILER_MAX_PROFILES", default=100, cast=int)
+PROFILER_RETENTION_SECONDS: int = config("PROFILER_RETENTION_SECONDS", default=24 * 60 * 60, cast=int)
+
+# Compiled quiz answer keys, see quizzes.services.AnswerKeyService
+QUIZ_ANSWER_KEY_TIMEOUT: int = config("QUIZ_ANSWER_KEY_TIMEOUT", default=24 * 60 * 60, cast=int)
+
+# Quiz item analysis reports, see quizzes.services.ItemAnalysisService
+QUIZ_ITEM_ANALYSIS_REFRESH_DELAY: int = config("QUIZ_ITEM_ANALYSIS_REFRESH_DELAY", default=5 * 60, cast=int)
+
+# Bulk question import, see quizzes.serializers.QuestionImportSerializer
+QUIZ_IMPORT_MAX_QUESTIONS: int = config("QUIZ_IMPORT_MAX_QUESTIONS", default=1000, cast=int)
+QUIZ_IMPORT_BATCH_SIZE: int = config("QUIZ_IMPORT_BATCH_SIZE", default=500, cast=int)
+
+# Timed quiz attempts, see quizzes.services.QuizAttemptService
+QUIZ_ATTEMPT_FLUSH_INTERVAL: int = config("QUIZ_ATTEMPT_FLUSH_INTERVAL", default=30, cast=int)
+QUIZ_ATTEMPT_GRACE_SECONDS: int = config("QUIZ_ATTEMPT_GRACE_SECONDS", default=10, cast=int)
+QUIZ_ATTEMPT_BUFFER_TIMEOUT: int = config("QUIZ_ATTEMPT_BUFFER_TIMEOUT", default=24 * 60 * 60, cast=int)
+
+# Exam mode submission queue, see quizzes.services.SubmissionQueueService
+QUIZ_EXAM_BATCH_SIZE: int = config("QUIZ_EXAM_BATCH_SIZE", default=500, cast=int)
+QUIZ_EXAM_BATCH_DELAY: int = config("QUIZ_EXAM_BATCH_DELAY", default=2, cast=int)
+
+# Quiz score distributions, see quizzes.services.ScoreDistributionService
+QUIZ_SCORE_DISTRIBUTION_CHECK_DELAY: int = config("QUIZ_SCORE_DISTRIBUTION_CHECK_DELAY", default=60 * 60, cast=int)
+
+# Batch requests, see batch.services.BatchService
+BATCH_MAX_REQUESTS: int = config("BATCH_MAX_REQUESTS", default=20, cast=int)
+BATCH_MAX_WORKERS: int = config("BATCH_MAX_WORKERS", default=4, cast=int)
+
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": ["rest_framework_simplejwt.authentication.JWTAuthentication"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
@@ -104,6 +171,11 @@ SPECTACULAR_SETTINGS = {
     "GENERATION": {"operation_id_generator_class": "drf_spectacular.generators.OperationIdGenerator"},
 }
 
+# Precomputed OpenAPI schema, regenerate it with `python manage.py build_schema`
+OPENAPI_SCHEMA_FILE = BASE_DIR / "openapi" / "schema.json"
+# Serve the precomputed schema instead of generating it on each request
+OPENAPI_SCHEMA_STATIC: bool = config("OPENAPI_SCHEMA_STATIC", default=True, cast=bool)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -148,6 +220,20 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache
+# Shared between processes when CACHE_LOCATION points to a Redis server, e.g.
+# redis://localhost:6379/1, otherwise each process keeps its own memory cache, which
+# is only right for a single process: gunicorn with several workers, a Celery worker
+# and the read replicas refuse to start without it, see core.cache.
+CACHE_LOCATION: str = config("CACHE_LOCATION", default="")
+CACHES = {
+    "default": (
+        {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": CACHE_LOCATION}
+        if CACHE_LOCATION
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
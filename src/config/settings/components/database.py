@@ -2,7 +2,10 @@
 Database setting.
 """
 
-from decouple import config
+from decouple import Csv, config
+from django.core.exceptions import ImproperlyConfigured
+
+from config.settings.components.common import CACHE_LOCATION
 
 DATABASE_HOST: str = config("DATABASE_HOST", default="localhost")
 DATABASE_NAME: str = config("DATABASE_NAME")
@@ -14,6 +17,44 @@ DATABASE_ENGINE: str = config("DATABASE_ENGINE", default="django.db.backends.pos
 DATABASE_MIGRATE: str = config("DATABASE_MIGRATE", default="true")
 DATABASE_PORT: int = config("DATABASE_PORT", default=5432, cast=int)
 
+# Connection reuse
+# With the pool enabled, each process keeps a psycopg pool and "closing" a connection
+# at the end of a request returns it to the pool. Without it, connections persist for
+# DATABASE_CONN_MAX_AGE seconds (0 opens a new connection per request).
+DATABASE_POOL: bool = config("DATABASE_POOL", default=True, cast=bool)
+DATABASE_POOL_MIN_SIZE: int = config("DATABASE_POOL_MIN_SIZE", default=2, cast=int)
+DATABASE_POOL_MAX_SIZE: int = config("DATABASE_POOL_MAX_SIZE", default=8, cast=int)
+DATABASE_POOL_TIMEOUT: float = config("DATABASE_POOL_TIMEOUT", default=10, cast=float)
+DATABASE_POOL_MAX_IDLE: float = config("DATABASE_POOL_MAX_IDLE", default=300, cast=float)
+DATABASE_POOL_MAX_LIFETIME: float = config("DATABASE_POOL_MAX_LIFETIME", default=3600, cast=float)
+DATABASE_CONN_MAX_AGE: int = config("DATABASE_CONN_MAX_AGE", default=60, cast=int)
+
+
+def check_pool_connection(connection) -> None:
+    """
+    Health check run by the pool before handing out a connection.
+
+    psycopg_pool is imported here rather than at settings load, so processes which
+    never connect to Postgres (tests, management commands on SQLite) skip it.
+    """
+    from psycopg_pool import ConnectionPool
+
+    ConnectionPool.check_connection(connection)
+
+
+DATABASE_OPTIONS: dict = {}
+if DATABASE_POOL and DATABASE_ENGINE == "django.db.backends.postgresql":
+    DATABASE_OPTIONS["pool"] = {
+        "min_size": DATABASE_POOL_MIN_SIZE,
+        "max_size": DATABASE_POOL_MAX_SIZE,
+        "timeout": DATABASE_POOL_TIMEOUT,
+        "max_idle": DATABASE_POOL_MAX_IDLE,
+        "max_lifetime": DATABASE_POOL_MAX_LIFETIME,
+        "check": check_pool_connection,
+    }
+    # Django refuses persistent connections on top of a pool
+    DATABASE_CONN_MAX_AGE = 0
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 DATABASES = {
@@ -24,5 +65,26 @@ DATABASES = {
         "PASSWORD": DATABASE_PASSWORD,
         "HOST": DATABASE_HOST,
         "PORT": DATABASE_PORT,
+        "CONN_MAX_AGE": DATABASE_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": DATABASE_OPTIONS,
     }
 }
+
+# Read replicas
+# Comma separated hosts, each one becomes a `replica_<n>` database with the same
+# credentials as the primary. Read-only API actions are routed to them, see
+# `core.db_routers.ReplicaRouter`.
+DATABASE_REPLICA_HOSTS: list[str] = config("DATABASE_REPLICA_HOSTS", default="", cast=Csv())
+# Seconds during which a user reads from the primary after one of their writes
+DATABASE_REPLICA_PIN_SECONDS: int = config("DATABASE_REPLICA_PIN_SECONDS", default=10, cast=int)
+
+# The pins are kept in the cache, a process local cache loses them on the next worker.
+if DATABASE_REPLICA_HOSTS and not CACHE_LOCATION:
+    raise ImproperlyConfigured("DATABASE_REPLICA_HOSTS requires a shared cache, set CACHE_LOCATION.")
+
+for index, replica_host in enumerate(DATABASE_REPLICA_HOSTS, start=1):
+    DATABASES[f"replica_{index}"] = {**DATABASES["default"], "HOST": replica_host}
+
+DATABASE_READ_REPLICAS: list[str] = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["core.db_routers.ReplicaRouter"]
@@ -7,6 +7,9 @@ from config.settings.components.common import INSTALLED_APPS, MIDDLEWARE
 DEBUG = True
 ALLOWED_HOSTS = ["*"]
 
+# Generate the OpenAPI schema on each request so the docs follow code changes
+OPENAPI_SCHEMA_STATIC = False
+
 # For debug toolbar
 INSTALLED_APPS += [
     "debug_toolbar",
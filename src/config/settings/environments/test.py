@@ -11,8 +11,15 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
-    }
+    },
+    # Stands in for a read replica, tests opt in to the routing with
+    # `override_settings(DATABASE_READ_REPLICAS=["replica"])`.
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(BASE_DIR, "db_replica.sqlite3"),
+    },
 }
+DATABASE_READ_REPLICAS = []
 
 DEBUG = True
 CELERY_TASK_ALWAYS_EAGER = True
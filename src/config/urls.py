@@ -21,9 +21,12 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from core.routers import lazy_view
+
 urlpatterns = [
     path("api/v1/", include("config.api_routers")),
     path("admin/", admin.site.urls),
+    path("metrics", lazy_view("core.views.MetricsView"), name="metrics"),
 ]
 
 # Enable debug toolbar on local
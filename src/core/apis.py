@@ -4,8 +4,15 @@ Base API ViewSet.
 
 from django.conf import settings
 from rest_framework import status, viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
 from rest_framework.response import Response
 
+from core.db_routers import is_pinned_to_primary, pin_to_primary, replica_reads
+from core.exception import BaseErrorMessage
+from core.metrics import RequestTimer
+
 
 class BaseAPIViewSet(viewsets.GenericViewSet):
     """
@@ -14,6 +21,55 @@ class BaseAPIViewSet(viewsets.GenericViewSet):
 
     resource_name = ""
 
+    # Actions whose reads may be served by a read replica.
+    replica_actions: tuple[str, ...] = ("list", "retrieve")
+
+    # Whether a successful write pins the user to the primary.
+    pin_writes = True
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Record the latency of the request, see `core.metrics`.
+        """
+        if not settings.METRICS_ENABLED:
+            return super().dispatch(request, *args, **kwargs)
+
+        timer = RequestTimer(self.resource_name or type(self).__name__)
+        with timer.time_view():
+            response = super().dispatch(request, *args, **kwargs)
+
+        timer.record(self.action or request.method.lower(), response)
+        return response
+
+    def initial(self, request: Request, *args, **kwargs):
+        """
+        Allow replica reads for the read-only actions, unless the user wrote recently.
+        """
+        super().initial(request, *args, **kwargs)
+
+        user = request.user
+        replica_reads.set(
+            request.method in SAFE_METHODS
+            and self.action in self.replica_actions
+            and not (user.is_authenticated and is_pinned_to_primary(user))
+        )
+
+    def finalize_response(self, request: Request, response: Response, *args, **kwargs) -> Response:
+        """
+        Pin the user to the primary after a successful write.
+        """
+        replica_reads.set(False)
+
+        if (
+            self.pin_writes
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and request.user.is_authenticated
+        ):
+            pin_to_primary(request.user)
+
+        return super().finalize_response(request, response, *args, **kwargs)
+
     def get_queryset(self):
         """
         Returns the queryset for the viewset.
@@ -26,6 +82,41 @@ class BaseAPIViewSet(viewsets.GenericViewSet):
         """
         return self.serializer_class
 
+    def get_sparse_fieldset(self, serializer_class) -> dict:
+        """
+        Parse `?fields=` and `?expand=` into the keyword arguments of a `ValuesSerializer`.
+
+        The same arguments are passed to `project()`, so the query only selects the
+        requested columns, and to the serializer rendering the rows.
+
+        Example:
+            sparse = self.get_sparse_fieldset(CourseValuesSerializer)
+            page = self.paginate_queryset(CourseValuesSerializer.project(queryset, **sparse))
+            serializer = CourseValuesSerializer(page, many=True, **sparse)
+
+        Raises:
+            ValidationError: If a field or relation is unknown.
+        """
+        params = self.request.query_params
+        sparse = {}
+
+        expand = {name for name in params.get("expand", "").split(",") if name}
+        unknown = expand - set(serializer_class.expandable_fields)
+        if unknown:
+            raise ValidationError({"expand": BaseErrorMessage.INVALID_EXPAND.format(", ".join(sorted(unknown)))})
+        if expand:
+            sparse["expand"] = expand
+
+        fields = {name for name in params.get("fields", "").split(",") if name}
+        if fields:
+            unknown = fields - set(serializer_class().fields) - set(serializer_class.expandable_fields)
+            if unknown:
+                raise ValidationError({"fields": BaseErrorMessage.INVALID_FIELDS.format(", ".join(sorted(unknown)))})
+            # An expanded relation is part of the output even if not listed.
+            sparse["fields"] = fields | expand
+
+        return sparse
+
     def response_ok(self, data: dict = None) -> Response:
         """
         Return default response ok. Status code is 200.
@@ -0,0 +1,40 @@
+"""
+Checks of the cache configuration.
+
+The timed attempt buffers, the debounce claims of the background jobs, profiles,
+metrics and replica pins live in the `default` cache. Without
+`CACHE_LOCATION` it is a memory cache of each process, which is only right for
+a single process: `runserver`, the tests or a Celery worker in eager mode.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def is_shared_cache(alias: str = "default") -> bool:
+    """
+    Check if a cache is shared between processes.
+    """
+    return settings.CACHES[alias]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
+
+
+def require_shared_cache(reason: str) -> None:
+    """
+    Refuse to start several processes on a process local cache.
+
+    Args:
+        reason (str): Why the processes are several, e.g. "4 gunicorn workers".
+
+    Raises:
+        ImproperlyConfigured: If the `default` cache is not shared.
+    """
+    if not is_shared_cache():
+        raise ImproperlyConfigured(
+            f"The default cache is local to each process and there are {reason}: "
+            "set CACHE_LOCATION to the Redis URL, e.g. redis://localhost:6379/1."
+        )
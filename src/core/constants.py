@@ -69,5 +69,16 @@ class DailyProcessStatus(BaseChoiceEnum):
     COMPLETED = "Completed"
 
 
+class SubmissionStatus(BaseChoiceEnum):
+    """
+    Status choices for the queued quiz submissions.
+    """
+
+    QUEUED = "Queued"
+    GRADED = "Graded"
+    REJECTED = "Rejected"
+
+
 MAX_FILE_SIZE = 2 * 1024 * 1024  # 2 MB
 PAGINATION_LIMIT_DEFAULT = 100
+API_ROOT = "/api/v1/"
@@ -0,0 +1,75 @@
+"""
+Database routers.
+"""
+
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Whether reads of the current request may go to a replica, set by BaseAPIViewSet.
+replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+PIN_CACHE_KEY = "db:primary-pin:{user_id}"
+
+
+def pin_to_primary(user) -> None:
+    """
+    Send the reads of `user` to the primary for a short window after a write.
+
+    Replicas lag behind the primary, without the pin a student could complete a
+    lesson and not see it in the next request.
+
+    Args:
+        user (User): The user who wrote.
+    """
+    cache.set(PIN_CACHE_KEY.format(user_id=user.pk), True, settings.DATABASE_REPLICA_PIN_SECONDS)
+
+
+def is_pinned_to_primary(user) -> bool:
+    """
+    Check if `user` wrote recently and must read from the primary.
+
+    Args:
+        user (User): The user of the request.
+
+    Returns:
+        bool: True if the user is pinned to the primary.
+    """
+    return cache.get(PIN_CACHE_KEY.format(user_id=user.pk), False)
+
+
+class ReplicaRouter:
+    """
+    Route the reads of read-only API actions to the replicas.
+
+    Writes and every other read go to the default database. The replica aliases are
+    listed in `DATABASE_READ_REPLICAS`, an empty list disables the routing.
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        """
+        Pick a random replica when the current request allows replica reads.
+        """
+        replicas = settings.DATABASE_READ_REPLICAS
+        if not replicas or not replica_reads.get():
+            return None
+
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints) -> str | None:
+        """
+        Send writes to the default database.
+        """
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        """
+        Allow relations between objects of the primary and its replicas, they hold the same data.
+        """
+        databases = {"default", *settings.DATABASE_READ_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
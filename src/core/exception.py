@@ -16,6 +16,8 @@ class BaseErrorMessage:
     NOT_FOUND = "Not found."
     INVALID_OFFSET = "Invalid 'offset' parameter. Please provide a positive integer."
     INVALID_LIMIT = "Invalid 'limit' parameter. Please provide a positive integer."
+    INVALID_FIELDS = "Invalid 'fields' parameter. Unknown fields: {}."
+    INVALID_EXPAND = "Invalid 'expand' parameter. Unknown relations: {}."
 
 
 class SystemErrorMessage(BaseErrorMessage):
@@ -96,6 +98,9 @@ class QuizErrorMessage(BaseErrorMessage):
     ALREADY_COMPLETED = "Quiz already completed."
     NOT_ENROLLED = "You are not enrolled in this course to access the quiz."
     MISSING_ANSWER = "All questions must be answered."
+    TICKET_NOT_FOUND = "Submission ticket not found."
+    ATTEMPT_NOT_STARTED = "Start the quiz before saving or submitting answers."
+    TIME_EXPIRED = "The time limit of the quiz is over."
 
 
 class LiveClassMessageError(BaseErrorMessage):
@@ -117,6 +122,17 @@ class CertificateErrorMessage(BaseErrorMessage):
     COURSE_INCOMPLETE = "You must complete the course to receive a certificate."
 
 
+class BatchErrorMessage(BaseErrorMessage):
+    """
+    Batch request error message class.
+    """
+
+    NOT_FOUND = "No API endpoint matches this path."
+    NESTED_BATCH = "A batch request cannot contain batch requests."
+    INVALID_PATH = "Path must be an API path, starting with {}."
+    SERVER_ERROR = "The request failed with an unexpected error."
+
+
 class BaseCustomException(Exception):
     """
     The base custom exception class.
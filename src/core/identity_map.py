@@ -0,0 +1,113 @@
+"""
+Request-scoped identity map.
+
+Services look up model instances through the map, so fetching the same course
+or enrollment several times in one request runs a single query. The map
+lives in a context variable: every thread (and every asyncio task) sees its own
+map, and `core.middleware.IdentityMapMiddleware` drops it when the request ends.
+
+Outside of a request (Celery tasks, management commands, shell) no map is active
+and every lookup goes to the database.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable
+
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+_MISSING = object()
+
+
+class IdentityMap:
+    """
+    Loaded instances per model, keyed by lookup.
+
+    A lookup which found nothing is stored as None, so repeated existence checks
+    are memoized too.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty map.
+        """
+        self.entries: dict[type[Model], dict[Hashable, Any]] = {}
+
+    def get_or_load(self, model: type[Model], key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get the entry of `key`, calling `loader` on the first lookup.
+
+        Args:
+            model (type[Model]): Model of the looked up instance.
+            key (Hashable): Lookup key, e.g. the primary key.
+            loader (Callable): Fetch the instance from the database, returns None if not found.
+
+        Returns:
+            Any: The memoized result of `loader`.
+        """
+        entries = self.entries.setdefault(model, {})
+        value = entries.get(key, _MISSING)
+        if value is _MISSING:
+            value = entries[key] = loader()
+
+        return value
+
+    def discard(self, model: type[Model]) -> None:
+        """
+        Forget every entry of `model`.
+        """
+        self.entries.pop(model, None)
+
+
+_identity_map: ContextVar[IdentityMap | None] = ContextVar("identity_map", default=None)
+
+
+@contextmanager
+def identity_map_scope():
+    """
+    Activate a fresh identity map for the duration of the block.
+    """
+    token = _identity_map.set(IdentityMap())
+    try:
+        yield
+    finally:
+        _identity_map.reset(token)
+
+
+def memoize(model: type[Model], key: Hashable, loader: Callable[[], Any]) -> Any:
+    """
+    Look up `key` in the active identity map, call `loader` when there is no map.
+
+    Args:
+        model (type[Model]): Model of the looked up instance.
+        key (Hashable): Lookup key, e.g. the primary key.
+        loader (Callable): Fetch the instance from the database, returns None if not found.
+
+    Returns:
+        Any: The result of `loader`, memoized for the current request.
+    """
+    identity_map = _identity_map.get()
+    if identity_map is None:
+        return loader()
+
+    return identity_map.get_or_load(model, key, loader)
+
+
+def forget(model: type[Model]) -> None:
+    """
+    Forget the entries of `model`, e.g. after a `QuerySet.update()`.
+    """
+    identity_map = _identity_map.get()
+    if identity_map is not None:
+        identity_map.discard(model)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def forget_changed_model(sender, **kwargs) -> None:
+    """
+    Keep the map consistent with the writes of the request.
+    """
+    forget(sender)
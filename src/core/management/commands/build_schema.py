@@ -0,0 +1,52 @@
+"""
+Generate the precomputed OpenAPI schema.
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.openapi import generate_schema, get_schema_version
+
+
+class Command(BaseCommand):
+    """
+    Write the OpenAPI schema to `settings.OPENAPI_SCHEMA_FILE`.
+
+    Usage:
+        python manage.py build_schema          # regenerate the file
+        python manage.py build_schema --check  # fail if the file is stale
+    """
+
+    help = "Generate the OpenAPI schema served by the docs views."
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+        """
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Do not write the file, exit with an error if it differs from the generated schema.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Generate the schema and write or check the file.
+        """
+        schema_file = Path(settings.OPENAPI_SCHEMA_FILE)
+        content = generate_schema()
+        version = get_schema_version(content)
+
+        if options["check"]:
+            if not schema_file.exists() or schema_file.read_bytes() != content:
+                raise CommandError(
+                    f"{schema_file} is stale, run `python manage.py build_schema` and commit the result."
+                )
+            self.stdout.write(f"{schema_file} is up to date (version {version}).")
+            return
+
+        schema_file.parent.mkdir(parents=True, exist_ok=True)
+        schema_file.write_bytes(content)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {schema_file} (version {version})."))
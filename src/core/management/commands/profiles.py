@@ -0,0 +1,80 @@
+"""
+List and export the profiles captured by the sampling request profiler.
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.profiling import get_profile, list_profiles, to_folded
+
+
+class Command(BaseCommand):
+    """
+    List and export the captured profiles.
+
+    Usage:
+        python manage.py profiles list                     # newest first
+        python manage.py profiles export <id>              # folded stacks to stdout
+        python manage.py profiles export <id> -o out.txt   # ... or to a file
+
+    The folded stacks render with `flamegraph.pl out.txt > out.svg`, or by dropping
+    the file on https://www.speedscope.app.
+    """
+
+    help = "List and export the profiles captured by the sampling request profiler."
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+        """
+        subparsers = parser.add_subparsers(dest="action", required=True)
+        subparsers.add_parser("list", help="List the captured profiles, newest first.")
+
+        export_parser = subparsers.add_parser("export", help="Export a profile as folded stacks.")
+        export_parser.add_argument("profile_id", help="ID of the profile, from the X-Profile-ID header.")
+        export_parser.add_argument("-o", "--output", help="Write to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        """
+        Run the action.
+        """
+        if options["action"] == "list":
+            self.list_profiles()
+        else:
+            self.export_profile(options["profile_id"], options["output"])
+
+    def list_profiles(self):
+        """
+        Print one line per profile.
+        """
+        profiles = list_profiles()
+        if not profiles:
+            self.stdout.write("No profiles captured.")
+            return
+
+        self.stdout.write(
+            f"{'id':<34} {'started at':<20} {'duration (ms)':>13} {'samples':>8} {'status':>6}  request  request id"
+        )
+        for profile in profiles:
+            self.stdout.write(
+                f"{profile['id']:<34} {profile['started_at']:%Y-%m-%d %H:%M:%S} {profile['duration'] * 1000:>13.1f} "
+                f"{sum(profile['stacks'].values()):>8} {profile['status']:>6}  {profile['method']} {profile['path']}  "
+                f"{profile.get('request_id') or '-'}"
+            )
+
+    def export_profile(self, profile_id: str, output: str | None):
+        """
+        Write the folded stacks of a profile.
+        """
+        profile = get_profile(profile_id)
+        if profile is None:
+            raise CommandError(f"Profile {profile_id} does not exist or expired.")
+
+        folded = to_folded(profile)
+        if output is None:
+            self.stdout.write(folded, ending="")
+            return
+
+        Path(output).write_text(folded)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}."))
@@ -0,0 +1,136 @@
+"""
+Generate a production-sized synthetic dataset.
+"""
+
+import multiprocessing
+import os
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, connections
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from core.seeding import SeedPlan, init_worker, run_task
+from courses.models import Course
+from users.models import User
+
+SEED_PASSWORD = "seed_password"
+
+
+class Command(BaseCommand):
+    r"""
+    Fill the database with a deterministic, skewed dataset for scale testing.
+
+    Usage:
+        python manage.py seed_scale                                  # a small dataset
+        python manage.py seed_scale --users 1000000 --courses 50000 \
+            --enrollments 5000000 --progress 50000000 --workers 8    # production-sized
+        python manage.py seed_scale --seed 7 --end-date 2025-06-30   # another reproducible dataset
+
+    The users log in with the password `seed_password`. Seeding the same seed twice
+    fails on the unique emails, use another seed or a fresh database.
+    """
+
+    help = "Generate a deterministic synthetic dataset for scale testing."
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+        """
+        parser.add_argument("--seed", type=int, default=42, help="Seed of the dataset.")
+        parser.add_argument("--users", type=int, default=10_000, help="Number of users, instructors included.")
+        parser.add_argument("--instructors", type=int, help="Number of instructors. Defaults to 1%% of the users.")
+        parser.add_argument("--categories", type=int, default=20, help="Number of course categories.")
+        parser.add_argument("--courses", type=int, default=500, help="Number of courses.")
+        parser.add_argument("--lessons", type=int, default=10, help="Average number of lessons per course.")
+        parser.add_argument("--quizzes", type=int, default=1, help="Number of quizzes per course.")
+        parser.add_argument("--questions", type=int, default=10, help="Number of questions per quiz.")
+        parser.add_argument("--enrollments", type=int, default=50_000, help="Number of enrollments.")
+        parser.add_argument("--progress", type=int, default=500_000, help="Number of lesson progress rows.")
+        parser.add_argument("--chunk-size", type=int, default=10_000, help="Rows generated per task.")
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count(), help="Number of processes. Defaults to the CPU count."
+        )
+        parser.add_argument("--end-date", type=parse_date, help="Last day of the activity. Defaults to today.")
+
+    def handle(self, *args, **options):
+        """
+        Generate the dataset, table by table.
+        """
+        users = options["users"]
+        instructors = options["instructors"] if options["instructors"] is not None else max(users // 100, 1)
+        self.validate(options, instructors)
+
+        plan = SeedPlan(
+            seed=options["seed"],
+            users=users,
+            instructors=instructors,
+            categories=options["categories"],
+            courses=options["courses"],
+            lessons=options["lessons"],
+            quizzes=options["quizzes"],
+            questions=options["questions"],
+            enrollments=options["enrollments"],
+            progress=options["progress"],
+            chunk_size=options["chunk_size"],
+            end_date=options["end_date"] or timezone.localdate(),
+            password=make_password(SEED_PASSWORD),
+            course_offset=Course.objects.aggregate(last_id=Max("id"))["last_id"] or 0,
+        )
+        if User.objects.filter(username=f"seed{plan.seed}-user0").exists():
+            raise CommandError(f"The dataset of seed {plan.seed} already exists, use another --seed.")
+
+        workers = max(options["workers"], 1)
+        started_at = time.perf_counter()
+        if workers == 1:
+            init_worker(plan)
+            self.seed(plan, map)
+        else:
+            # The forked processes must open their own connections.
+            connections.close_all()
+            with multiprocessing.Pool(workers, initializer=init_worker, initargs=(plan,)) as pool:
+                self.seed(plan, pool.imap_unordered)
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Course]):
+                cursor.execute(sql)
+
+        elapsed = time.perf_counter() - started_at
+        self.stdout.write(self.style.SUCCESS(f"Seeded the dataset of seed {plan.seed} in {elapsed:.1f}s."))
+
+    def validate(self, options: dict, instructors: int):
+        """
+        Check the volumes are consistent.
+        """
+        for name in ("users", "categories", "courses", "lessons", "quizzes", "questions", "enrollments", "progress"):
+            if options[name] < 0:
+                raise CommandError(f"--{name} must not be negative.")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+        if not 0 < instructors < options["users"]:
+            raise CommandError("--instructors must be between 1 and the number of users minus one.")
+        if options["courses"] and not options["categories"]:
+            raise CommandError("--courses requires --categories.")
+        if options["enrollments"] > (options["users"] - instructors) * options["courses"]:
+            raise CommandError("--enrollments exceeds one enrollment per student and course.")
+        if options["progress"] and not (options["enrollments"] and options["lessons"]):
+            raise CommandError("--progress requires --enrollments and --lessons.")
+
+    def seed(self, plan: SeedPlan, map_tasks):
+        """
+        Run the tasks of every table, the tables in order.
+
+        Args:
+            plan (SeedPlan): The dataset.
+            map_tasks (Callable): `map` or the `imap_unordered` of a process pool.
+        """
+        for table, chunks in plan.tasks():
+            started_at = time.perf_counter()
+            rows = 0
+            for count in map_tasks(run_task, [(table, chunk) for chunk in chunks]):
+                rows += count
+            self.stdout.write(f"{table}: {rows:,} rows in {time.perf_counter() - started_at:.1f}s")
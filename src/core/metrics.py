@@ -0,0 +1,339 @@
+"""
+API latency metrics.
+
+`BaseAPIViewSet` records the latency of every request in a histogram labelled by
+resource, action and phase:
+
+    - total: the whole request, from the viewset dispatch to the rendered response.
+    - queryset: time spent running SQL.
+    - serialization: time spent in the view outside of SQL, mostly serializers.
+    - render: rendering the response to JSON.
+
+Recording is lock-free: every thread writes to its own shard, the shards are only
+merged when the metrics are exported. Each process periodically stores its totals
+in the cache, so the metrics endpoint reports every gunicorn worker and not only
+the one serving the scrape.
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+import weakref
+from bisect import bisect_left
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from time import perf_counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+# Upper bounds, in seconds, of the histogram buckets.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_NAME = "api_request_duration_seconds"
+
+PROCESSES_KEY = "metrics:processes"
+ARCHIVE_KEY = "metrics:archive"
+LOCK_KEY = "metrics:lock"
+
+# Labels, `(resource, action, phase)`, to the count of each bucket (the last one is +Inf) followed by the sum.
+Snapshot = dict[tuple[str, str, str], list[float]]
+
+
+class Histogram:
+    """
+    Histogram sharded per thread.
+
+    `observe` only touches the shard of the calling thread, so concurrent requests
+    never wait on each other. The shard list is locked only when a thread records
+    its first value. The shard of a finished thread is folded into the retired
+    totals on the next snapshot, so short-lived threads (`runserver`, parallel
+    batches) do not pile up shards.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        """
+        Initialize an empty histogram.
+        """
+        self.buckets = buckets
+        self.local = threading.local()
+        self.shards: list[Snapshot] = []
+        self.retired: Snapshot = {}
+        self.finished: deque[Snapshot] = deque()
+        self.shards_lock = threading.Lock()
+
+    def get_shard(self) -> Snapshot:
+        """
+        Get the shard of the current thread.
+        """
+        shard = getattr(self.local, "shard", None)
+        if shard is None:
+            shard = self.local.shard = {}
+            with self.shards_lock:
+                self.retire_finished()
+                self.shards.append(shard)
+            # Not under the lock: the finalizer may run in any thread, during a garbage collection.
+            weakref.finalize(threading.current_thread(), self.finished.append, shard)
+
+        return shard
+
+    def retire_finished(self) -> None:
+        """
+        Fold the shards of the finished threads into the retired totals and drop them, with the lock held.
+        """
+        if not self.finished:
+            return
+
+        finished = []
+        while self.finished:
+            finished.append(self.finished.popleft())
+        self.retired = merge_snapshots([self.retired, *finished])
+        finished_ids = {id(shard) for shard in finished}
+        self.shards = [shard for shard in self.shards if id(shard) not in finished_ids]
+
+    def observe(self, labels: tuple[str, str, str], value: float) -> None:
+        """
+        Record a value, in seconds.
+        """
+        shard = self.get_shard()
+        values = shard.get(labels)
+        if values is None:
+            values = shard[labels] = [0] * (len(self.buckets) + 2)
+
+        # Values above the last bound land in the +Inf bucket.
+        values[bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+    def snapshot(self) -> Snapshot:
+        """
+        Merge the shards of every thread.
+        """
+        with self.shards_lock:
+            self.retire_finished()
+            shards = [self.retired, *self.shards]
+
+        return merge_snapshots(dict(shard.items()) for shard in shards)
+
+    def clear(self) -> None:
+        """
+        Drop every recorded value.
+        """
+        with self.shards_lock:
+            self.retire_finished()
+            self.retired = {}
+            for shard in self.shards:
+                shard.clear()
+
+
+def merge_snapshots(snapshots) -> Snapshot:
+    """
+    Sum histogram snapshots.
+    """
+    merged: Snapshot = {}
+    for snapshot in snapshots:
+        for labels, values in snapshot.items():
+            total = merged.get(labels)
+            if total is None:
+                merged[labels] = list(values)
+            else:
+                for index, value in enumerate(values):
+                    total[index] += value
+
+    return merged
+
+
+histogram = Histogram()
+_last_flush = time.monotonic()
+_flush_lock = threading.Lock()
+
+
+class RequestTimer:
+    """
+    Time the phases of one API request.
+    """
+
+    def __init__(self, resource: str):
+        """
+        Initialize the timer of a request to `resource`.
+        """
+        self.resource = resource
+        self.start = perf_counter()
+        self.query_time = 0.0
+        self.view_time = 0.0
+
+    def time_query(self, execute, sql, params, many, context):
+        """
+        Database execute wrapper adding the duration of the query.
+        """
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_time += perf_counter() - start
+
+    @contextmanager
+    def time_view(self):
+        """
+        Time the view, with the duration of every query it runs.
+        """
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self.time_query))
+            yield
+        self.view_time = perf_counter() - self.start
+
+    def record(self, action: str, response) -> None:
+        """
+        Record the phases once the response is rendered.
+
+        Responses which are never rendered, e.g. the sub-requests of a batch, are
+        recorded without a render phase.
+        """
+        if getattr(response, "is_rendered", True):
+            self.observe(action, 0.0, render=False)
+            return
+
+        render = response.render
+
+        def timed_render():
+            start = perf_counter()
+            rendered = render()
+            self.observe(action, perf_counter() - start)
+            return rendered
+
+        response.render = timed_render
+
+    def observe(self, action: str, render_time: float, render: bool = True) -> None:
+        """
+        Add the phases to the histogram.
+        """
+        observe = histogram.observe
+        observe((self.resource, action, "total"), self.view_time + render_time)
+        observe((self.resource, action, "queryset"), self.query_time)
+        observe((self.resource, action, "serialization"), max(self.view_time - self.query_time, 0.0))
+        if render:
+            observe((self.resource, action, "render"), render_time)
+
+        maybe_flush()
+
+
+def get_process_key() -> str:
+    """
+    Get the cache key of the totals of this process.
+
+    Resolved on each call, gunicorn forks the workers after importing the app.
+    """
+    return f"metrics:process:{socket.gethostname()}:{os.getpid()}"
+
+
+@contextmanager
+def cache_lock(timeout: int = 5):
+    """
+    Hold a lock shared by the processes, through the cache, yielding whether it was acquired in `timeout` seconds.
+
+    The lock holds a token of its holder, so a holder which waited past the expiry of
+    its lock does not release the one of another process.
+    """
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + timeout
+    acquired = cache.add(LOCK_KEY, token, timeout)
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(0.01)
+        acquired = cache.add(LOCK_KEY, token, timeout)
+    try:
+        yield acquired
+    finally:
+        if acquired and cache.get(LOCK_KEY) == token:
+            cache.delete(LOCK_KEY)
+
+
+def maybe_flush() -> None:
+    """
+    Store the totals of this process every `METRICS_FLUSH_SECONDS`, without waiting for another thread.
+    """
+    if time.monotonic() - _last_flush < settings.METRICS_FLUSH_SECONDS:
+        return
+
+    if _flush_lock.acquire(blocking=False):
+        try:
+            flush()
+        finally:
+            _flush_lock.release()
+
+
+def flush() -> None:
+    """
+    Store the totals of this process in the cache.
+    """
+    global _last_flush
+    _last_flush = time.monotonic()
+
+    process_key = get_process_key()
+    cache.set(process_key, histogram.snapshot(), None)
+    if process_key not in cache.get(PROCESSES_KEY, ()):
+        # Without the lock the process is registered by a later flush.
+        with cache_lock() as locked:
+            if locked:
+                cache.set(PROCESSES_KEY, {*cache.get(PROCESSES_KEY, ()), process_key}, None)
+
+
+def archive() -> None:
+    """
+    Fold the totals of this process into the archive, called when the process exits.
+
+    The exported counters keep growing when gunicorn recycles a worker. Without the
+    lock the totals are stored as by a flush, and stay exported under the process key.
+    """
+    process_key = get_process_key()
+    snapshot = histogram.snapshot()
+    with cache_lock() as locked:
+        if locked:
+            cache.set(ARCHIVE_KEY, merge_snapshots([cache.get(ARCHIVE_KEY, {}), snapshot]), None)
+            cache.set(PROCESSES_KEY, set(cache.get(PROCESSES_KEY, ())) - {process_key}, None)
+    if not locked:
+        flush()
+        return
+
+    cache.delete(process_key)
+    histogram.clear()
+
+
+def collect() -> Snapshot:
+    """
+    Sum the totals of every process.
+    """
+    flush()
+    keys = [ARCHIVE_KEY, *cache.get(PROCESSES_KEY, ())]
+
+    return merge_snapshots(cache.get_many(keys).values())
+
+
+def escape_label(value: str) -> str:
+    """
+    Escape a label value of the Prometheus text format.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def export(snapshot: Snapshot) -> str:
+    """
+    Render a snapshot in the Prometheus text exposition format.
+    """
+    lines = [
+        f"# HELP {METRIC_NAME} API request latency by resource, action and phase.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    bounds = [*(repr(bound) for bound in BUCKETS), "+Inf"]
+    for (resource, action, phase), values in sorted(snapshot.items()):
+        labels = f'resource="{escape_label(resource)}",action="{escape_label(action)}",phase="{phase}"'
+        cumulative = 0
+        for bound, count in zip(bounds, values[:-1]):
+            cumulative += count
+            lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{METRIC_NAME}_sum{{{labels}}} {values[-1]!r}")
+        lines.append(f"{METRIC_NAME}_count{{{labels}}} {cumulative}")
+
+    return "\n".join(lines) + "\n"
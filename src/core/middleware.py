@@ -0,0 +1,101 @@
+"""
+Core middleware.
+"""
+
+import random
+import re
+import secrets
+import threading
+import uuid
+from time import perf_counter
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.identity_map import identity_map_scope
+from core.profiling import Sampler, save_profile
+
+REQUEST_ID_PATTERN = re.compile(r"[\w.-]{1,64}")
+
+
+class IdentityMapMiddleware:
+    """
+    Give every request its own identity map and drop it when the request ends.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Handle the request inside an identity map scope.
+        """
+        with identity_map_scope():
+            return self.get_response(request)
+
+
+class ProfilerMiddleware:
+    """
+    Run a sample of the requests under the sampling profiler, see `core.profiling`.
+
+    A request is profiled with the probability `PROFILER_SAMPLE_RATE`, or when it
+    sends `X-Profile: <PROFILER_TOKEN>`. The profile is stored under an ID generated
+    here, so a client cannot overwrite the profile of another request, and returned
+    in the `X-Profile-ID` header. A valid `X-Request-ID` is kept in the profile.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+        """
+        self.get_response = get_response
+
+    def should_profile(self, request) -> bool:
+        """
+        Check if the request is sampled or asks to be profiled.
+        """
+        token = settings.PROFILER_TOKEN
+        if token and secrets.compare_digest(request.headers.get("X-Profile", ""), token):
+            return True
+
+        return random.random() < settings.PROFILER_SAMPLE_RATE
+
+    def __call__(self, request):
+        """
+        Handle the request, under the profiler when sampled.
+        """
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        profile_id = uuid.uuid4().hex
+        request_id = request.headers.get("X-Request-ID", "")
+        if not REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = ""
+
+        sampler = Sampler(threading.get_ident(), settings.PROFILER_INTERVAL)
+        started_at = timezone.now()
+        start = perf_counter()
+        sampler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            sampler.stop()
+
+        save_profile(
+            {
+                "id": profile_id,
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "started_at": started_at,
+                "duration": perf_counter() - start,
+                "interval": settings.PROFILER_INTERVAL,
+                "stacks": dict(sampler.stacks),
+            }
+        )
+        response["X-Profile-ID"] = profile_id
+        return response
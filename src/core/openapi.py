@@ -0,0 +1,68 @@
+"""
+Precomputed OpenAPI schema.
+
+The schema is generated once with `python manage.py build_schema` into
+`settings.OPENAPI_SCHEMA_FILE` and served as is by the docs views, instead of
+introspecting every viewset on each request.
+"""
+
+import hashlib
+from functools import cache
+from pathlib import Path
+
+import orjson
+from django.conf import settings
+from django.urls import reverse
+
+from core.renderers import orjson_default
+
+
+def generate_schema() -> bytes:
+    """
+    Generate the OpenAPI schema of the API as JSON.
+
+    Keys keep the generator order and the output ends with a newline, so the file
+    is stable across runs and pre-commit hooks leave it untouched.
+    """
+    from drf_spectacular.settings import spectacular_settings
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+
+    return orjson.dumps(schema, default=orjson_default, option=orjson.OPT_INDENT_2) + b"\n"
+
+
+def get_schema_version(content: bytes) -> str:
+    """
+    Get the version of a schema, a short hash of its content.
+    """
+    return hashlib.sha256(content).hexdigest()[:12]
+
+
+@cache
+def load_schema() -> tuple[bytes, str] | None:
+    """
+    Load the precomputed schema once per process.
+
+    Returns:
+        tuple | None: The schema content and version, None when serving the
+            precomputed schema is disabled or the file was not generated.
+    """
+    schema_file = Path(settings.OPENAPI_SCHEMA_FILE)
+    if not settings.OPENAPI_SCHEMA_STATIC or not schema_file.exists():
+        return None
+
+    content = schema_file.read_bytes()
+    return content, get_schema_version(content)
+
+
+def get_schema_url() -> str:
+    """
+    Get the URL of the schema, versioned with the content hash when precomputed.
+
+    The version changes with the schema, so the docs UIs can cache it for good.
+    """
+    url = reverse("schema")
+    schema = load_schema()
+
+    return f"{url}?v={schema[1]}" if schema else url
@@ -0,0 +1,158 @@
+"""
+Sampling request profiler.
+
+`core.middleware.ProfilerMiddleware` runs a sampled fraction of the requests, or
+the requests sending the profiler token, under `Sampler`: a background thread
+which records the stack of the request thread every few milliseconds. The request
+itself runs untouched, the overhead is the sampler thread taking the GIL for a few
+microseconds per sample.
+
+Profiles are stored in the cache, keyed by request ID, as folded stacks (one
+`frame;frame;frame count` line per stack), the input format of flamegraph.pl,
+inferno and speedscope. Use `python manage.py profiles` to list and export them.
+The newest ones are indexed in a ring of `PROFILER_MAX_PROFILES` slots, filled in
+the order of an atomic counter, so the processes saving profiles at once never
+drop each other's. The cache must be shared by the processes, see core.cache.
+"""
+
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+
+PROFILE_KEY = "profiler:profile:{profile_id}"
+SLOT_KEY = "profiler:slot:{slot}"
+SEQUENCE_KEY = "profiler:sequence"
+
+# Longest first, so a frame is named after the most specific import path.
+_SYS_PATHS = sorted((str(Path(path).resolve()) for path in sys.path if path), key=len, reverse=True)
+
+
+class Sampler:
+    """
+    Sample the stack of one thread at a fixed interval.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Initialize the sampler of the thread `thread_id`.
+
+        Args:
+            thread_id (int): Identifier of the sampled thread, see `threading.get_ident()`.
+            interval (float): Seconds between two samples.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.frame_names: dict = {}
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="profiler-sampler", daemon=True)
+
+    def start(self) -> None:
+        """
+        Start sampling.
+        """
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling and wait for the sampler thread.
+        """
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self) -> None:
+        """
+        Record the stack of the thread until stopped.
+        """
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+
+            names = []
+            while frame is not None:
+                names.append(self.get_frame_name(frame.f_code))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def get_frame_name(self, code) -> str:
+        """
+        Get the name of a frame, e.g. `CourseViewSet.list (courses/apis.py:76)`, cached per code object.
+        """
+        name = self.frame_names.get(code)
+        if name is None:
+            filename = code.co_filename
+            for path in _SYS_PATHS:
+                if filename.startswith(path):
+                    filename = filename[len(path) + 1 :]
+                    break
+            name = self.frame_names[code] = f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+        return name
+
+
+def save_profile(profile: dict) -> None:
+    """
+    Store a profile for `PROFILER_RETENTION_SECONDS`, in the slot of the oldest of the `PROFILER_MAX_PROFILES`.
+
+    The profile which had the slot is deleted, unless its ID was saved again since.
+
+    Args:
+        profile (dict): The profile, with its request `id`.
+    """
+    timeout = settings.PROFILER_RETENTION_SECONDS
+    cache.add(SEQUENCE_KEY, 0, timeout=None)
+    sequence = cache.incr(SEQUENCE_KEY)
+    slot_key = SLOT_KEY.format(slot=sequence % settings.PROFILER_MAX_PROFILES)
+
+    evicted = cache.get(slot_key)
+    cache.set(PROFILE_KEY.format(profile_id=profile["id"]), (sequence, profile), timeout)
+    cache.set(slot_key, (profile["id"], sequence), timeout)
+    if evicted is not None:
+        evicted_key = PROFILE_KEY.format(profile_id=evicted[0])
+        stored = cache.get(evicted_key)
+        if stored is not None and stored[0] == evicted[1]:
+            cache.delete(evicted_key)
+
+
+def get_profile(profile_id: str) -> dict | None:
+    """
+    Get a stored profile, None if it expired or does not exist.
+    """
+    stored = cache.get(PROFILE_KEY.format(profile_id=profile_id))
+
+    return stored[1] if stored is not None else None
+
+
+def list_profiles() -> list[dict]:
+    """
+    Get the stored profiles, newest first.
+    """
+    sequence = cache.get(SEQUENCE_KEY, 0)
+    slot_keys = [
+        SLOT_KEY.format(slot=number % settings.PROFILER_MAX_PROFILES)
+        for number in range(sequence, max(sequence - settings.PROFILER_MAX_PROFILES, 0), -1)
+    ]
+    slots = cache.get_many(slot_keys)
+    entries = [slots[key] for key in slot_keys if key in slots]
+    profiles = cache.get_many([PROFILE_KEY.format(profile_id=profile_id) for profile_id, _ in entries])
+
+    # A profile saved again under the same ID is only listed from its newest slot.
+    return [
+        stored[1]
+        for profile_id, number in entries
+        if (stored := profiles.get(PROFILE_KEY.format(profile_id=profile_id))) is not None and stored[0] == number
+    ]
+
+
+def to_folded(profile: dict) -> str:
+    """
+    Render a profile as folded stacks, most sampled first.
+    """
+    stacks = sorted(profile["stacks"].items(), key=lambda item: item[1], reverse=True)
+
+    return "".join(f"{stack} {count}\n" for stack, count in stacks)
@@ -0,0 +1,75 @@
+"""
+Custom renderers for the API.
+"""
+
+import datetime
+import decimal
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_default(obj):
+    """
+    Convert the types orjson does not support natively.
+
+    orjson already handles str, int, float, bool, None, dict, list, tuple, UUID,
+    date, time and datetime. The remaining types follow DRF's JSONEncoder so that
+    responses keep the same shape as with the default renderer.
+
+    Args:
+        obj (Any): The object that orjson could not serialize.
+
+    Returns:
+        Any: A JSON serializable representation of the object.
+    """
+    match obj:
+        case decimal.Decimal():
+            return float(obj)
+        case datetime.timedelta():
+            return str(obj.total_seconds())
+        case Promise():
+            return str(obj)
+        case QuerySet():
+            return list(obj)
+        case bytes():
+            return obj.decode()
+
+    if hasattr(obj, "tolist"):
+        # Numpy arrays and array scalars.
+        return obj.tolist()
+
+    if hasattr(obj, "__iter__"):
+        return list(obj)
+
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renderer which serializes to JSON with orjson.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b""
+
+        options = ORJSON_OPTIONS
+
+        # Honour `Accept: application/json; indent=N` the same way DRF does,
+        # orjson only supports a two spaces indentation.
+        if accepted_media_type and "indent=" in accepted_media_type:
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=orjson_default, option=options)
@@ -0,0 +1,99 @@
+"""
+Lazy API router.
+"""
+
+from functools import cached_property
+
+from django.urls import path
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.routers import DefaultRouter, SimpleRouter
+from rest_framework.urlpatterns import format_suffix_patterns
+
+
+class LazyViewSetURLConf:
+    """
+    URLconf of a single viewset, imported the first time one of its URLs is resolved.
+
+    Django only reads `urlpatterns` of an included URLconf when the request path
+    matches the include prefix, so the viewset module and everything it imports
+    (serializers, services, Celery tasks, ...) stay unloaded until then.
+    """
+
+    def __init__(self, viewset: str, basename: str):
+        """
+        Initialize the URLconf.
+
+        Args:
+            viewset (str): Dotted path of the viewset class.
+            basename (str): Base name of the URL names, e.g. "courses" for "courses-list".
+        """
+        self.viewset = viewset
+        self.basename = basename
+
+    @cached_property
+    def urlpatterns(self) -> list:
+        """
+        Import the viewset and build its routes, relative to the include prefix.
+        """
+        router = SimpleRouter()
+        router.register("", import_string(self.viewset), self.basename)
+        return format_suffix_patterns(router.urls)
+
+
+class LazyRouter(DefaultRouter):
+    """
+    Router which registers viewsets by dotted path and imports them on first hit.
+
+    The API root view still lists the registered resources, reversing their URLs
+    imports the viewsets.
+
+    Example:
+        router = LazyRouter()
+        router.register("courses", "courses.apis.CourseViewSet", "courses")
+    """
+
+    def register(self, prefix: str, viewset: str, basename: str = None):
+        """
+        Register a viewset by dotted path.
+
+        Args:
+            prefix (str): URL prefix of the resource.
+            viewset (str): Dotted path of the viewset class.
+            basename (str, optional): Base name of the URL names. Defaults to the prefix.
+        """
+        super().register(prefix, viewset, basename or prefix)
+
+    def get_urls(self) -> list:
+        """
+        Build the API root view and one lazy include per registered viewset.
+        """
+        root_view = self.get_api_root_view()
+        urls = format_suffix_patterns([path("", root_view, name=self.root_view_name)])
+        for prefix, viewset, basename in self.registry:
+            # The (urlconf, app_name, namespace) tuple `include()` would return, calling
+            # `include()` reads `urlpatterns` right away.
+            urls.append(path(f"{prefix}/", (LazyViewSetURLConf(viewset, basename), None, None)))
+
+        return urls
+
+
+def lazy_view(view: str, **initkwargs):
+    """
+    Build a view function which imports the class based view `view` on first call.
+
+    Args:
+        view (str): Dotted path of the view class.
+        initkwargs (dict): Arguments passed to `as_view()`.
+
+    Returns:
+        function: The view function.
+    """
+
+    @csrf_exempt
+    def view_func(request, *args, **kwargs):
+        if not hasattr(view_func, "view"):
+            view_func.view = import_string(view).as_view(**initkwargs)
+        return view_func.view(request, *args, **kwargs)
+
+    return view_func
@@ -81,3 +81,38 @@ def build_query_parameters(serializer_class: Type[serializers.Serializer]) -> Li
         parameters.append(param)
 
     return parameters
+
+
+def build_sparse_fieldset_parameters(serializer_class: Type[serializers.Serializer]) -> List[OpenApiParameter]:
+    """
+    Build the `fields` and `expand` query parameters of a `ValuesSerializer` list.
+
+    Args:
+        serializer_class (Type[serializers.Serializer]): The `ValuesSerializer` rendering the list.
+
+    Returns:
+        List[OpenApiParameter]: The sparse fieldset parameters, `expand` only if the serializer has relations.
+    """
+    parameters = [
+        OpenApiParameter(
+            name="fields",
+            description=f"Comma separated fields to return. One of: {', '.join(serializer_class().fields)}.",
+            required=False,
+            type=str,
+            location=OpenApiParameter.QUERY,
+        )
+    ]
+    if serializer_class.expandable_fields:
+        parameters.append(
+            OpenApiParameter(
+                name="expand",
+                description=(
+                    f"Comma separated relations to expand. One of: {', '.join(serializer_class.expandable_fields)}."
+                ),
+                required=False,
+                type=str,
+                location=OpenApiParameter.QUERY,
+            )
+        )
+
+    return parameters
@@ -0,0 +1,524 @@
+"""
+Deterministic synthetic dataset for scale testing.
+
+`python manage.py seed_scale` fills the database with production-sized volumes
+(users, courses, lessons, quizzes, enrollments and lesson progress) with a
+realistic skew: a few instructors teach most courses, a few courses take most
+enrollments and a few students make most of the progress.
+
+Every table is generated in independent chunks, so the chunks run in parallel
+processes. A chunk only depends on the seed and its position: primary keys are
+derived from `(table, seed, index)` and each chunk draws from its own
+`random.Random`, so the same options always produce the same rows whatever the
+number of processes. On PostgreSQL the rows are streamed with `COPY`, on the other
+backends they are inserted with `bulk_create`, which sets the `auto_now_add`
+timestamps to the current time.
+"""
+
+import hashlib
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+from functools import lru_cache
+from itertools import accumulate, islice
+from typing import Iterable, Iterator
+
+from django.db import connection, models, transaction
+
+from core.constants import CourseStatus, DailyProcessStatus, UserRole
+
+FIRST_NAMES = ("Anh", "Binh", "Chau", "David", "Emma", "Hoa", "Khanh", "Linh", "Maria", "Minh", "Noah", "Olivia")
+LAST_NAMES = ("Brown", "Garcia", "Le", "Nguyen", "Pham", "Smith", "Tran", "Vo", "Williams", "Wilson")
+TOPICS = ("Python", "Django", "Data Science", "Design", "Marketing", "Finance", "Photography", "Music", "Writing")
+
+# Share of the courses which are published.
+PUBLISHED_RATE = 0.9
+# Enrollments and progress are spread over the year before the end date.
+HISTORY_DAYS = 365
+
+
+@lru_cache
+def _uuid_prefix(table: str, seed: int) -> int:
+    return int.from_bytes(hashlib.blake2b(f"{seed}:{table}".encode(), digest_size=8).digest())
+
+
+def make_uuid(table: str, seed: int, index: int) -> uuid.UUID:
+    """
+    Get the primary key of the row `index` of a table, the same for the same seed.
+
+    Args:
+        table (str): Name of the table.
+        seed (int): Seed of the dataset.
+        index (int): Position of the row in the table.
+
+    Returns:
+        uuid.UUID: A version 4 UUID, unique per table and seed.
+    """
+    return uuid.UUID(int=(_uuid_prefix(table, seed) << 64) | index, version=4)
+
+
+def split(total: int, start: int, end: int, size: int) -> tuple[int, int]:
+    """
+    Get the slice `[offset, offset + count)` of `total` items spread evenly over `size` positions.
+
+    The slices of consecutive ranges of positions are contiguous, so chunks can
+    number their items without knowing about each other.
+    """
+    offset = total * start // size
+
+    return offset, total * end // size - offset
+
+
+def allocate(rng: random.Random, total: int, weights: list[float], capacity: int) -> list[int]:
+    """
+    Spread `total` items over `len(weights)` bins proportionally to their weight, at most `capacity` per bin.
+    """
+    counts = [0] * len(weights)
+    for index in rng.choices(range(len(weights)), weights=weights, k=total):
+        counts[index] += 1
+
+    overflow = sum(max(count - capacity, 0) for count in counts)
+    counts = [min(count, capacity) for count in counts]
+    while overflow:
+        index = rng.randrange(len(counts))
+        if counts[index] < capacity:
+            counts[index] += 1
+            overflow -= 1
+
+    return counts
+
+
+def zipf_weights(size: int, skew: float) -> list[float]:
+    """
+    Get the cumulative weights of `size` ranks following Zipf's law, the first rank being the most popular.
+    """
+    return list(accumulate(1 / (rank + 1) ** skew for rank in range(size)))
+
+
+@dataclass
+class SeedPlan:
+    """
+    Volumes and shared draws of a dataset.
+    """
+
+    seed: int
+    users: int
+    instructors: int
+    categories: int
+    courses: int
+    lessons: int
+    quizzes: int
+    questions: int
+    enrollments: int
+    progress: int
+    chunk_size: int
+    end_date: date
+    password: str
+    course_offset: int = 0
+    skew: float = 1.1
+    lesson_offsets: list[int] = field(default_factory=list)
+    course_ranks: list[int] = field(default_factory=list)
+    course_weights: list[float] = field(default_factory=list)
+    instructor_weights: list[float] = field(default_factory=list)
+    category_weights: list[float] = field(default_factory=list)
+
+    def __post_init__(self):
+        """
+        Draw the lessons per course and the popularity of the courses, instructors and categories.
+        """
+        rng = random.Random(f"{self.seed}:plan")
+
+        counts = [rng.randint(1, 2 * self.lessons - 1) for _ in range(self.courses)] if self.lessons else []
+        self.lesson_offsets = [0, *accumulate(counts)]
+
+        self.course_ranks = list(range(self.courses))
+        rng.shuffle(self.course_ranks)
+        self.course_weights = zipf_weights(self.courses, self.skew)
+        self.instructor_weights = zipf_weights(self.instructors, self.skew)
+        self.category_weights = zipf_weights(self.categories, self.skew)
+
+    @property
+    def students(self) -> int:
+        """
+        Number of students, the users after the instructors.
+        """
+        return self.users - self.instructors
+
+    def chunk_random(self, table: str, start: int) -> random.Random:
+        """
+        Get the random generator of the chunk of `table` starting at `start`.
+        """
+        return random.Random(f"{self.seed}:{table}:{start}")
+
+    def to_datetime(self, day: date, rng: random.Random) -> datetime:
+        """
+        Get a random time of `day`.
+        """
+        return datetime.combine(day, time(), tzinfo=UTC) + timedelta(seconds=rng.randrange(86400))
+
+    def past_day(self, rng: random.Random) -> date:
+        """
+        Get a random day of the history.
+        """
+        return self.end_date - timedelta(days=rng.randrange(HISTORY_DAYS))
+
+    def chunks(self, size: int, rows_per_position: float = 1) -> list[tuple[int, int]]:
+        """
+        Get the `(start, end)` ranges covering `size` positions, about `chunk_size` rows each.
+        """
+        chunk_size = max(int(self.chunk_size / max(rows_per_position, 1)), 1)
+
+        return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+    def tasks(self) -> list[tuple[str, list[tuple[int, int]]]]:
+        """
+        Get the chunks of every table, in insertion order.
+        """
+        per_student = self.enrollments / self.students if self.students else 1
+
+        return [
+            ("users", self.chunks(self.users)),
+            ("categories", self.chunks(self.categories)),
+            ("courses", self.chunks(self.courses)),
+            ("lessons", self.chunks(self.courses, self.lessons)),
+            ("quizzes", self.chunks(self.courses, self.quizzes * (self.questions + 1))),
+            ("enrollments", self.chunks(self.students, per_student)),
+        ]
+
+
+_plan: SeedPlan | None = None
+
+
+def init_worker(plan: SeedPlan) -> None:
+    """
+    Set the plan of the process, see `multiprocessing.Pool(initializer=...)`.
+    """
+    import django
+    from django.apps import apps
+
+    global _plan
+    _plan = plan
+    if not apps.ready:
+        django.setup()
+
+
+def run_task(task: tuple[str, tuple[int, int]]) -> int:
+    """
+    Generate and insert one chunk of a table.
+
+    Args:
+        task (tuple): Name of the table and `(start, end)` range of the chunk.
+
+    Returns:
+        int: Number of inserted rows.
+    """
+    table, (start, end) = task
+
+    return SEEDERS[table](_plan, start, end)
+
+
+def insert_rows(model: type[models.Model], columns: list[str], rows: Iterable[tuple], batch_size: int) -> int:
+    """
+    Insert rows in one transaction, with `COPY` on PostgreSQL and `bulk_create` elsewhere.
+
+    Args:
+        model (Model): Model of the table.
+        columns (list[str]): Field attribute names, in the order of the row values.
+        rows (Iterable[tuple]): Row values.
+        batch_size (int): Number of rows per INSERT with `bulk_create`.
+
+    Returns:
+        int: Number of inserted rows.
+    """
+    count = 0
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            from psycopg.types.json import Jsonb
+
+            fields = [model._meta.get_field(column) for column in columns]
+            json_positions = [position for position, field in enumerate(fields) if isinstance(field, models.JSONField)]
+            quote = connection.ops.quote_name
+            column_names = ", ".join(quote(field.column) for field in fields)
+            sql = f"COPY {quote(model._meta.db_table)} ({column_names}) FROM STDIN"
+            with connection.cursor() as cursor, cursor.copy(sql) as copy:
+                for row in rows:
+                    if json_positions:
+                        row = list(row)
+                        for position in json_positions:
+                            row[position] = Jsonb(row[position])
+                    copy.write_row(row)
+                    count += 1
+            return count
+
+        objects = (model(**dict(zip(columns, row))) for row in rows)
+        while batch := list(islice(objects, batch_size)):
+            model.objects.bulk_create(batch)
+            count += len(batch)
+
+    return count
+
+
+def seed_users(plan: SeedPlan, start: int, end: int) -> int:
+    """
+    Insert the users `[start, end)`, the first `plan.instructors` users are instructors.
+    """
+    from users.models import User
+
+    rng = plan.chunk_random("users", start)
+
+    def rows() -> Iterator[tuple]:
+        for index in range(start, end):
+            username = f"seed{plan.seed}-user{index}"
+            joined_at = plan.to_datetime(plan.past_day(rng) - timedelta(days=HISTORY_DAYS), rng)
+            role = UserRole.INSTRUCTOR.value if index < plan.instructors else UserRole.STUDENT.value
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield (
+                make_uuid("users", plan.seed, index),
+                plan.password,
+                username,
+                f"{username}@example.com",
+                first_name,
+                last_name,
+                role,
+                True,
+                False,
+                False,
+                joined_at,
+                joined_at,
+            )
+
+    columns = [
+        "id",
+        "password",
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "role",
+        "is_active",
+        "is_staff",
+        "is_superuser",
+        "created_at",
+        "updated_at",
+    ]
+    return insert_rows(User, columns, rows(), plan.chunk_size)
+
+
+def seed_categories(plan: SeedPlan, start: int, end: int) -> int:
+    """
+    Insert the categories `[start, end)`.
+    """
+    from courses.models import Category
+
+    rng = plan.chunk_random("categories", start)
+    created_at = plan.to_datetime(plan.end_date - timedelta(days=2 * HISTORY_DAYS), rng)
+    rows = (
+        (
+            make_uuid("categories", plan.seed, index),
+            f"{TOPICS[index % len(TOPICS)]} {index}",
+            "",
+            created_at,
+            created_at,
+        )
+        for index in range(start, end)
+    )
+
+    return insert_rows(Category, ["id", "name", "description", "created_at", "updated_at"], rows, plan.chunk_size)
+
+
+def seed_courses(plan: SeedPlan, start: int, end: int) -> int:
+    """
+    Insert the courses `[start, end)`, most of them taught by the first instructors.
+    """
+    from courses.models import Course
+
+    rng = plan.chunk_random("courses", start)
+
+    def rows() -> Iterator[tuple]:
+        for index in range(start, end):
+            instructor = rng.choices(range(plan.instructors), cum_weights=plan.instructor_weights)[0]
+            category = rng.choices(range(plan.categories), cum_weights=plan.category_weights)[0]
+            status = CourseStatus.PUBLISHED if rng.random() < PUBLISHED_RATE else CourseStatus.UNPUBLISHED
+            topic = TOPICS[category % len(TOPICS)]
+            created_at = plan.to_datetime(plan.past_day(rng) - timedelta(days=HISTORY_DAYS), rng)
+            yield (
+                plan.course_offset + index + 1,
+                f"{topic} course {index}",
+                f"Learn {topic.lower()} step by step.",
+                make_uuid("users", plan.seed, instructor),
+                make_uuid("categories", plan.seed, category),
+                status.value,
+                created_at,
+                created_at,
+            )
+
+    columns = ["id", "title", "description", "instructor_id", "category_id", "status", "created_at", "updated_at"]
+    return insert_rows(Course, columns, rows(), plan.chunk_size)
+
+
+def seed_lessons(plan: SeedPlan, start: int, end: int) -> int:
+    """
+    Insert the lessons of the courses `[start, end)`.
+    """
+    from lessons.models import Lesson
+
+    rng = plan.chunk_random("lessons", start)
+
+    def rows() -> Iterator[tuple]:
+        for course in range(start, end):
+            created_at = plan.to_datetime(plan.end_date - timedelta(days=HISTORY_DAYS), rng)
+            first, last = plan.lesson_offsets[course], plan.lesson_offsets[course + 1]
+            for index in range(first, last):
+                yield (
+                    make_uuid("lessons", plan.seed, index),
+                    plan.course_offset + course + 1,
+                    f"Lesson {index - first + 1}",
+                    "Lesson content.",
+                    f"https://videos.example.com/{index}",
+                    rng.randint(5, 60),
+                    created_at,
+                    created_at,
+                )
+
+    columns = ["id", "course_id", "title", "content", "video_url", "duration_minutes", "created_at", "updated_at"]
+    return insert_rows(Lesson, columns, rows(), plan.chunk_size)
+
+
+def seed_quizzes(plan: SeedPlan, start: int, end: int) -> int:
+    """
+    Insert the quizzes of the courses `[start, end)` and their questions.
+    """
+    from quizzes.models import Question, Quiz
+
+    rng = plan.chunk_random("quizzes", start)
+    created_at = plan.to_datetime(plan.end_date - timedelta(days=HISTORY_DAYS), rng)
+    quizzes = [
+        (course, course * plan.quizzes + number) for course in range(start, end) for number in range(plan.quizzes)
+    ]
+
+    quiz_rows = (
+        (
+            make_uuid("quizzes", plan.seed, index),
+            plan.course_offset + course + 1,
+            f"Quiz {index % plan.quizzes + 1}",
+            plan.questions,
+            False,
+            created_at,
+            created_at,
+        )
+        for course, index in quizzes
+    )
+    columns = ["id", "course_id", "title", "next_question_position", "exam_mode", "created_at", "updated_at"]
+    count = insert_rows(Quiz, columns, quiz_rows, plan.chunk_size)
+
+    def question_rows() -> Iterator[tuple]:
+        for _, quiz in quizzes:
+            for number in range(plan.questions):
+                options = [f"Option {letter}" for letter in "ABCD"]
+                yield (
+                    make_uuid("questions", plan.seed, quiz * plan.questions + number),
+                    make_uuid("quizzes", plan.seed, quiz),
+                    f"Question {number + 1}",
+                    options,
+                    rng.choice(options),
+                    number,
+                    created_at,
+                    created_at,
+                )
+
+    columns = ["id", "quiz_id", "text", "options", "correct_answer", "position", "created_at", "updated_at"]
+    return count + insert_rows(Question, columns, question_rows(), plan.chunk_size)
+
+
+def seed_enrollments(plan: SeedPlan, start: int, end: int) -> int:
+    """
+    Insert the enrollments of the students `[start, end)` and their lesson progress.
+
+    The students and the courses are drawn with a heavy-tailed popularity, a student
+    enrolls at most once per course. The progress rows of an enrollment walk through
+    the lessons of the course in order, one to three days per lesson, then revisit
+    them once the course is completed.
+    """
+    from courses.models import Enrollment
+    from lessons.models import LessonProgress
+
+    rng = plan.chunk_random("enrollments", start)
+    students = end - start
+    enrollment_offset, enrollment_count = split(plan.enrollments, start, end, plan.students)
+    _, progress_count = split(plan.progress, start, end, plan.students)
+
+    activity = [rng.paretovariate(1.5) for _ in range(students)]
+    per_student = allocate(rng, enrollment_count, activity, plan.courses)
+
+    enrollments = []
+    for student, count in enumerate(per_student):
+        courses: set[int] = set()
+        if count > plan.courses // 2:
+            courses.update(rng.sample(range(plan.courses), count))
+        while len(courses) < count:
+            rank = rng.choices(range(plan.courses), cum_weights=plan.course_weights)[0]
+            courses.add(plan.course_ranks[rank])
+        for course in sorted(courses):
+            enrolled_at = plan.to_datetime(plan.past_day(rng), rng)
+            enrollments.append((plan.instructors + start + student, course, enrolled_at))
+
+    engagement = [rng.paretovariate(1.2) for _ in enrollments]
+    per_enrollment = allocate(rng, progress_count, engagement, progress_count) if enrollments else []
+
+    progress = []
+    completed = []
+    for (student, course, enrolled_at), count in zip(enrollments, per_enrollment):
+        user_id = make_uuid("users", plan.seed, student)
+        first, last = plan.lesson_offsets[course], plan.lesson_offsets[course + 1]
+        lesson, days_left, day = first, rng.randint(1, 3), enrolled_at.date()
+        for _ in range(count):
+            days_left -= 1
+            status = (
+                DailyProcessStatus.COMPLETED if days_left == 0 or lesson >= last else DailyProcessStatus.IN_PROGRESS
+            )
+            lesson_index = lesson if lesson < last else rng.randrange(first, last)
+            created_at = plan.to_datetime(min(day, plan.end_date), rng)
+            progress.append(
+                (
+                    user_id,
+                    make_uuid("lessons", plan.seed, lesson_index),
+                    status.value,
+                    timedelta(minutes=rng.randint(5, 90)),
+                    created_at.date(),
+                    created_at,
+                    created_at,
+                )
+            )
+            day += timedelta(days=1)
+            if days_left == 0 and lesson < last:
+                lesson, days_left = lesson + 1, rng.randint(1, 3)
+        completed.append(lesson >= last)
+
+    rows = (
+        (
+            make_uuid("enrollments", plan.seed, enrollment_offset + index),
+            make_uuid("users", plan.seed, student),
+            plan.course_offset + course + 1,
+            enrolled_at,
+            is_completed,
+            enrolled_at,
+            enrolled_at,
+        )
+        for index, ((student, course, enrolled_at), is_completed) in enumerate(zip(enrollments, completed))
+    )
+    columns = ["id", "student_id", "course_id", "enrolled_at", "completed", "created_at", "updated_at"]
+    count = insert_rows(Enrollment, columns, rows, plan.chunk_size)
+
+    columns = ["user_id", "lesson_id", "status", "time_spent", "date", "created_at", "updated_at"]
+    return count + insert_rows(LessonProgress, columns, progress, plan.chunk_size)
+
+
+SEEDERS = {
+    "users": seed_users,
+    "categories": seed_categories,
+    "courses": seed_courses,
+    "lessons": seed_lessons,
+    "quizzes": seed_quizzes,
+    "enrollments": seed_enrollments,
+}
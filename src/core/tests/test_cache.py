@@ -0,0 +1,37 @@
+"""
+Test cases for the cache configuration checks.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from config import gunicorn
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+REDIS = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://cache:6379/1"}}
+
+
+class CacheCheckTestCase(SimpleTestCase):
+    """
+    Cache configuration check test cases.
+    """
+
+    @override_settings(CACHES=LOCMEM)
+    def test_several_workers_refuse_a_process_local_cache(self):
+        """
+        Test gunicorn refuses to start several workers on a memory cache, but not a single one.
+        """
+        with pytest.raises(ImproperlyConfigured, match="3 gunicorn workers"):
+            gunicorn.on_starting(SimpleNamespace(cfg=SimpleNamespace(workers=3)))
+
+        gunicorn.on_starting(SimpleNamespace(cfg=SimpleNamespace(workers=1)))
+
+    @override_settings(CACHES=REDIS)
+    def test_several_workers_start_on_a_shared_cache(self):
+        """
+        Test gunicorn starts several workers on a shared cache.
+        """
+        gunicorn.on_starting(SimpleNamespace(cfg=SimpleNamespace(workers=3)))
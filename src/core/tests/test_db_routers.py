@@ -0,0 +1,84 @@
+"""
+Test cases for the read replica router.
+"""
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from core.constants import UserRole
+from core.db_routers import is_pinned_to_primary, pin_to_primary
+from core.tests import BaseAPITestCase
+from courses.apis import CourseViewSet
+from courses.factories import CategoryFactory, CourseFactory
+from courses.models import Course
+
+
+@override_settings(DATABASE_READ_REPLICAS=["replica"])
+class ReplicaRouterTestCase(BaseAPITestCase):
+    """
+    Read replica routing test cases.
+
+    The replica is a second, empty SQLite database, so a read served by the replica
+    does not see the rows written to the primary.
+    """
+
+    resource = CourseViewSet
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        """
+        Set up an instructor and a course on the primary.
+        """
+        super().setUp()
+        cache.clear()
+
+        self.instructor = self.make_user(role=UserRole.INSTRUCTOR.value)
+        self.category = CategoryFactory()
+        self.course = CourseFactory(instructor=self.instructor, category=self.category)
+        self.set_authenticate(self.instructor)
+
+    def test_list_reads_from_replica(self):
+        """
+        Should serve the list action from the replica.
+        """
+        response = self.get_json_ok()
+
+        assert response.data["data"] == []
+
+    def test_retrieve_reads_from_replica(self):
+        """
+        Should serve the retrieve action from the replica.
+        """
+        self.get_json_not_found(fragment=f"{self.course.id}")
+
+    def test_write_goes_to_primary_and_pins_the_user(self):
+        """
+        Should write to the primary and read the user's own write right after it.
+        """
+        payload = {"title": "New Course", "description": "New Description", "category": self.category.id}
+
+        self.post_json_created(data=payload)
+
+        assert Course.objects.using("default").filter(title="New Course").exists()
+        assert is_pinned_to_primary(self.instructor)
+
+        response = self.get_json_ok()
+        assert {course["title"] for course in response.data["data"]} == {self.course.title, "New Course"}
+
+    def test_pin_is_per_user(self):
+        """
+        Should keep serving other users from the replica.
+        """
+        pin_to_primary(self.make_user())
+
+        response = self.get_json_ok()
+
+        assert response.data["data"] == []
+
+    def test_failed_write_does_not_pin(self):
+        """
+        Should not pin the user when the write fails.
+        """
+        self.post_json_bad_request(data={"title": self.course.title, "category": self.category.id})
+
+        assert not is_pinned_to_primary(self.instructor)
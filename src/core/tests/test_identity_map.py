@@ -0,0 +1,160 @@
+"""
+Test cases for the request-scoped identity map.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import TestCase
+
+from core.constants import UserRole
+from core.exception import CourseException
+from core.identity_map import identity_map_scope, memoize
+from core.tests import BaseAPITestCase
+from courses.factories import CategoryFactory, CourseFactory
+from courses.models import Course, Enrollment
+from courses.services import CourseService, EnrollmentService
+from lessons.apis import LessonViewSet
+from lessons.factories import LessonFactory
+from lessons.models import Lesson
+from lessons.services import LessonService
+from users.factories import UserFactory
+
+
+class IdentityMapTestCase(TestCase):
+    """
+    Identity map test cases.
+    """
+
+    def setUp(self):
+        """
+        Set up a course and the services.
+        """
+        self.instructor = UserFactory(role=UserRole.INSTRUCTOR.value)
+        self.student = UserFactory(role=UserRole.STUDENT.value)
+        self.course = CourseFactory(instructor=self.instructor, category=CategoryFactory())
+        self.course_service = CourseService()
+        self.enrollment_service = EnrollmentService()
+
+    def test_no_scope_always_queries(self):
+        """
+        Test that lookups outside of a scope go to the database.
+        """
+        with self.assertNumQueries(2):
+            self.course_service.get_course(self.course.id)
+            self.course_service.get_course(self.course.id)
+
+    def test_scope_queries_once(self):
+        """
+        Test that repeated lookups in a scope run a single query.
+        """
+        with identity_map_scope(), self.assertNumQueries(1):
+            course = self.course_service.get_course(self.course.id)
+            assert self.course_service.get_course(str(self.course.id)) is course
+
+    def test_lesson_course_is_shared(self):
+        """
+        Test that the course of a lesson is the one later course lookups get.
+        """
+        lesson = Lesson.objects.select_related("course").get(id=LessonFactory(course=self.course).id)
+
+        with identity_map_scope(), self.assertNumQueries(0):
+            course = LessonService().get_course(lesson)
+            assert self.course_service.get_course(self.course.id) is course
+
+    def test_scope_memoizes_missing_enrollment(self):
+        """
+        Test that a lookup which found nothing is memoized too.
+        """
+        with identity_map_scope(), self.assertNumQueries(1):
+            assert self.enrollment_service.find(self.course.id, self.student.id) is None
+            assert self.enrollment_service.find(self.course.id, self.student.id) is None
+
+    def test_scope_does_not_memoize_errors(self):
+        """
+        Test that a failed lookup raises every time.
+        """
+        with identity_map_scope():
+            for _ in range(2):
+                with self.assertRaises(CourseException):
+                    self.course_service.get_course("00000000-0000-0000-0000-000000000000")
+
+    def test_save_invalidates(self):
+        """
+        Test that creating an enrollment drops the memoized lookups.
+        """
+        with identity_map_scope():
+            assert self.enrollment_service.find(self.course.id, self.student.id) is None
+
+            enrollment = self.enrollment_service.create(self.course, self.student)
+
+            assert self.enrollment_service.find(self.course.id, self.student.id) == enrollment
+
+    def test_delete_invalidates(self):
+        """
+        Test that deleting a course drops the memoized lookups.
+        """
+        with identity_map_scope():
+            self.course_service.get_course(self.course.id)
+            Course.objects.get(id=self.course.id).delete()
+
+            with self.assertRaises(CourseException):
+                self.course_service.get_course(self.course.id)
+
+    def test_scope_is_dropped(self):
+        """
+        Test that the map does not outlive its scope.
+        """
+        with identity_map_scope():
+            self.course_service.get_course(self.course.id)
+
+        with identity_map_scope(), self.assertNumQueries(1):
+            self.course_service.get_course(self.course.id)
+
+    def test_threads_have_their_own_map(self):
+        """
+        Test that a scope is not shared with other threads.
+        """
+
+        def load(value):
+            with identity_map_scope():
+                return [memoize(Course, "key", lambda: value) for _ in range(2)]
+
+        with identity_map_scope():
+            memoize(Course, "key", lambda: "main")
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(load, ["first", "second"]))
+
+            assert results == [["first", "first"], ["second", "second"]]
+            assert memoize(Course, "key", lambda: "other") == "main"
+
+
+class IdentityMapAPITestCase(BaseAPITestCase):
+    """
+    Identity map test cases through the API.
+    """
+
+    resource = LessonViewSet
+
+    def setUp(self):
+        """
+        Set up an enrolled student.
+        """
+        super().setUp()
+
+        self.student = self.make_user(role=UserRole.STUDENT.value)
+        self.instructor = self.make_user(role=UserRole.INSTRUCTOR.value)
+        self.course = CourseFactory(instructor=self.instructor, category=CategoryFactory())
+        self.lessons = LessonFactory.create_batch(2, course=self.course)
+        Enrollment.objects.create(course=self.course, student=self.student)
+
+        self.set_authenticate(self.student)
+
+    def test_complete_lesson_sees_its_own_writes(self):
+        """
+        Test that the course completion reads the enrollment updated in the same request.
+        """
+        for lesson in self.lessons:
+            self.post_json_ok(fragment=f"{lesson.id}/complete")
+
+        assert Enrollment.objects.get(course=self.course, student=self.student).completed
@@ -0,0 +1,165 @@
+"""
+Test cases for the API latency metrics.
+"""
+
+import gc
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from core.constants import UserRole
+from core.metrics import ARCHIVE_KEY, BUCKETS, LOCK_KEY, Histogram, archive, collect, export, histogram
+from core.tests import BaseAPITestCase
+from courses.apis import CourseViewSet
+from courses.factories import CategoryFactory, CourseFactory
+
+
+class HistogramTestCase(SimpleTestCase):
+    """
+    Test case for the sharded histogram.
+    """
+
+    def test_observe(self):
+        """
+        Should count the values in their bucket and merge the thread shards.
+        """
+        metric = Histogram()
+        labels = ("courses", "list", "total")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda value: metric.observe(labels, value), [0.001, 0.02, 0.02, 20.0]))
+
+        values = metric.snapshot()[labels]
+        assert values[0] == 1
+        assert values[BUCKETS.index(0.025)] == 2
+        assert values[len(BUCKETS)] == 1
+        assert round(values[-1], 6) == 20.041
+
+    def test_finished_threads_are_retired(self):
+        """
+        Should fold the shards of finished threads into the retired totals.
+        """
+        metric = Histogram()
+        labels = ("courses", "list", "total")
+
+        threads = [threading.Thread(target=metric.observe, args=(labels, 0.001)) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+            thread.join()
+        del threads, thread
+        gc.collect()
+
+        assert metric.snapshot()[labels][0] == 50
+        assert metric.shards == []
+
+    def test_export(self):
+        """
+        Should render cumulative buckets in the Prometheus text format.
+        """
+        metric = Histogram()
+        metric.observe(("courses", "list", "total"), 0.02)
+        metric.observe(("courses", "list", "total"), 0.2)
+
+        text = export(metric.snapshot())
+
+        assert "# TYPE api_request_duration_seconds histogram" in text
+        labels = 'resource="courses",action="list",phase="total"'
+        assert f'api_request_duration_seconds_bucket{{{labels},le="0.01"}} 0\n' in text
+        assert f'api_request_duration_seconds_bucket{{{labels},le="0.025"}} 1\n' in text
+        assert f'api_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2\n' in text
+        assert f"api_request_duration_seconds_count{{{labels}}} 2\n" in text
+
+
+class MetricsAPITestCase(BaseAPITestCase):
+    """
+    Test case for the recording of the API requests and the metrics endpoint.
+    """
+
+    resource = CourseViewSet
+
+    def setUp(self):
+        """
+        Start from empty metrics.
+        """
+        super().setUp()
+        cache.clear()
+        histogram.clear()
+
+        self.instructor = self.make_user(role=UserRole.INSTRUCTOR.value)
+        CourseFactory(instructor=self.instructor, category=CategoryFactory())
+        self.set_authenticate(self.instructor)
+
+    def test_request_is_recorded(self):
+        """
+        Should record every phase of the request.
+        """
+        self.get_json_ok()
+
+        snapshot = histogram.snapshot()
+        for phase in ("total", "queryset", "serialization", "render"):
+            assert sum(snapshot[("courses", "list", phase)][:-1]) == 1
+
+        total, queryset, render = (
+            snapshot[("courses", "list", phase)][-1] for phase in ("total", "queryset", "render")
+        )
+        assert 0 < queryset < total
+        assert 0 < render < total
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_recording_disabled(self):
+        """
+        Should not record anything when the metrics are disabled.
+        """
+        self.get_json_ok()
+
+        assert histogram.snapshot() == {}
+
+    def test_archive_keeps_totals(self):
+        """
+        Should keep the totals of a recycled worker.
+        """
+        self.get_json_ok()
+        archive()
+        self.get_json_ok()
+
+        assert sum(collect()[("courses", "list", "total")][:-1]) == 2
+
+    def test_archive_without_lock_keeps_totals(self):
+        """
+        Should neither archive nor release the lock of another process when the lock is busy.
+        """
+        self.get_json_ok()
+        cache.set(LOCK_KEY, "other", None)
+        with patch("core.metrics.time.monotonic", side_effect=itertools.count(0, 10)):
+            archive()
+
+        assert cache.get(LOCK_KEY) == "other"
+        assert cache.get(ARCHIVE_KEY) is None
+        cache.delete(LOCK_KEY)
+        assert sum(collect()[("courses", "list", "total")][:-1]) == 1
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_endpoint(self):
+        """
+        Should serve the metrics to the scrapers presenting the token.
+        """
+        self.get_json_ok()
+
+        assert self.client.get("/metrics").status_code == 401
+        assert self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code == 401
+
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == 200
+        assert b'api_request_duration_seconds_count{resource="courses",action="list",phase="total"} 1' in (
+            response.content
+        )
+
+    def test_metrics_endpoint_disabled(self):
+        """
+        Should not exist without a token.
+        """
+        assert self.client.get("/metrics").status_code == 404
@@ -0,0 +1,96 @@
+"""
+Test cases for the precomputed OpenAPI schema.
+"""
+
+import tempfile
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from core.openapi import get_schema_version, load_schema
+
+
+class BuildSchemaCommandTestCase(SimpleTestCase):
+    """
+    Test case for the build_schema command.
+    """
+
+    def test_schema_is_up_to_date(self):
+        """
+        Should match the committed schema, run `python manage.py build_schema` when it fails.
+        """
+        call_command("build_schema", "--check")
+
+
+class OpenAPISchemaViewTestCase(SimpleTestCase):
+    """
+    Test case for OpenAPISchemaView.
+    """
+
+    url = "/api/v1/docs/schema/"
+
+    def setUp(self):
+        """
+        Set up a precomputed schema file.
+        """
+        super().setUp()
+        self.content = b'{"openapi": "3.0.3"}\n'
+        self.version = get_schema_version(self.content)
+
+        schema_dir = self.enterContext(tempfile.TemporaryDirectory())
+        schema_file = f"{schema_dir}/schema.json"
+        with open(schema_file, "wb") as file:
+            file.write(self.content)
+
+        self.enterContext(override_settings(OPENAPI_SCHEMA_FILE=schema_file, OPENAPI_SCHEMA_STATIC=True))
+        load_schema.cache_clear()
+        self.addCleanup(load_schema.cache_clear)
+
+    def test_versioned_url_is_cached_forever(self):
+        """
+        Should serve the current version with long-lived cache headers.
+        """
+        response = self.client.get(self.url, {"v": self.version})
+
+        assert response.status_code == 200
+        assert response.content == self.content
+        assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert response["ETag"] == f'"{self.version}"'
+
+    def test_unversioned_url_revalidates(self):
+        """
+        Should make clients revalidate when the URL is not versioned.
+        """
+        response = self.client.get(self.url)
+
+        assert response.status_code == 200
+        assert response["Cache-Control"] == "no-cache"
+
+    def test_not_modified(self):
+        """
+        Should answer 304 when the client has the current version.
+        """
+        response = self.client.get(self.url, headers={"If-None-Match": f'"{self.version}"'})
+
+        assert response.status_code == 304
+
+    def test_docs_link_versioned_url(self):
+        """
+        Should point the docs UIs to the versioned schema URL.
+        """
+        response = self.client.get("/api/v1/docs/redoc/")
+
+        assert f"{self.url}?v={self.version}".encode() in response.content
+
+    @override_settings(OPENAPI_SCHEMA_STATIC=False)
+    def test_generate_when_disabled(self):
+        """
+        Should generate the schema when the precomputed schema is disabled.
+        """
+        load_schema.cache_clear()
+
+        response = self.client.get(self.url, {"format": "json"})
+
+        assert response.status_code == 200
+        assert "ETag" not in response
+        assert response.json()["info"]["title"] == "E learning API"
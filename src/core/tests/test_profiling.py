@@ -0,0 +1,142 @@
+"""
+Test cases for the sampling request profiler.
+"""
+
+import tempfile
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.profiling import Sampler, get_profile, list_profiles, save_profile, to_folded
+
+
+def busy_wait(seconds: float) -> None:
+    """
+    Keep the thread busy for `seconds`.
+    """
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class SamplerTestCase(SimpleTestCase):
+    """
+    Test case for the stack sampler.
+    """
+
+    def test_sample_thread(self):
+        """
+        Should record the stacks of the sampled thread, root first.
+        """
+        sampler = Sampler(threading.get_ident(), 0.001)
+        sampler.start()
+        busy_wait(0.05)
+        sampler.stop()
+
+        assert sampler.stacks
+        stack = sampler.stacks.most_common(1)[0][0]
+        assert stack.split(";")[-1].startswith("busy_wait (core/tests/test_profiling.py:")
+        assert "SamplerTestCase.test_sample_thread" in stack
+
+    def test_to_folded(self):
+        """
+        Should render one line per stack, most sampled first.
+        """
+        assert to_folded({"stacks": {"main;a": 1, "main;b": 3}}) == "main;b 3\nmain;a 1\n"
+
+
+@override_settings(PROFILER_TOKEN="secret", PROFILER_SAMPLE_RATE=0.0, PROFILER_INTERVAL=0.001)
+class ProfilerMiddlewareTestCase(TestCase):
+    """
+    Test case for the profiler middleware and the profiles command.
+    """
+
+    url = "/api/v1/courses/"
+
+    def setUp(self):
+        """
+        Start without profiles.
+        """
+        cache.clear()
+
+    def test_not_profiled(self):
+        """
+        Should not profile requests which are not sampled.
+        """
+        response = self.client.get(self.url, HTTP_X_PROFILE="wrong")
+
+        assert "X-Profile-ID" not in response
+        assert list_profiles() == []
+
+    @override_settings(PROFILER_SAMPLE_RATE=1.0)
+    def test_sampled(self):
+        """
+        Should profile the sampled requests.
+        """
+        response = self.client.get(self.url)
+
+        profile = get_profile(response["X-Profile-ID"])
+        assert profile["path"] == self.url
+        assert profile["status"] == 200
+
+    def test_debug_header(self):
+        """
+        Should profile the requests sending the token, keeping their request ID as metadata.
+        """
+        first = self.client.get(self.url, HTTP_X_PROFILE="secret", HTTP_X_REQUEST_ID="req-1")
+        second = self.client.get(self.url, HTTP_X_PROFILE="secret", HTTP_X_REQUEST_ID="req-1")
+        assert len({first["X-Profile-ID"], second["X-Profile-ID"], "req-1"}) == 3
+        assert get_profile("req-1") is None
+        for response in [first, second]:
+            profile = get_profile(response["X-Profile-ID"])
+            assert (profile["method"], profile["request_id"]) == ("GET", "req-1")
+
+        response = self.client.get(self.url, HTTP_X_PROFILE="secret", HTTP_X_REQUEST_ID="bad id;")
+        assert get_profile(response["X-Profile-ID"])["request_id"] == ""
+
+    @override_settings(PROFILER_MAX_PROFILES=2)
+    def test_retention(self):
+        """
+        Should only list the newest profiles.
+        """
+        for index in range(3):
+            save_profile({"id": f"req-{index}", "stacks": {}})
+
+        assert [profile["id"] for profile in list_profiles()] == ["req-2", "req-1"]
+        assert get_profile("req-0") is None
+
+        save_profile({"id": "req-1", "stacks": {"main": 1}})
+        save_profile({"id": "req-3", "stacks": {}})
+        assert [profile["id"] for profile in list_profiles()] == ["req-3", "req-1"]
+        assert get_profile("req-1") == {"id": "req-1", "stacks": {"main": 1}}
+
+    def test_command(self):
+        """
+        Should list and export the profiles.
+        """
+        response = self.client.get(self.url, HTTP_X_PROFILE="secret", HTTP_X_REQUEST_ID="req-1")
+        profile_id = response["X-Profile-ID"]
+        save_profile({**get_profile(profile_id), "stacks": {"main;handler": 2}})
+
+        stdout = StringIO()
+        call_command("profiles", "list", stdout=stdout)
+        assert profile_id in stdout.getvalue()
+        assert f"GET {self.url}  req-1" in stdout.getvalue()
+
+        stdout = StringIO()
+        call_command("profiles", "export", profile_id, stdout=stdout)
+        assert stdout.getvalue() == "main;handler 2\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "profile.txt"
+            call_command("profiles", "export", profile_id, "-o", str(output), stdout=StringIO())
+            assert output.read_text() == "main;handler 2\n"
+
+        with self.assertRaises(CommandError):
+            call_command("profiles", "export", "missing")
@@ -0,0 +1,78 @@
+"""
+Test cases for the orjson renderer and parser.
+"""
+
+import io
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    """
+    Test case for ORJSONRenderer.
+    """
+
+    def setUp(self):
+        """
+        Set up the renderer.
+        """
+        self.renderer = ORJSONRenderer()
+
+    def test_render_native_types(self):
+        """
+        Should render UUID, Decimal, datetime and timedelta values.
+        """
+        value = uuid.uuid4()
+        data = {
+            "id": value,
+            "score": Decimal("87.50"),
+            "submitted_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "total_minutes": timedelta(minutes=90),
+        }
+
+        content = self.renderer.render(data, "application/json")
+
+        expected = f'{{"id":"{value}","score":87.5,"submitted_at":"2025-01-02T03:04:05Z","total_minutes":"5400.0"}}'
+        assert content == expected.encode()
+
+    def test_render_none(self):
+        """
+        Should render an empty body for None.
+        """
+        assert self.renderer.render(None) == b""
+
+    def test_render_with_indent(self):
+        """
+        Should indent the output when requested by the Accept header.
+        """
+        content = self.renderer.render({"a": 1}, "application/json; indent=4")
+
+        assert content == b'{\n  "a": 1\n}'
+
+
+class ORJSONParserTestCase(SimpleTestCase):
+    """
+    Test case for ORJSONParser.
+    """
+
+    def test_parse(self):
+        """
+        Should parse a JSON body.
+        """
+        data = ORJSONParser().parse(io.BytesIO(b'{"answers": [{"question_id": "1"}]}'))
+
+        assert data == {"answers": [{"question_id": "1"}]}
+
+    def test_parse_invalid_json(self):
+        """
+        Should raise ParseError on malformed JSON.
+        """
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"answers": '))
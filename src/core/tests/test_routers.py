@@ -0,0 +1,50 @@
+"""
+Test cases for the lazy API router.
+"""
+
+from importlib import import_module
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.urls import URLResolver, reverse
+
+from core.routers import LazyRouter
+
+
+class LazyRouterTestCase(SimpleTestCase):
+    """
+    Test case for LazyRouter.
+    """
+
+    def test_routes_match_api_apps(self):
+        """
+        Should register every viewset listed in the `apps` of the API modules.
+        """
+        viewsets = set()
+        for api_app in settings.API_APPS:
+            api_module = import_module(f"{api_app}.apis")
+            for viewset in api_module.apps:
+                viewsets.add((viewset.resource_name, f"{viewset.__module__}.{viewset.__name__}"))
+
+        assert set(settings.API_ROUTES) == viewsets
+
+    def test_viewset_is_imported_on_first_resolve(self):
+        """
+        Should build the URLs without importing the viewset module.
+        """
+        router = LazyRouter()
+        router.register("missing", "core.tests.missing_module.MissingViewSet")
+
+        resolver = next(url for url in router.urls if isinstance(url, URLResolver))
+
+        with self.assertRaises(ModuleNotFoundError):
+            resolver.url_patterns
+
+    def test_url_names(self):
+        """
+        Should keep the URL names of the DRF routers.
+        """
+        assert reverse("courses-list") == "/api/v1/courses/"
+        assert reverse("courses-detail", kwargs={"pk": 1}) == "/api/v1/courses/1/"
+        assert reverse("lessons-complete-lesson", kwargs={"pk": 1}) == "/api/v1/lessons/1/complete/"
+        assert reverse("dashboard-recent-classes") == "/api/v1/dashboard/recent-classes/"
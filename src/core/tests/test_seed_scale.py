@@ -0,0 +1,102 @@
+"""
+Test cases for the synthetic dataset generator.
+"""
+
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
+from django.test import TestCase
+
+from core.constants import UserRole
+from courses.models import Category, Course, Enrollment
+from lessons.models import Lesson, LessonProgress
+from quizzes.models import Question, Quiz
+from users.models import User
+
+VOLUMES = {
+    "users": 60,
+    "instructors": 5,
+    "categories": 3,
+    "courses": 12,
+    "lessons": 4,
+    "quizzes": 1,
+    "questions": 3,
+    "enrollments": 150,
+    "progress": 600,
+    "chunk_size": 16,
+    "workers": 1,
+    "end_date": date(2026, 6, 30),
+}
+
+
+def seed_scale(**options):
+    """
+    Run the command with the test volumes.
+    """
+    call_command("seed_scale", stdout=StringIO(), **{**VOLUMES, **options})
+
+
+class SeedScaleTestCase(TestCase):
+    """
+    Test case for the seed_scale command.
+    """
+
+    def test_volumes(self):
+        """
+        Should create the requested volumes, skewed towards the popular courses.
+        """
+        seed_scale()
+
+        assert User.objects.count() == 60
+        assert User.objects.filter(role=UserRole.INSTRUCTOR.value).count() == 5
+        assert Category.objects.count() == 3
+        assert Course.objects.count() == 12
+        assert Quiz.objects.count() == 12
+        assert Question.objects.count() == 36
+        assert Enrollment.objects.count() == 150
+        assert LessonProgress.objects.count() == 600
+        assert Lesson.objects.count() >= 12
+
+        enrollments = list(Course.objects.annotate(total=Count("enrollments")).values_list("total", flat=True))
+        assert max(enrollments) > 2 * sorted(enrollments)[len(enrollments) // 2]
+
+        progress = LessonProgress.objects.select_related("lesson").first()
+        assert Enrollment.objects.filter(student=progress.user_id, course=progress.lesson.course_id).exists()
+
+    def test_deterministic(self):
+        """
+        Should generate the same rows from the same seed.
+        """
+
+        def snapshot():
+            return (
+                set(Enrollment.objects.values_list("id", "student_id", "course__title", "completed")),
+                set(LessonProgress.objects.values_list("user_id", "lesson_id", "status", "time_spent", "date")),
+            )
+
+        seed_scale(seed=7)
+        first = snapshot()
+        User.objects.all().delete()
+        Category.objects.all().delete()
+
+        seed_scale(seed=7)
+        assert snapshot() == first
+
+        seed_scale(seed=8)
+        assert Enrollment.objects.count() == 300
+
+    def test_invalid_options(self):
+        """
+        Should refuse inconsistent volumes and an existing seed.
+        """
+        with self.assertRaises(CommandError):
+            seed_scale(enrollments=10_000)
+        with self.assertRaises(CommandError):
+            seed_scale(lessons=0)
+
+        seed_scale(seed=7)
+        with self.assertRaises(CommandError):
+            seed_scale(seed=7)
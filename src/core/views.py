@@ -0,0 +1,73 @@
+"""
+Core views.
+"""
+
+import secrets
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseNotModified
+from django.views import View
+
+from core.metrics import collect, export
+from core.openapi import load_schema
+
+# One year, the maximum value browsers honour.
+SCHEMA_MAX_AGE = 365 * 24 * 60 * 60
+
+
+class OpenAPISchemaView(View):
+    """
+    Serve the precomputed OpenAPI schema.
+
+    A request for the current version (`?v=<version>`, as linked by the docs UIs)
+    is cacheable forever, other requests revalidate with the ETag. Without a
+    precomputed schema the schema is generated by drf-spectacular.
+    """
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Return the schema.
+        """
+        schema = load_schema()
+        if schema is None:
+            from drf_spectacular.views import SpectacularAPIView
+
+            return SpectacularAPIView.as_view()(request, *args, **kwargs)
+
+        content, version = schema
+        etag = f'"{version}"'
+        if request.GET.get("v") == version:
+            cache_control = f"public, max-age={SCHEMA_MAX_AGE}, immutable"
+        else:
+            cache_control = "no-cache"
+
+        if request.headers.get("If-None-Match") == etag:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type="application/vnd.oai.openapi+json")
+
+        response["ETag"] = etag
+        response["Cache-Control"] = cache_control
+        return response
+
+
+class MetricsView(View):
+    """
+    Serve the API metrics in the Prometheus text format.
+
+    Scrapers authenticate with `Authorization: Bearer <METRICS_TOKEN>`, the endpoint
+    does not exist when no token is configured.
+    """
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Return the metrics of every process.
+        """
+        token = settings.METRICS_TOKEN
+        if not token:
+            raise Http404
+
+        if not secrets.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+            return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+
+        return HttpResponse(export(collect()), content_type="text/plain; version=0.0.4; charset=utf-8")
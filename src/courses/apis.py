@@ -12,7 +12,7 @@ from rest_framework.response import Response
 
 from core.apis import BaseAPIViewSet
 from core.paginations import CustomPagination
-from core.schema import base_responses, build_query_parameters
+from core.schema import base_responses, build_query_parameters, build_sparse_fieldset_parameters
 from courses.filters import CourseFilter
 from courses.models import Course
 from courses.permissions import IsCourseOwner, IsInstructor, IsStudent
@@ -22,13 +22,14 @@ from courses.serializers import (
     CourseSerializer,
     CourseStatusUpdateSerializer,
     CourseUpdateSerializer,
+    CourseValuesSerializer,
     EnrollmentRequestSerializer,
     EnrollmentSerializer,
-    EnrollmentStudentSerializer,
-    MyEnrollmentSerializer,
+    EnrollmentStudentValuesSerializer,
+    MyEnrollmentValuesSerializer,
 )
 from courses.services import CourseService, EnrollmentService
-from lessons.serializers import LessonSerializer
+from lessons.serializers import LessonValuesSerializer
 from lessons.services import LessonService
 
 
@@ -45,6 +46,7 @@ class CourseViewSet(BaseAPIViewSet, viewsets.ModelViewSet):
     filterset_class = CourseFilter
     search_fields = ["title", "category__name"]
     permission_classes = [IsAuthenticatedOrReadOnly]
+    replica_actions = ("list", "retrieve", "students", "lessons")
 
     def __init__(self, **kwargs):
         """
@@ -64,14 +66,22 @@ class CourseViewSet(BaseAPIViewSet, viewsets.ModelViewSet):
         return super().get_permissions()
 
     @extend_schema(
-        parameters=build_query_parameters(CourseParamSerializer),
-        responses={**base_responses, 200: CourseSerializer(many=True)},
+        parameters=[
+            *build_query_parameters(CourseParamSerializer),
+            *build_sparse_fieldset_parameters(CourseValuesSerializer),
+        ],
+        responses={**base_responses, 200: CourseValuesSerializer(many=True)},
     )
     def list(self, request: Request, *args, **kwargs) -> Response:
         """
         List all courses with optional filters.
         """
-        return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+
+        sparse = self.get_sparse_fieldset(CourseValuesSerializer)
+        page = self.paginate_queryset(CourseValuesSerializer.project(queryset, **sparse))
+        serializer = CourseValuesSerializer(page, many=True, **sparse)
+        return self.get_paginated_response(serializer.data)
 
     @extend_schema(request=CourseRequestSerializer, responses={**base_responses, 201: CourseSerializer})
     def create(self, request: Request, *args, **kwargs) -> Response:
@@ -142,7 +152,10 @@ class CourseViewSet(BaseAPIViewSet, viewsets.ModelViewSet):
         serializer = self.get_serializer(course)
         return self.response_ok(data=serializer.data)
 
-    @extend_schema(responses={**base_responses, 200: EnrollmentStudentSerializer(many=True)})
+    @extend_schema(
+        parameters=build_sparse_fieldset_parameters(EnrollmentStudentValuesSerializer),
+        responses={**base_responses, 200: EnrollmentStudentValuesSerializer(many=True)},
+    )
     @action(
         detail=True,
         methods=["get"],
@@ -156,13 +169,15 @@ class CourseViewSet(BaseAPIViewSet, viewsets.ModelViewSet):
         course = self.get_object()
 
         enrollments = self.enrollment_service.list_enrollment_specific_course(course)
-        page = self.paginate_queryset(enrollments)
-        serializer = EnrollmentStudentSerializer(page, many=True)
+        sparse = self.get_sparse_fieldset(EnrollmentStudentValuesSerializer)
+        page = self.paginate_queryset(EnrollmentStudentValuesSerializer.project(enrollments, **sparse))
+        serializer = EnrollmentStudentValuesSerializer(page, many=True, **sparse)
 
         return self.get_paginated_response(serializer.data)
 
     @extend_schema(
-        responses={**base_responses, 200: LessonSerializer(many=True)},
+        parameters=build_sparse_fieldset_parameters(LessonValuesSerializer),
+        responses={**base_responses, 200: LessonValuesSerializer(many=True)},
     )
     @action(detail=True, methods=["get"], url_path="lessons")
     def lessons(self, request: Request, *args, **kwargs) -> Response:
@@ -181,8 +196,9 @@ class CourseViewSet(BaseAPIViewSet, viewsets.ModelViewSet):
         if title:
             queryset = queryset.filter(title__icontains=title)
 
-        page = self.paginate_queryset(queryset)
-        serializer = LessonSerializer(page, many=True)
+        sparse = self.get_sparse_fieldset(LessonValuesSerializer)
+        page = self.paginate_queryset(LessonValuesSerializer.project(queryset, **sparse))
+        serializer = LessonValuesSerializer(page, many=True, **sparse)
         return self.get_paginated_response(serializer.data)
 
 
@@ -192,6 +208,7 @@ class EnrollmentViewSet(BaseAPIViewSet):
     """
 
     resource_name = "enrollments"
+    replica_actions = ("my_enrollments",)
     pagination_class = CustomPagination
     permission_classes = [IsStudent]
 
@@ -226,15 +243,19 @@ class EnrollmentViewSet(BaseAPIViewSet):
         response_data = EnrollmentSerializer(enrollment).data
         return self.response_created(data=response_data)
 
-    @extend_schema(responses={**base_responses, 200: MyEnrollmentSerializer(many=True)})
+    @extend_schema(
+        parameters=build_sparse_fieldset_parameters(MyEnrollmentValuesSerializer),
+        responses={**base_responses, 200: MyEnrollmentValuesSerializer(many=True)},
+    )
     @action(detail=False, methods=["get"], url_path="me")
     def my_enrollments(self, request):
         """
         List all enrollments for the authenticated user.
         """
         enrollments = self.enrollment_service.list(request.user)
-        page = self.paginate_queryset(enrollments)
-        serializer = MyEnrollmentSerializer(page, many=True)
+        sparse = self.get_sparse_fieldset(MyEnrollmentValuesSerializer)
+        page = self.paginate_queryset(MyEnrollmentValuesSerializer.project(enrollments, **sparse))
+        serializer = MyEnrollmentValuesSerializer(page, many=True, **sparse)
         return self.get_paginated_response(serializer.data)
 
 
@@ -5,7 +5,7 @@ Permissions for the courses app.
 from rest_framework.permissions import BasePermission
 
 from core.constants import UserRole
-from courses.models import Course
+from courses.services import CourseService
 
 
 class IsInstructor(BasePermission):
@@ -58,9 +58,9 @@ class IsEntityCourseOwner(BasePermission):
             if not course_id:
                 return False
 
-            course = Course.objects.get(id=course_id)
+            course = CourseService().get_course(course_id)
 
-            return course.instructor == request.user
+            return course.instructor_id == request.user.id
 
         return request.user.is_authenticated
 
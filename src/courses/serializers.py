@@ -7,7 +7,7 @@ from rest_framework import serializers
 from core.constants import CourseStatus
 from core.exception import CourseErrorMessage
 from core.mixins import PaginationParamSerializerMixin
-from core.serializers import BaseSerializer
+from core.serializers import BaseSerializer, ValuesSerializer
 from courses.models import Course, Enrollment
 
 
@@ -36,6 +36,44 @@ class CourseSerializer(serializers.ModelSerializer):
         return value
 
 
+class CourseInstructorValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for the instructor of a course, used on `?expand=instructor`.
+    """
+
+    id = serializers.UUIDField()
+    first_name = serializers.CharField()
+    last_name = serializers.CharField()
+
+
+class CourseCategoryValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for the category of a course, used on `?expand=category`.
+    """
+
+    id = serializers.UUIDField()
+    name = serializers.CharField()
+
+
+class CourseValuesSerializer(ValuesSerializer):
+    """
+    Read-only course serializer for list endpoints, same output as CourseSerializer.
+    """
+
+    expandable_fields = {
+        "instructor": CourseInstructorValuesSerializer(),
+        "category": CourseCategoryValuesSerializer(allow_null=True),
+    }
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    description = serializers.CharField()
+    instructor = serializers.UUIDField(source="instructor_id")
+    category = serializers.UUIDField(source="category_id", allow_null=True)
+    created_at = serializers.DateTimeField()
+    status = serializers.ChoiceField(choices=CourseStatus.choices())
+
+
 class CourseRequestSerializer(serializers.ModelSerializer):
     """
     Serializer for course creation requests.
@@ -160,6 +198,26 @@ class MyEnrollmentSerializer(BaseSerializer):
         }
 
 
+class EnrollmentCourseValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for the course of an enrollment.
+    """
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    category = serializers.CharField(source="category.name", allow_null=True)
+
+
+class MyEnrollmentValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for the current user's enrollments, same output as MyEnrollmentSerializer.
+    """
+
+    id = serializers.CharField()
+    course = EnrollmentCourseValuesSerializer()
+    enrolled_at = serializers.DateTimeField()
+
+
 class EnrollmentStudentSerializer(BaseSerializer):
     """
     Serializer for enrolled students in a course.
@@ -181,3 +239,24 @@ class EnrollmentStudentSerializer(BaseSerializer):
             "name": f"{student.first_name} {student.last_name}".strip(),
             "email": student.email,
         }
+
+
+class EnrollmentStudentValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for enrolled students, same output as EnrollmentStudentSerializer.
+    """
+
+    student = serializers.SerializerMethodField()
+    enrolled_at = serializers.DateTimeField()
+
+    extra_values = ("student__id", "student__first_name", "student__last_name", "student__email")
+
+    def get_student(self, row: dict) -> dict:
+        """
+        Get student details from the enrollment row.
+        """
+        return {
+            "id": f"user_{row['student__id']}",
+            "name": f"{row['student__first_name']} {row['student__last_name']}".strip(),
+            "email": row["student__email"],
+        }
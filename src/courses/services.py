@@ -7,6 +7,7 @@ from rest_framework.exceptions import PermissionDenied
 from certificates.services import CertificateService
 from core.constants import CourseStatus, DailyProcessStatus
 from core.exception import CourseException, EnrollmentException
+from core.identity_map import forget, memoize
 from courses.models import Course, Enrollment
 from lessons.models import LessonProgress
 from users.models import User
@@ -23,9 +24,21 @@ class EnrollmentService:
 
         Raises an exception if the user is already enrolled.
         """
-        if Enrollment.objects.filter(course=course, student=user).exists():
+        if self.find(course.id, user.id):
             raise EnrollmentException(code="ALREADY_EXISTS")
 
+    def find(self, course_id, user_id) -> Enrollment | None:
+        """
+        Find the enrollment of a user in a course, memoized for the request.
+
+        Returns None if the user is not enrolled.
+        """
+        return memoize(
+            Enrollment,
+            (str(course_id), str(user_id)),
+            lambda: Enrollment.objects.filter(course_id=course_id, student_id=user_id).first(),
+        )
+
     def create(self, course: Course, user: User) -> Enrollment:
         """
         Create a new enrollment for the user in the specified course.
@@ -53,10 +66,11 @@ class EnrollmentService:
 
         Raises an exception if the enrollment does not exist.
         """
-        try:
-            return Enrollment.objects.get(course_id=course_id, student_id=user_id)
-        except Enrollment.DoesNotExist as exc:
-            raise EnrollmentException(code="NOT_FOUND") from exc
+        enrollment = self.find(course_id, user_id)
+        if enrollment is None:
+            raise EnrollmentException(code="NOT_FOUND")
+
+        return enrollment
 
 
 class CourseService:
@@ -69,17 +83,22 @@ class CourseService:
         Initialize the CourseService with necessary dependencies.
         """
         self.certificate_service = CertificateService()
+        self.enrollment_service = EnrollmentService()
 
     def get_course(self, course_id: str) -> Course:
         """
-        Verify if the course exists by its ID.
+        Verify if the course exists by its ID, memoized for the request.
 
         Raises an exception if the course does not exist.
         """
-        try:
-            return Course.objects.get(id=course_id)
-        except Exception as exc:
-            raise CourseException(code="NOT_FOUND", developer_message=str(exc)) from exc
+
+        def load_course():
+            try:
+                return Course.objects.get(id=course_id)
+            except Exception as exc:
+                raise CourseException(code="NOT_FOUND", developer_message=str(exc)) from exc
+
+        return memoize(Course, str(course_id), load_course)
 
     def verify_course_status(self, course: Course) -> None:
         """
@@ -114,7 +133,7 @@ class CourseService:
         """
         Verify if a lesson enrolled for student access.
         """
-        if user != course.instructor and not Enrollment.objects.filter(course=course, student=user).exists():
+        if user.id != course.instructor_id and not self.enrollment_service.find(course.id, user.id):
             raise PermissionDenied("You do not have access to this lesson.")
 
     def check_and_mark_course_completion(self, user, course):
@@ -134,6 +153,8 @@ class CourseService:
 
         if total_lessons > 0 and total_lessons == completed_lessons:
             updated = Enrollment.objects.filter(student=user, course=course).update(completed=True)
+            # update() sends no signal, drop the memoized enrollments by hand
+            forget(Enrollment)
 
             if updated:
                 self.certificate_service.generate_certificate(user, course)
@@ -2,11 +2,21 @@
 Tests for the courses app.
 """
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from core.constants import CourseStatus, UserRole
+from core.renderers import ORJSONRenderer
 from core.tests import BaseAPITestCase
 from courses.apis import CourseViewSet
 from courses.factories import CategoryFactory, CourseFactory
 from courses.models import Course, Enrollment
+from courses.serializers import (
+    CourseSerializer,
+    CourseValuesSerializer,
+    EnrollmentStudentSerializer,
+    EnrollmentStudentValuesSerializer,
+)
 from lessons.factories import LessonFactory
 from users.models import User
 
@@ -249,3 +259,72 @@ class CourseAPITestCase(BaseAPITestCase):
         data = response.data["data"]
         assert len(data) == 1
         assert "Django Basics" in data[0]["title"]
+
+    def test_values_serializers_match_model_serializers(self):
+        """
+        Test the values() based serializers render the same output as the model serializers.
+        """
+        CourseFactory(instructor=self.instructor, category=None)
+        self.course.enrollments.create(student=self.make_user(role=UserRole.STUDENT.value))
+        renderer = ORJSONRenderer()
+
+        courses = Course.objects.order_by("id")
+        expected = CourseSerializer(courses, many=True).data
+        data = CourseValuesSerializer(CourseValuesSerializer.project(courses), many=True).data
+        assert renderer.render(data) == renderer.render(expected)
+
+        enrollments = self.course.enrollments.select_related("student")
+        expected = EnrollmentStudentSerializer(enrollments, many=True).data
+        rows = EnrollmentStudentValuesSerializer.project(enrollments)
+        data = EnrollmentStudentValuesSerializer(rows, many=True).data
+        assert renderer.render(data) == renderer.render(expected)
+
+    def test_list_courses_sparse_fields(self):
+        """
+        Test `?fields=` returns and selects only the requested fields.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_json_ok(fragment="?fields=id,title")
+
+        assert response.data["data"] == [{"id": self.course.id, "title": self.course.title}]
+        assert not any('"description"' in query["sql"] for query in queries.captured_queries)
+
+    def test_list_courses_expand(self):
+        """
+        Test `?expand=` nests the related instructor and category.
+        """
+        CourseFactory(instructor=self.instructor, category=None)
+
+        response = self.get_json_ok(fragment="?fields=id,category&expand=instructor,category")
+
+        data = sorted(response.data["data"], key=lambda course: course["id"])
+        assert data[0]["instructor"] == {
+            "id": str(self.instructor.id),
+            "first_name": self.instructor.first_name,
+            "last_name": self.instructor.last_name,
+        }
+        assert data[0]["category"] == {"id": str(self.course.category.id), "name": self.course.category.name}
+        assert data[1]["category"] is None
+        assert set(data[1]) == {"id", "instructor", "category"}
+
+    def test_list_courses_unknown_sparse_fields(self):
+        """
+        Test unknown fields and relations are rejected.
+        """
+        response = self.get_json_bad_request(fragment="?fields=id,secret")
+        assert response.status_code == 400
+
+        response = self.get_json_bad_request(fragment="?expand=status")
+        assert response.status_code == 400
+
+    def test_list_lessons_expand_course(self):
+        """
+        Test listing lessons with their course expanded.
+        """
+        lesson = LessonFactory(course=self.course)
+
+        response = self.get_json_ok(fragment=f"{self.course.id}/lessons/?fields=id&expand=course")
+
+        assert response.data["data"] == [
+            {"id": str(lesson.id), "course": {"id": self.course.id, "title": self.course.title}}
+        ]
@@ -7,6 +7,7 @@ from core.tests import BaseAPITestCase
 from courses.apis import EnrollmentViewSet
 from courses.factories import CategoryFactory, CourseFactory
 from courses.models import Enrollment
+from courses.serializers import MyEnrollmentSerializer
 
 
 class EnrollmentAPITestCase(BaseAPITestCase):
@@ -49,6 +50,7 @@ class EnrollmentAPITestCase(BaseAPITestCase):
 
         assert response.status_code == 200
         assert len(response.data["data"]) == 1
+        assert response.data["data"][0] == MyEnrollmentSerializer(self.enrollment).data
 
     def test_enroll_success(self):
         """
@@ -4,7 +4,6 @@ Dashboard APIs for managing and retrieving data related to the dashboard.
 
 # dashboard/views.py
 
-from django.db.models import Avg
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -12,18 +11,18 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from core.apis import BaseAPIViewSet
-from core.schema import base_responses
+from core.schema import base_responses, build_sparse_fieldset_parameters
 from courses.models import Enrollment
 from courses.permissions import IsStudent
 from dashboard.serializers import (
     AverageQuizScoreSerializer,
     CompletedCoursesSerializer,
     RecentClassSerializer,
-    RecentEnrolledCourseSerializer,
+    RecentEnrolledCourseValuesSerializer,
     TotalEnrolledCoursesSerializer,
 )
 from dashboard.services import DashboardService
-from quizzes.models import QuizSubmission
+from quizzes.services import QuizResultService
 
 
 class DashboardViewSet(BaseAPIViewSet):
@@ -33,6 +32,13 @@ class DashboardViewSet(BaseAPIViewSet):
 
     permission_classes = [IsAuthenticated, IsStudent]
     resource_name = "dashboard"
+    replica_actions = (
+        "total_enrolled_courses",
+        "completed_courses",
+        "average_quiz_score",
+        "recent_enrolled_courses",
+        "recent_classes",
+    )
 
     def __init__(self, **kwargs):
         """
@@ -40,6 +46,7 @@ class DashboardViewSet(BaseAPIViewSet):
         """
         super().__init__(**kwargs)
         self.dashboard_service = DashboardService()
+        self.quiz_result_service = QuizResultService()
 
     @extend_schema(responses={**base_responses, 200: TotalEnrolledCoursesSerializer})
     @action(detail=False, methods=["get"], url_path="total-enrolled-courses")
@@ -63,21 +70,28 @@ class DashboardViewSet(BaseAPIViewSet):
     @action(detail=False, methods=["get"], url_path="average-quiz-score")
     def average_quiz_score(self, request: Request) -> Response:
         """
-        Get the average quiz score for the student.
+        Get the average quiz score for the student, of all the submissions.
+
+        The running total is maintained on every submission, see `QuizResultService`.
         """
-        submissions = QuizSubmission.objects.filter(student=request.user)
-        avg = submissions.aggregate(avg_score=Avg("score"))["avg_score"]
-        return self.response_ok({"average_quiz_score": round(avg or 0, 2)})
+        average = self.quiz_result_service.get_average_score(request.user)
+        return self.response_ok({"average_quiz_score": average})
 
-    @extend_schema(responses={200: RecentEnrolledCourseSerializer(many=True)})
+    @extend_schema(
+        parameters=build_sparse_fieldset_parameters(RecentEnrolledCourseValuesSerializer),
+        responses={200: RecentEnrolledCourseValuesSerializer(many=True)},
+    )
     @action(detail=False, methods=["get"], url_path="recent-enrolled-courses")
     def recent_enrolled_courses(self, request: Request) -> Response:
         """
         Get the most recent courses a student has enrolled in.
         """
         recent_course = self.dashboard_service.get_recent_enrollment_course(request.user)
-        serializer = RecentEnrolledCourseSerializer(recent_course, many=True).data
-        return self.response_ok(data=serializer)
+        sparse = self.get_sparse_fieldset(RecentEnrolledCourseValuesSerializer)
+        serializer = RecentEnrolledCourseValuesSerializer(
+            RecentEnrolledCourseValuesSerializer.project(recent_course, **sparse), many=True, **sparse
+        )
+        return self.response_ok(data=serializer.data)
 
     @extend_schema(responses={**base_responses, 200: RecentClassSerializer(many=True)})
     @action(detail=False, methods=["get"], url_path="recent-classes")
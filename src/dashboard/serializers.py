@@ -4,7 +4,7 @@ Serializers for the dashboard app.
 
 from rest_framework import serializers
 
-from core.serializers import BaseSerializer
+from core.serializers import BaseSerializer, ValuesSerializer
 
 
 class TotalEnrolledCoursesSerializer(BaseSerializer):
@@ -31,12 +31,12 @@ class AverageQuizScoreSerializer(BaseSerializer):
     average_quiz_score = serializers.DecimalField(max_digits=5, decimal_places=2)
 
 
-class RecentEnrolledCourseSerializer(BaseSerializer):
+class RecentEnrolledCourseValuesSerializer(ValuesSerializer):
     """
-    Serializer for recent enrolled courses in the dashboard.
+    Read-only serializer for recent enrolled courses in the dashboard.
     """
 
-    course_id = serializers.IntegerField(source="course.id")
+    course_id = serializers.IntegerField()
     title = serializers.CharField(source="course.title")
     enrolled_at = serializers.DateTimeField()
 
@@ -14,10 +14,9 @@ class DashboardService:
 
     def get_recent_enrollment_course(self, user):
         """
-        Get the most recent course the user has enrolled in.
+        Get the 5 most recent enrollments of the user.
         """
-        enrollments = user.enrollments.select_related("course").order_by("-enrolled_at")[:5]
-        return enrollments[:5] if enrollments else None
+        return user.enrollments.order_by("-enrolled_at")[:5]
 
     def get_recent_classes(self, user):
         """
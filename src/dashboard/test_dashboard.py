@@ -4,6 +4,8 @@ Test cases for Dashboard Stats API endpoints.
 
 from datetime import timedelta
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from classes.factories import LiveClassFactory
@@ -64,9 +66,33 @@ class DashboardAPITestCase(BaseAPITestCase):
         QuizSubmissionFactory(student=self.student, score=80, quiz__course=self.course1)
         QuizSubmissionFactory(student=self.student, score=90, quiz__course=self.course2)
 
-        response = self.get_json_ok(fragment="average-quiz-score")
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_json_ok(fragment="average-quiz-score")
         assert response.status_code == 200
         assert response.data["average_quiz_score"] == 85.00
+        # Read from the running total, not from the submissions.
+        assert not [query for query in context.captured_queries if "quizzes_quizsubmission" in query["sql"]]
+
+    def test_average_quiz_score_after_quiz_deleted(self):
+        """
+        Should leave the submissions of a deleted quiz, or of a deleted course, out of the average.
+        """
+        other_student = self.make_user(role=UserRole.STUDENT.value)
+        deleted = QuizSubmissionFactory(student=self.student, score=40, quiz__course=self.course1)
+        QuizSubmissionFactory(student=self.student, score=60, quiz=deleted.quiz)
+        QuizSubmissionFactory(student=other_student, score=10, quiz=deleted.quiz)
+        QuizSubmissionFactory(student=other_student, score=70, quiz__course=self.course2)
+        QuizSubmissionFactory(student=self.student, score=90, quiz__course=self.course2)
+        QuizSubmissionFactory(student=self.student, score=80, quiz__course=self.course3)
+        assert self.get_json_ok(fragment="average-quiz-score").data["average_quiz_score"] == 67.5
+
+        deleted.quiz.delete()
+        assert self.get_json_ok(fragment="average-quiz-score").data["average_quiz_score"] == 85.00
+        self.course3.delete()
+        assert self.get_json_ok(fragment="average-quiz-score").data["average_quiz_score"] == 90.00
+
+        self.set_authenticate(user=other_student)
+        assert self.get_json_ok(fragment="average-quiz-score").data["average_quiz_score"] == 70.00
 
     def test_recent_enrolled_courses(self):
         """
@@ -84,6 +110,9 @@ class DashboardAPITestCase(BaseAPITestCase):
         assert len(response.data) == 3
         assert response.data[0]["course_id"] == self.course3.id  # most recent first
 
+        response = self.get_json_ok(fragment="recent-enrolled-courses/?fields=title")
+        assert response.data[0] == {"title": self.course3.title}
+
     def test_recent_classes_combines_lessons_and_live_sessions(self):
         """
         Should return combined list of recent lessons and live classes.
@@ -89,7 +89,7 @@ class LessonViewSet(BaseAPIViewSet):
         Retrieve a specific lesson by its ID.
         """
         lesson = self.get_object()
-        course = lesson.course
+        course = self.lesson_service.get_course(lesson)
         user = request.user
 
         # access control: student must be enrolled OR instructor
@@ -119,7 +119,7 @@ class LessonViewSet(BaseAPIViewSet):
         lesson = self.get_object()
 
         progress = self.lesson_service.complete_lesson(user, lesson)
-        self.course_service.check_and_mark_course_completion(user, lesson.course)
+        self.course_service.check_and_mark_course_completion(user, self.lesson_service.get_course(lesson))
         return self.response_ok(
             data={
                 "id": str(lesson.id),
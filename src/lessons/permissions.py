@@ -4,7 +4,7 @@ Permission to only allow instructors to access the course.
 
 from rest_framework.permissions import BasePermission
 
-from courses.models import Course
+from courses.services import CourseService
 
 
 class IsOwnerLesson(BasePermission):
@@ -21,9 +21,9 @@ class IsOwnerLesson(BasePermission):
             if not course_id:
                 return False
 
-            course = Course.objects.get(id=course_id)
+            course = CourseService().get_course(course_id)
 
-            return course.instructor == request.user
+            return course.instructor_id == request.user.id
 
         return request.user.is_authenticated
 
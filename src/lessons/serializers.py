@@ -7,7 +7,7 @@ from datetime import datetime
 from rest_framework import serializers
 
 from core.mixins import PaginationParamSerializerMixin
-from core.serializers import BaseSerializer
+from core.serializers import BaseSerializer, ValuesSerializer
 from lessons.models import Lesson
 
 
@@ -52,6 +52,29 @@ class LessonSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "content", "video_url", "course_id"]
 
 
+class LessonCourseValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for the course of a lesson, used on `?expand=course`.
+    """
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+
+
+class LessonValuesSerializer(ValuesSerializer):
+    """
+    Read-only lesson serializer for list endpoints, same output as LessonSerializer.
+    """
+
+    expandable_fields = {"course": LessonCourseValuesSerializer()}
+
+    id = serializers.UUIDField()
+    title = serializers.CharField()
+    content = serializers.CharField(allow_null=True)
+    video_url = serializers.URLField(allow_null=True)
+    course_id = serializers.IntegerField()
+
+
 class LessonParamSerializer(PaginationParamSerializerMixin):
     """
     Lesson list Parameter Serializer.
@@ -8,7 +8,9 @@ from django.db.models import Count, Q
 
 from core.constants import DailyProcessStatus
 from core.exception import LessonException
-from courses.models import Enrollment
+from core.identity_map import memoize
+from courses.models import Course
+from courses.services import EnrollmentService
 from lessons.models import Lesson, LessonProgress
 
 
@@ -17,6 +19,12 @@ class LessonService:
     Service class for handling lesson-related operations.
     """
 
+    def __init__(self):
+        """
+        Initialize the LessonService with necessary dependencies.
+        """
+        self.enrollment_service = EnrollmentService()
+
     def create_lesson(self, data):
         """
         Create a new lesson for a course.
@@ -37,6 +45,15 @@ class LessonService:
         """
         return Lesson.objects.filter(course=course)
 
+    def get_course(self, lesson: Lesson) -> Course:
+        """
+        Get the course of a lesson through the identity map.
+
+        The course loaded with the lesson is stored in the map, so a later
+        `CourseService.get_course` of the same course in the request runs no query.
+        """
+        return memoize(Course, str(lesson.course_id), lambda: lesson.course)
+
     def verify_lesson_has_progress(self, lesson):
         """
         Verify if a lesson has progress associated with it.
@@ -48,7 +65,7 @@ class LessonService:
         """
         Verify if a student can complete a lesson.
         """
-        if not Enrollment.objects.filter(course=lesson.course, student=user).exists():
+        if not self.enrollment_service.find(lesson.course_id, user.id):
             raise LessonException(code="NOT_ENROLLED")
         if lesson.progress.filter(user=user, status=DailyProcessStatus.COMPLETED.value).exists():
             raise LessonException(code="ALREADY_COMPLETED")
@@ -2,26 +2,56 @@
 APIs for quizzes app.
 """
 
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from core.apis import BaseAPIViewSet
-from core.schema import base_responses
+from core.constants import SubmissionStatus
+from core.exception import QuizException
+from core.paginations import CustomPagination
+from core.schema import base_responses, build_query_parameters, build_sparse_fieldset_parameters
 from courses.permissions import IsEntityCourseOwner, IsStudent
 from courses.services import CourseService, EnrollmentService
 from lessons.services import LessonService
-from quizzes.models import Quiz
+from quizzes.models import Question, Quiz
 from quizzes.serializers import (
+    AutosaveResultSerializer,
+    GradebookEntryValuesSerializer,
+    ItemAnalysisSerializer,
+    QuestionImportResultSerializer,
+    QuestionImportSerializer,
     QuestionSerializer,
+    QuizAttemptSerializer,
     QuizRequestSerializer,
+    QuizResultSerializer,
     QuizSerializer,
     QuizSubmissionSerializer,
     QuizUpdateSerializer,
+    ScoreDistributionParamSerializer,
+    ScoreDistributionSerializer,
+    ScoreRankSerializer,
+    SubmissionTicketSerializer,
+)
+from quizzes.services import (
+    ItemAnalysisService,
+    QuizAttemptService,
+    QuizPayloadService,
+    QuizResultService,
+    QuizService,
+    ScoreDistributionService,
+    SubmissionQueueService,
 )
-from quizzes.services import QuizService
+from quizzes.tasks import build_item_analysis, check_score_distribution, grade_queued_submissions
 
 
 class QuizViewSet(BaseAPIViewSet):
@@ -30,6 +60,7 @@ class QuizViewSet(BaseAPIViewSet):
     """
 
     resource_name = "quizzes"
+    pagination_class = CustomPagination
     permission_classes = [IsAuthenticated]
     queryset = Quiz.objects.select_related("course").all()
 
@@ -39,15 +70,41 @@ class QuizViewSet(BaseAPIViewSet):
         """
         super().__init__(**kwargs)
         self.quiz_service = QuizService()
+        self.quiz_payload_service = QuizPayloadService()
+        self.item_analysis_service = ItemAnalysisService()
+        self.submission_queue_service = SubmissionQueueService()
+        self.attempt_service = QuizAttemptService()
+        self.result_service = QuizResultService()
+        self.score_distribution_service = ScoreDistributionService()
         self.course_service = CourseService()
         self.lesson_service = LessonService()
         self.enrollment_service = EnrollmentService()
 
+    def get_queryset(self):
+        """
+        Get the quizzes, with their questions when the action serializes them.
+        """
+        queryset = super().get_queryset()
+        if self.action == "partial_update":
+            queryset = queryset.prefetch_related(Prefetch("questions", queryset=Question.objects.order_by("position")))
+
+        return queryset
+
     def get_permissions(self):
         """
         Get permissions based on the action being performed.
         """
-        if self.action in ["create", "update", "destroy", "add_question", "partial_update"]:
+        if self.action in [
+            "create",
+            "update",
+            "destroy",
+            "add_question",
+            "import_questions",
+            "partial_update",
+            "item_analysis",
+            "gradebook",
+            "distribution",
+        ]:
             return [IsAuthenticated(), IsEntityCourseOwner()]
 
         return super().get_permissions()
@@ -63,8 +120,14 @@ class QuizViewSet(BaseAPIViewSet):
 
         course = self.course_service.get_course(course_id)
         title = serializer.validated_data["title"]
+        exam_mode = serializer.validated_data["exam_mode"]
+        questions_per_attempt = serializer.validated_data.get("questions_per_attempt")
+        time_limit_minutes = serializer.validated_data.get("time_limit_minutes")
+        max_attempts = serializer.validated_data["max_attempts"]
 
-        quiz = self.quiz_service.create_quiz(course, title)
+        quiz = self.quiz_service.create_quiz(
+            course, title, exam_mode, questions_per_attempt, time_limit_minutes, max_attempts
+        )
         serializer = QuizSerializer(quiz)
 
         return self.response_created(data=serializer.data)
@@ -86,10 +149,11 @@ class QuizViewSet(BaseAPIViewSet):
     @extend_schema(
         responses={**base_responses, 200: QuizSerializer},
     )
-    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+    def retrieve(self, request: Request, *args, **kwargs) -> HttpResponse:
         """
-
         Retrieve a specific quiz by its ID.
+
+        The payload is rendered once per quiz version and served from the cache.
         """
         quiz = self.get_object()
 
@@ -98,7 +162,7 @@ class QuizViewSet(BaseAPIViewSet):
         # Verify if the user is enrolled in the course
         self.course_service.verify_enrolled(user, course)
 
-        return self.response_ok(data=QuizSerializer(quiz).data)
+        return HttpResponse(self.quiz_payload_service.get(quiz, user), content_type="application/json")
 
     @extend_schema(responses={**base_responses, 204: None})
     def destroy(self, request: Request, *args, **kwargs) -> Response:
@@ -126,29 +190,93 @@ class QuizViewSet(BaseAPIViewSet):
         serializer.save(quiz=quiz)
         return self.response_created(data=serializer.data)
 
+    @extend_schema(
+        request={"multipart/form-data": QuestionImportSerializer},
+        responses={**base_responses, 201: QuestionImportResultSerializer},
+    )
+    @action(detail=True, methods=["post"], url_path="questions/import")
+    def import_questions(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Add the questions of a JSON, CSV or QTI file to a quiz.
+
+        The file is imported whole or not at all: an invalid question fails the
+        import with the errors of every invalid row.
+        """
+        quiz = self.get_object()
+
+        serializer = QuestionImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        questions = self.quiz_service.import_questions(quiz, serializer.validated_data["questions"])
+
+        return self.response_created(
+            data=QuestionImportResultSerializer(
+                {"format": serializer.validated_data["format"], "created": len(questions), "questions": questions}
+            ).data
+        )
+
     @extend_schema(
         request=QuizSubmissionSerializer,
-        responses={200: dict},
+        responses={200: dict, 202: SubmissionTicketSerializer},
     )
     @action(detail=True, methods=["post"], url_path="submit", permission_classes=[IsStudent])
     def submit(self, request: Request, pk=None) -> Response:
         """
         Submit answers for a quiz.
+
+        The submissions of an exam mode quiz are queued and graded in batches: the
+        response is a 202 with a ticket, poll `tickets/{ticket_id}/` for the score.
+
+        A started attempt is submitted with the answers saved by `autosave/`, the
+        answers of the request complete them. A timed attempt is graded as it
+        stands, the unanswered questions count as wrong, and past its deadline
+        only the answers saved in time count.
         """
         quiz = self.get_object()
         user = request.user
 
         self.course_service.verify_enrolled(user, quiz.course)
-        # Verify if the quiz is submitted
-        self.quiz_service.is_submitted(user, quiz)
+        # Verify if the student has an attempt left, the queue checks it on insert
+        if not quiz.exam_mode:
+            self.quiz_service.verify_attempts_left(user, quiz)
 
-        serializer = QuizSubmissionSerializer(data=request.data)
+        attempt = self.attempt_service.get_attempt(quiz.id, user)
+        if attempt is None and quiz.time_limit_minutes:
+            raise QuizException(code="ATTEMPT_NOT_STARTED")
+
+        # The answers are validated against the questions the student is asked.
+        answer_key = self.quiz_service.get_answer_key(quiz, user.id)
+        serializer = QuizSubmissionSerializer(data=request.data, context={"answer_key": answer_key})
         serializer.is_valid(raise_exception=True)
 
         answers = serializer.validated_data["answers"]
-
-        self.quiz_service.verify_all_questions_answered(answers, quiz)
-        submission, score = self.quiz_service.submit_quiz(answers, user, quiz)
+        if attempt is not None:
+            answers = self.attempt_service.collect_answers(attempt, quiz, answers)
+
+        if attempt is None or attempt.deadline is None:
+            self.quiz_service.verify_all_questions_answered(answers, quiz, user, answer_key)
+        if quiz.exam_mode:
+            ticket = self.submission_queue_service.enqueue(answers, user, quiz)
+            self.schedule_grading(quiz.id)
+            if attempt is not None:
+                self.attempt_service.finish(attempt)
+
+            return Response(data=self.ticket_data(ticket), status=status.HTTP_202_ACCEPTED)
+
+        submission, score = self.quiz_service.submit_quiz(answers, user, quiz, answer_key)
+        if attempt is not None:
+            self.attempt_service.finish(attempt)
+        if self.item_analysis_service.claim_refresh(quiz.id):
+            transaction.on_commit(
+                lambda: build_item_analysis.apply_async(
+                    args=[str(quiz.id)], countdown=settings.QUIZ_ITEM_ANALYSIS_REFRESH_DELAY
+                )
+            )
+        if self.score_distribution_service.claim_check(quiz.id):
+            transaction.on_commit(
+                lambda: check_score_distribution.apply_async(
+                    args=[str(quiz.id)], countdown=settings.QUIZ_SCORE_DISTRIBUTION_CHECK_DELAY
+                )
+            )
 
         return self.response_ok(
             data={
@@ -159,5 +287,197 @@ class QuizViewSet(BaseAPIViewSet):
             }
         )
 
+    @extend_schema(request=None, responses={**base_responses, 200: QuizAttemptSerializer, 201: QuizAttemptSerializer})
+    @action(detail=True, methods=["post"], url_path="start", permission_classes=[IsStudent])
+    def start(self, request: Request, pk=None) -> Response:
+        """
+        Start taking a quiz, or resume the ongoing attempt with its saved answers.
+
+        A quiz with a time limit must be started, and submitted before the deadline.
+        """
+        quiz = self.get_object()
+        user = request.user
+
+        self.course_service.verify_enrolled(user, quiz.course)
+        self.quiz_service.verify_attempts_left(user, quiz)
+        attempt, created = self.attempt_service.start(quiz, user)
+
+        data = QuizAttemptSerializer(
+            {
+                "attempt_id": attempt.id,
+                "quiz_id": quiz.id,
+                "deadline": attempt.deadline,
+                "answers": [
+                    {"question_id": question_id, "selected_option": option}
+                    for question_id, option in self.attempt_service.get_answers(attempt, quiz).items()
+                ],
+            }
+        ).data
+
+        return self.response_created(data=data) if created else self.response_ok(data=data)
+
+    @extend_schema(request=QuizSubmissionSerializer, responses={**base_responses, 200: AutosaveResultSerializer})
+    @action(detail=True, methods=["post"], url_path="autosave", permission_classes=[IsStudent])
+    def autosave(self, request: Request, pk=None) -> Response:
+        """
+        Save answers of the ongoing attempt as the student changes them, only the changed ones are needed.
+
+        The answers are buffered in the cache and flushed to the database periodically.
+        """
+        serializer = QuizSubmissionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        answers = serializer.validated_data["answers"]
+
+        state = self.attempt_service.save_answers(pk, request.user, answers)
+        deadline = datetime.fromtimestamp(state["deadline"], tz=UTC) if state["deadline"] is not None else None
+
+        return self.response_ok(data=AutosaveResultSerializer({"saved": len(answers), "deadline": deadline}).data)
+
+    @extend_schema(responses={**base_responses, 200: SubmissionTicketSerializer})
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"tickets/(?P<ticket_id>[^/.]+)",
+        permission_classes=[IsStudent],
+    )
+    def ticket(self, request: Request, pk=None, ticket_id=None) -> Response:
+        """
+        Get the status of a queued submission of an exam mode quiz, and its score once graded.
+        """
+        ticket = self.submission_queue_service.get_ticket(ticket_id, request.user, pk)
+        if ticket.status == SubmissionStatus.QUEUED.value:
+            # Recover a ticket a lost grading run left behind.
+            self.schedule_grading(ticket.quiz_id)
+
+        return self.response_ok(data=self.ticket_data(ticket))
+
+    @extend_schema(responses={**base_responses, 200: QuizResultSerializer})
+    @action(detail=True, methods=["get"], url_path="result", permission_classes=[IsStudent])
+    def result(self, request: Request, pk=None) -> Response:
+        """
+        Get the result of the student on a quiz: attempts, best and latest scores.
+        """
+        quiz = self.get_object()
+        result = self.result_service.get_result(request.user, quiz)
+        attempts = result.attempts if result else 0
+
+        return self.response_ok(
+            data=QuizResultSerializer(
+                {
+                    "quiz_id": quiz.id,
+                    "attempts": attempts,
+                    "attempts_left": max(quiz.max_attempts - attempts, 0) if quiz.max_attempts is not None else None,
+                    "best_score": result.best_score if result else None,
+                    "latest_score": result.latest_score if result else None,
+                }
+            ).data
+        )
+
+    @extend_schema(
+        parameters=build_sparse_fieldset_parameters(GradebookEntryValuesSerializer),
+        responses={**base_responses, 200: GradebookEntryValuesSerializer(many=True)},
+    )
+    @action(detail=True, methods=["get"], url_path="gradebook")
+    def gradebook(self, request: Request, pk=None) -> Response:
+        """
+        Get the result of every student who submitted a quiz, best score first.
+        """
+        quiz = self.get_object()
+        sparse = self.get_sparse_fieldset(GradebookEntryValuesSerializer)
+        page = self.paginate_queryset(
+            GradebookEntryValuesSerializer.project(self.result_service.get_results(quiz), **sparse)
+        )
+
+        return self.get_paginated_response(GradebookEntryValuesSerializer(page, many=True, **sparse).data)
+
+    @extend_schema(responses={**base_responses, 200: ScoreRankSerializer})
+    @action(detail=True, methods=["get"], url_path="rank", permission_classes=[IsStudent])
+    def rank(self, request: Request, pk=None) -> Response:
+        """
+        Get the percentile rank of the best score of the student among the students of a quiz.
+        """
+        quiz = self.get_object()
+        result = self.result_service.get_result(request.user, quiz)
+        counts = self.score_distribution_service.get_counts(quiz.id)
+
+        return self.response_ok(
+            data=ScoreRankSerializer(
+                {
+                    "quiz_id": quiz.id,
+                    "best_score": result.best_score if result else None,
+                    "percentile_rank": (
+                        self.score_distribution_service.percentile_rank(counts, result.best_score) if result else None
+                    ),
+                    "students": sum(counts),
+                }
+            ).data
+        )
+
+    @extend_schema(
+        parameters=build_query_parameters(ScoreDistributionParamSerializer),
+        responses={**base_responses, 200: ScoreDistributionSerializer},
+    )
+    @action(detail=True, methods=["get"], url_path="distribution")
+    def distribution(self, request: Request, pk=None) -> Response:
+        """
+        Get the histogram of the best scores of the students of a quiz.
+        """
+        quiz = self.get_object()
+        serializer = ScoreDistributionParamSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        bin_width = serializer.validated_data["bin_width"]
+        counts = self.score_distribution_service.get_counts(quiz.id)
+
+        return self.response_ok(
+            data=ScoreDistributionSerializer(
+                {
+                    "quiz_id": quiz.id,
+                    "students": sum(counts),
+                    "bin_width": bin_width,
+                    "bins": self.score_distribution_service.histogram(counts, bin_width),
+                }
+            ).data
+        )
+
+    @extend_schema(responses={**base_responses, 200: ItemAnalysisSerializer})
+    @action(detail=True, methods=["get"], url_path="item-analysis")
+    def item_analysis(self, request: Request, pk=None) -> Response:
+        """
+        Get the item analysis of a quiz: difficulty, discrimination and option counts per question.
+
+        The report is stored and refreshed in the background after new submissions.
+        """
+        quiz = self.get_object()
+
+        return self.response_ok(data=self.item_analysis_service.get(quiz))
+
+    def schedule_grading(self, quiz_id):
+        """
+        Schedule a grading run of the submission queue of a quiz, unless one is due.
+        """
+        if self.submission_queue_service.claim_processing(quiz_id):
+            transaction.on_commit(
+                lambda: grade_queued_submissions.apply_async(
+                    args=[str(quiz_id)], countdown=settings.QUIZ_EXAM_BATCH_DELAY
+                )
+            )
+
+    def ticket_data(self, ticket) -> dict:
+        """
+        Get the response data of a submission ticket.
+        """
+        submission = ticket.submission
+
+        return SubmissionTicketSerializer(
+            {
+                "ticket_id": ticket.id,
+                "quiz_id": ticket.quiz_id,
+                "status": ticket.status,
+                "submission_id": submission.id if submission else None,
+                "score": submission.score if submission else None,
+                "error_code": ticket.error_code or None,
+            }
+        ).data
+
 
 apps = [QuizViewSet]
@@ -12,3 +12,9 @@ class QuizzesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "quizzes"
+
+    def ready(self):
+        """
+        Connect the signal receivers.
+        """
+        from quizzes import signals  # noqa: F401
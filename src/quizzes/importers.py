@@ -0,0 +1,150 @@
+"""
+Parsers of the question files of the bulk question import.
+
+Every parser returns the questions as `{"text", "options", "correct_answer"}`
+dictionaries, left to `QuestionSerializer` to validate.
+"""
+
+import csv
+import io
+import json
+import os
+import xml.etree.ElementTree as ET
+
+IMPORT_FORMATS = ["json", "csv", "qti"]
+EXTENSIONS = {".json": "json", ".csv": "csv", ".xml": "qti", ".qti": "qti"}
+
+
+def detect_format(name: str) -> str | None:
+    """
+    Get the import format of a file from its extension, None if it is not supported.
+    """
+    return EXTENSIONS.get(os.path.splitext(name or "")[1].lower())
+
+
+def parse_json(content: bytes) -> list:
+    """
+    Parse a list of questions, or an object with a `questions` list.
+
+    Example:
+        [{"text": "What is 2+2?", "options": ["3", "4"], "correct_answer": "4"}]
+    """
+    data = json.loads(content)
+    if isinstance(data, dict):
+        data = data.get("questions")
+    if not isinstance(data, list):
+        raise ValueError("Expected a list of questions or an object with a `questions` list.")
+
+    return data
+
+
+def parse_csv(content: bytes) -> list[dict]:
+    """
+    Parse a CSV file with a header row.
+
+    The `text` and `correct_answer` columns are required, every column whose name
+    starts with `option` holds an option, the empty ones are skipped.
+
+    Example:
+        text,option_a,option_b,option_c,correct_answer
+        What is 2+2?,3,4,,4
+    """
+    reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig"), newline=""))
+    columns = reader.fieldnames or []
+    if "text" not in columns or "correct_answer" not in columns:
+        raise ValueError("The CSV header must have the `text`, `correct_answer` and `option...` columns.")
+
+    option_columns = [column for column in columns if column.startswith("option")]
+    try:
+        return [
+            {
+                "text": row["text"],
+                "options": [row[column] for column in option_columns if row[column]],
+                "correct_answer": row["correct_answer"],
+            }
+            for row in reader
+        ]
+    except csv.Error as exc:
+        raise ValueError(f"Line {reader.line_num}: {exc}") from exc
+
+
+def local_name(tag: str) -> str:
+    """
+    Get the name of an XML tag without its namespace.
+    """
+    return tag.rsplit("}", 1)[-1]
+
+
+def find_all(element: ET.Element, name: str) -> list[ET.Element]:
+    """
+    Find the descendants of an element by name, whatever their namespace.
+    """
+    return [child for child in element.iter() if local_name(child.tag) == name]
+
+
+def parse_qti_item(item: ET.Element) -> dict:
+    """
+    Parse a multiple choice item of a QTI 1.2 document.
+    """
+    options = {}
+    label_texts = set()
+    for label in find_all(item, "response_label"):
+        texts = find_all(label, "mattext")
+        label_texts.update(texts)
+        options[label.get("ident")] = "".join(texts[0].itertext()).strip() if texts else ""
+
+    question_texts = [text for text in find_all(item, "mattext") if text not in label_texts]
+
+    # The correct option is the one whose condition scores.
+    correct = None
+    for condition in find_all(item, "respcondition"):
+        values = find_all(condition, "varequal")
+        scores = [setvar.text for setvar in find_all(condition, "setvar")]
+        if values and any(float(score or 0) > 0 for score in scores):
+            correct = options.get((values[0].text or "").strip())
+            break
+
+    return {
+        "text": "".join(question_texts[0].itertext()).strip() if question_texts else "",
+        "options": list(options.values()),
+        "correct_answer": correct or "",
+    }
+
+
+def parse_qti(content: bytes) -> list[dict]:
+    """
+    Parse the multiple choice items of a QTI 1.2 like XML document.
+
+    Every `item` gives a question: the first `mattext` of its presentation is the
+    text, the `response_label`s are the options and the `varequal` of the
+    `respcondition` setting a positive score is the correct answer.
+    """
+    # Entities are not needed and would expand, refuse any document type declaration.
+    if b"<!DOCTYPE" in content or b"<!ENTITY" in content:
+        raise ValueError("Document type declarations are not allowed.")
+
+    try:
+        root = ET.fromstring(content)
+        return [parse_qti_item(item) for item in find_all(root, "item")]
+    except ET.ParseError as exc:
+        raise ValueError(f"Invalid XML: {exc}") from exc
+
+
+PARSERS = {"json": parse_json, "csv": parse_csv, "qti": parse_qti}
+
+
+def parse_questions(content: bytes, file_format: str) -> list:
+    """
+    Parse a question file.
+
+    Args:
+        content (bytes): The file content.
+        file_format (str): One of `IMPORT_FORMATS`.
+
+    Returns:
+        list: The questions.
+
+    Raises:
+        ValueError: If the file is malformed.
+    """
+    return PARSERS[file_format](content)
@@ -0,0 +1,79 @@
+"""
+Import the questions of a JSON, CSV or QTI file into a quiz.
+"""
+
+from pathlib import Path
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+
+from quizzes.importers import IMPORT_FORMATS
+from quizzes.models import Quiz
+from quizzes.serializers import QuestionImportSerializer
+from quizzes.services import QuizService
+
+
+class Command(BaseCommand):
+    """
+    Import a question bank into a quiz.
+
+    Usage:
+        python manage.py import_questions <quiz_id> questions.csv
+        python manage.py import_questions <quiz_id> bank.xml --format qti
+        python manage.py import_questions <quiz_id> questions.json --dry-run   # validate only
+
+    The file is validated as by `POST /quizzes/{id}/questions/import/`, and
+    imported whole or not at all.
+    """
+
+    help = "Import the questions of a JSON, CSV or QTI file into a quiz."
+
+    def add_arguments(self, parser):
+        """
+        Add the command arguments.
+        """
+        parser.add_argument("quiz_id", help="ID of the quiz.")
+        parser.add_argument("path", type=Path, help="The question file.")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="Defaults to the format of the file extension.")
+        parser.add_argument("--dry-run", action="store_true", help="Validate the file without importing it.")
+
+    def handle(self, *args, **options):
+        """
+        Validate and import the file.
+        """
+        quiz = Quiz.objects.filter(id=options["quiz_id"]).first()
+        if quiz is None:
+            raise CommandError(f"The quiz {options['quiz_id']} does not exist.")
+        if not options["path"].is_file():
+            raise CommandError(f"The file {options['path']} does not exist.")
+
+        with options["path"].open("rb") as file:
+            data = {"file": File(file, name=options["path"].name)}
+            if options["format"]:
+                data["format"] = options["format"]
+            serializer = QuestionImportSerializer(data=data)
+            if not serializer.is_valid():
+                raise CommandError(self.format_errors(serializer.errors))
+
+        questions = serializer.validated_data["questions"]
+        if options["dry_run"]:
+            self.stdout.write(f"{len(questions)} valid questions, nothing imported.")
+            return
+
+        created = QuizService().import_questions(quiz, questions)
+        self.stdout.write(self.style.SUCCESS(f"Imported {len(created)} questions into {quiz.title}."))
+
+    def format_errors(self, errors: dict) -> str:
+        """
+        Format the validation errors, one line per field or invalid row.
+        """
+        lines = ["The file is not valid:"]
+        for field, messages in errors.items():
+            if field == "questions":
+                for row, row_errors in messages.items():
+                    details = "; ".join(f"{name}: {' '.join(map(str, errors))}" for name, errors in row_errors.items())
+                    lines.append(f"  row {row}: {details}")
+            else:
+                lines.append(f"  {field}: {' '.join(map(str, messages))}")
+
+        return "\n".join(lines)
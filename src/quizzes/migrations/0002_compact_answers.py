@@ -0,0 +1,55 @@
+# Generated by Django 5.2 on 2026-10-19 08:34
+
+from django.db import migrations, models
+
+
+def number_questions(apps, schema_editor):
+    """
+    Number the questions of every quiz in creation order.
+    """
+    Quiz = apps.get_model('quizzes', 'Quiz')
+    Question = apps.get_model('quizzes', 'Question')
+    db = schema_editor.connection.alias
+
+    for quiz in Quiz.objects.using(db).iterator():
+        questions = list(Question.objects.using(db).filter(quiz=quiz).order_by('created_at', 'id'))
+        for position, question in enumerate(questions):
+            question.position = position
+        Question.objects.using(db).bulk_update(questions, ['position'])
+        Quiz.objects.using(db).filter(id=quiz.id).update(next_question_position=len(questions))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='position',
+            field=models.PositiveIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='quiz',
+            name='next_question_position',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='quizsubmission',
+            name='correctness',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.AddField(
+            model_name='quizsubmission',
+            name='selected_options',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.RunPython(number_questions, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='question',
+            unique_together={('quiz', 'position')},
+        ),
+    ]
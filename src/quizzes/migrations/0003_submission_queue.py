@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-19 08:37
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0002_compact_answers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='exam_mode',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='QueuedSubmission',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated_at')),
+                ('answers', models.JSONField()),
+                ('status', models.CharField(choices=[('Queued', 'QUEUED'), ('Graded', 'GRADED'), ('Rejected', 'REJECTED')], default='Queued', max_length=20)),
+                ('error_code', models.CharField(blank=True, max_length=50)),
+                ('quiz', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='quizzes.quiz')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('submission', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='quizzes.quizsubmission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['quiz', 'status', 'created_at'], name='quizzes_que_quiz_id_e6228f_idx')],
+                'unique_together': {('student', 'quiz')},
+            },
+        ),
+    ]
@@ -0,0 +1,113 @@
+# Generated by Django 5.2 on 2026-10-19 08:52
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def build_results(apps, schema_editor):
+    """
+    Build the results of the students from their submissions.
+    """
+    QuizSubmission = apps.get_model('quizzes', 'QuizSubmission')
+    QuizResult = apps.get_model('quizzes', 'QuizResult')
+    StudentQuizStats = apps.get_model('quizzes', 'StudentQuizStats')
+    db = schema_editor.connection.alias
+
+    results = {}
+    for submission in QuizSubmission.objects.using(db).order_by('submitted_at', 'id').iterator():
+        result = results.get((submission.student_id, submission.quiz_id))
+        if result is None:
+            result = results[(submission.student_id, submission.quiz_id)] = QuizResult(
+                student_id=submission.student_id, quiz_id=submission.quiz_id, best_score=submission.score
+            )
+        result.attempts += 1
+        result.best_score = max(result.best_score, submission.score)
+        result.latest_score = submission.score
+        result.latest_submission_id = submission.id
+    QuizResult.objects.using(db).bulk_create(results.values(), batch_size=1000)
+
+    totals = QuizSubmission.objects.using(db).values('student_id').annotate(count=Count('id'), total=Sum('score'))
+    StudentQuizStats.objects.using(db).bulk_create(
+        (
+            StudentQuizStats(student_id=row['student_id'], submissions=row['count'], total_score=row['total'])
+            for row in totals
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0005_timed_attempts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='queuedsubmission',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='quizattempt',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='queuedsubmission',
+            name='attempt',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='quiz',
+            name='max_attempts',
+            field=models.PositiveIntegerField(blank=True, default=1, null=True),
+        ),
+        migrations.AddField(
+            model_name='quizattempt',
+            name='number',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AlterUniqueTogether(
+            name='queuedsubmission',
+            unique_together={('student', 'quiz', 'attempt')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='quizattempt',
+            unique_together={('student', 'quiz', 'number')},
+        ),
+        migrations.CreateModel(
+            name='StudentQuizStats',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated_at')),
+                ('submissions', models.PositiveIntegerField(default=0)),
+                ('total_score', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='quiz_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='QuizResult',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated_at')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('best_score', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('latest_score', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('latest_submission', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='quizzes.quizsubmission')),
+                ('quiz', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='quizzes.quiz')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('student', 'quiz')},
+            },
+        ),
+        migrations.RunPython(build_results, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-19 08:55
+
+import django.db.models.deletion
+import struct
+import uuid
+from django.db import migrations, models
+
+
+def build_distributions(apps, schema_editor):
+    """
+    Count the best scores of the students of every quiz, in one point wide buckets.
+    """
+    QuizResult = apps.get_model('quizzes', 'QuizResult')
+    QuizScoreDistribution = apps.get_model('quizzes', 'QuizScoreDistribution')
+    db = schema_editor.connection.alias
+
+    distributions = {}
+    for quiz_id, best_score in QuizResult.objects.using(db).values_list('quiz_id', 'best_score').iterator():
+        counts = distributions.setdefault(quiz_id, [0] * 101)
+        counts[min(int(best_score), 100)] += 1
+    QuizScoreDistribution.objects.using(db).bulk_create(
+        (
+            QuizScoreDistribution(quiz_id=quiz_id, counts=struct.pack('<101I', *counts))
+            for quiz_id, counts in distributions.items()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0006_quiz_results'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuizScoreDistribution',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated_at')),
+                ('counts', models.BinaryField(default=b'')),
+                ('quiz', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='score_distribution', to='quizzes.quiz')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(build_distributions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-19 09:09
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0008_quiz_answer_key_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ItemAnalysisReport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated_at')),
+                ('answer_key_version', models.PositiveIntegerField(default=0)),
+                ('report', models.JSONField()),
+                ('quiz', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='item_analysis', to='quizzes.quiz')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
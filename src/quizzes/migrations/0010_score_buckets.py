@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2026-10-19 09:13
+
+import django.db.models.deletion
+import struct
+import uuid
+from django.db import migrations, models
+
+
+def split_distributions(apps, schema_editor):
+    """
+    Move the packed counts of every score distribution to one row per non-empty bucket.
+    """
+    QuizScoreDistribution = apps.get_model('quizzes', 'QuizScoreDistribution')
+    QuizScoreBucket = apps.get_model('quizzes', 'QuizScoreBucket')
+    db = schema_editor.connection.alias
+
+    QuizScoreBucket.objects.using(db).bulk_create(
+        (
+            QuizScoreBucket(quiz_id=quiz_id, bucket=bucket, count=count)
+            for quiz_id, counts in QuizScoreDistribution.objects.using(db).values_list('quiz_id', 'counts').iterator()
+            if counts
+            for bucket, count in enumerate(struct.unpack('<101I', bytes(counts)))
+            if count
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0009_item_analysis_report'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuizScoreBucket',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated_at')),
+                ('bucket', models.PositiveSmallIntegerField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('quiz', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='score_buckets', to='quizzes.quiz')),
+            ],
+            options={
+                'unique_together': {('quiz', 'bucket')},
+            },
+        ),
+        migrations.RunPython(split_distributions, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='QuizScoreDistribution',
+        ),
+    ]
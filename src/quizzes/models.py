@@ -2,8 +2,12 @@
 Quizzes models for the online learning platform.
 """
 
-from django.db import models
+from decimal import Decimal
 
+from django.db import models, transaction
+from django.db.models import F
+
+from core.constants import SubmissionStatus
 from core.models import AbstractTimeStampedModel, AbstractUUIDModel
 from courses.models import Course
 from users.models import User
@@ -16,6 +20,45 @@ class Quiz(AbstractTimeStampedModel, AbstractUUIDModel):
 
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
+    # Queue the submissions and grade them in batches, for scheduled exams
+    exam_mode = models.BooleanField(default=False)
+    # Present this many random questions of the quiz to every student, all of them when null
+    questions_per_attempt = models.PositiveIntegerField(null=True, blank=True)
+    # Time to submit once started, no limit when null
+    time_limit_minutes = models.PositiveIntegerField(null=True, blank=True)
+    # Submissions allowed per student, unlimited when null
+    max_attempts = models.PositiveIntegerField(null=True, blank=True, default=1)
+    # Position of the next question, never reused so the stored answers keep their meaning
+    next_question_position = models.PositiveIntegerField(default=0, editable=False)
+    # Version of the compiled answer key, bumped by every change of the quiz or of its questions
+    answer_key_version = models.PositiveIntegerField(default=0, editable=False)
+
+    @classmethod
+    def allocate_question_positions(cls, quiz_id, count: int = 1) -> int:
+        """
+        Reserve the next `count` question positions of a quiz and return the first one.
+
+        Call it in a transaction: the update locks the quiz row until the commit.
+        """
+        quizzes = cls.objects.filter(id=quiz_id)
+        quizzes.update(next_question_position=F("next_question_position") + count)
+
+        return quizzes.values_list("next_question_position", flat=True).get() - count
+
+    def save(self, *args, **kwargs):
+        """
+        Save the quiz, an update leaves the counters to the `F()` updates which bump them.
+
+        The counters of a loaded quiz are stale once a question changes, saving them would reuse
+        positions and bring back an older answer key.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in ("next_question_position", "answer_key_version")
+            ]
+        return super().save(*args, **kwargs)
 
 
 class Question(AbstractTimeStampedModel, AbstractUUIDModel):
@@ -27,6 +70,25 @@ class Question(AbstractTimeStampedModel, AbstractUUIDModel):
     text = models.TextField()
     options = models.JSONField()
     correct_answer = models.CharField(max_length=255)
+    position = models.PositiveIntegerField(editable=False)
+
+    class Meta:
+        """
+        Class Meta.
+        """
+
+        unique_together = ("quiz", "position")
+
+    def save(self, *args, **kwargs):
+        """
+        Save the question, giving a new question the next position of its quiz.
+        """
+        if self.position is not None:
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic():
+            self.position = Quiz.allocate_question_positions(self.quiz_id)
+            return super().save(*args, **kwargs)
 
 
 class QuizSubmission(AbstractTimeStampedModel, AbstractUUIDModel):
@@ -38,3 +100,129 @@ class QuizSubmission(AbstractTimeStampedModel, AbstractUUIDModel):
     quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE)
     score = models.DecimalField(max_digits=5, decimal_places=2)
     submitted_at = models.DateTimeField(auto_now_add=True)
+    # One bit per question position, set when the answer is correct
+    correctness = models.BinaryField(default=b"")
+    # One byte per question position, the index of the selected option, see quizzes.services
+    selected_options = models.BinaryField(default=b"")
+
+
+class QueuedSubmission(AbstractTimeStampedModel, AbstractUUIDModel):
+    """
+    QueuedSubmission model to hold a submission of an exam mode quiz until a worker grades it.
+
+    Its ID is the ticket returned to the student.
+    """
+
+    student = models.ForeignKey(User, on_delete=models.CASCADE)
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE)
+    answers = models.JSONField()
+    status = models.CharField(
+        max_length=20,
+        choices=SubmissionStatus.choices(),
+        default=SubmissionStatus.QUEUED.value,
+    )
+    submission = models.OneToOneField(QuizSubmission, on_delete=models.SET_NULL, null=True, blank=True)
+    # Number of the ticket among the ones of the student, unique so concurrent submissions can not both be queued
+    attempt = models.PositiveIntegerField(default=1)
+    error_code = models.CharField(max_length=50, blank=True)
+
+    class Meta:
+        """
+        Class Meta.
+        """
+
+        unique_together = ("student", "quiz", "attempt")
+        indexes = [models.Index(fields=["quiz", "status", "created_at"])]
+
+
+class QuizAttempt(AbstractTimeStampedModel, AbstractUUIDModel):
+    """
+    QuizAttempt model to track a student taking a quiz, from the start to the submission.
+
+    The answers saved while taking the quiz are buffered in the cache, `answers` is
+    their last snapshot flushed to the database.
+    """
+
+    student = models.ForeignKey(User, on_delete=models.CASCADE)
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE)
+    number = models.PositiveIntegerField(default=1)
+    deadline = models.DateTimeField(null=True, blank=True)
+    answers = models.JSONField(default=dict)
+    submitted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """
+        Class Meta.
+        """
+
+        unique_together = ("student", "quiz", "number")
+
+
+class QuizResult(AbstractTimeStampedModel, AbstractUUIDModel):
+    """
+    QuizResult model to keep the scores of a student on a quiz, updated on every submission.
+    """
+
+    student = models.ForeignKey(User, on_delete=models.CASCADE)
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name="results")
+    attempts = models.PositiveIntegerField(default=0)
+    best_score = models.DecimalField(max_digits=5, decimal_places=2)
+    latest_score = models.DecimalField(max_digits=5, decimal_places=2)
+    latest_submission = models.ForeignKey(
+        QuizSubmission, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+
+    class Meta:
+        """
+        Class Meta.
+        """
+
+        unique_together = ("student", "quiz")
+
+
+class StudentQuizStats(AbstractTimeStampedModel, AbstractUUIDModel):
+    """
+    StudentQuizStats model to keep the running average quiz score of a student, updated on every submission.
+    """
+
+    student = models.OneToOneField(User, on_delete=models.CASCADE, related_name="quiz_stats")
+    submissions = models.PositiveIntegerField(default=0)
+    total_score = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    @property
+    def average_score(self) -> Decimal:
+        """
+        Get the average score of the submissions of the student.
+        """
+        return round(self.total_score / self.submissions, 2) if self.submissions else Decimal(0)
+
+
+class QuizScoreBucket(AbstractTimeStampedModel, AbstractUUIDModel):
+    """
+    QuizScoreBucket model to keep how many students have their best score of a quiz in a one point wide score bucket.
+
+    Updated with `F()` expressions on every submission, see quizzes.services.ScoreDistributionService.
+    """
+
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name="score_buckets")
+    # Lowest score of the bucket, the bucket 100 holds the scores of 100
+    bucket = models.PositiveSmallIntegerField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """
+        Class Meta.
+        """
+
+        unique_together = ("quiz", "bucket")
+
+
+class ItemAnalysisReport(AbstractTimeStampedModel, AbstractUUIDModel):
+    """
+    ItemAnalysisReport model to keep the last item analysis of a quiz, see quizzes.services.ItemAnalysisService.
+    """
+
+    quiz = models.OneToOneField(Quiz, on_delete=models.CASCADE, related_name="item_analysis")
+    # `Quiz.answer_key_version` of the questions analyzed, an older report is computed again
+    answer_key_version = models.PositiveIntegerField(default=0)
+    report = models.JSONField()
@@ -2,9 +2,14 @@
 Register serializers for the quizzes app.
 """
 
+from django.conf import settings
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from core.serializers import BaseSerializer
+from core.constants import MAX_FILE_SIZE, SubmissionStatus
+from core.exception import FileUploadErrorMessage
+from core.serializers import BaseSerializer, ValuesSerializer
+from quizzes.importers import IMPORT_FORMATS, detect_format, parse_questions
 from quizzes.models import Question, Quiz
 
 
@@ -15,6 +20,20 @@ class QuizRequestSerializer(BaseSerializer):
 
     title = serializers.CharField()
     course_id = serializers.IntegerField()
+    exam_mode = serializers.BooleanField(required=False, default=False)
+    questions_per_attempt = serializers.IntegerField(
+        required=False, allow_null=True, min_value=1, help_text="Random questions per student, all when null."
+    )
+    time_limit_minutes = serializers.IntegerField(
+        required=False, allow_null=True, min_value=1, help_text="Time to submit once started, no limit when null."
+    )
+    max_attempts = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+        default=1,
+        help_text="Submissions per student, unlimited when null.",
+    )
 
 
 class QuizUpdateSerializer(serializers.ModelSerializer):
@@ -28,7 +47,7 @@ class QuizUpdateSerializer(serializers.ModelSerializer):
         """
 
         model = Quiz
-        fields = ["title"]
+        fields = ["title", "exam_mode", "questions_per_attempt", "time_limit_minutes", "max_attempts"]
 
 
 class QuestionSerializer(serializers.ModelSerializer):
@@ -57,6 +76,66 @@ class QuestionSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class QuestionImportSerializer(BaseSerializer):
+    """
+    Serializer for a bulk question import file.
+
+    Every question of the file is validated in one pass with `QuestionSerializer`,
+    the errors are reported by row number, starting at 1.
+    """
+
+    file = serializers.FileField()
+    format = serializers.ChoiceField(
+        choices=IMPORT_FORMATS, required=False, help_text="Defaults to the format of the file extension."
+    )
+
+    def validate_file(self, value):
+        """
+        Validate the file size.
+        """
+        if value.size > MAX_FILE_SIZE:
+            raise serializers.ValidationError(FileUploadErrorMessage.FILE_TOO_LARGE)
+
+        return value
+
+    def validate(self, attrs):
+        """
+        Parse the file and validate its questions.
+        """
+        file_format = attrs.get("format") or detect_format(attrs["file"].name)
+        if file_format is None:
+            raise serializers.ValidationError({"format": FileUploadErrorMessage.UNSUPPORTED_FILE_TYPE})
+
+        try:
+            rows = parse_questions(attrs["file"].read(), file_format)
+        except ValueError as exc:
+            raise serializers.ValidationError({"file": str(exc)}) from exc
+
+        if not rows:
+            raise serializers.ValidationError({"file": "The file has no questions."})
+        if len(rows) > settings.QUIZ_IMPORT_MAX_QUESTIONS:
+            raise serializers.ValidationError(
+                {"file": f"The file has more than {settings.QUIZ_IMPORT_MAX_QUESTIONS} questions."}
+            )
+
+        questions = QuestionSerializer(data=rows, many=True)
+        if not questions.is_valid():
+            errors = {index + 1: error for index, error in enumerate(questions.errors) if error}
+            raise serializers.ValidationError({"questions": errors})
+
+        return {"format": file_format, "questions": questions.validated_data}
+
+
+class QuestionImportResultSerializer(BaseSerializer):
+    """
+    Serializer for the result of a bulk question import.
+    """
+
+    format = serializers.ChoiceField(choices=IMPORT_FORMATS)
+    created = serializers.IntegerField()
+    questions = QuestionSerializer(many=True)
+
+
 class QuestionDisplaySerializer(serializers.ModelSerializer):
     """
     Serializer for displaying questions in a quiz without the correct answer.
@@ -84,12 +163,245 @@ class QuizSerializer(serializers.ModelSerializer):
         """
 
         model = Quiz
-        fields = ["id", "title", "questions"]
+        # `questions` stays last, see quizzes.services.QuizPayloadService
+        fields = [
+            "id",
+            "title",
+            "exam_mode",
+            "questions_per_attempt",
+            "time_limit_minutes",
+            "max_attempts",
+            "questions",
+        ]
+
+
+class AnswerSerializer(BaseSerializer):
+    """
+    Serializer for an answer of a submission, documents the items of `SubmissionAnswersField`.
+    """
+
+    question_id = serializers.CharField()
+    selected_option = serializers.CharField()
+
+
+@extend_schema_field(AnswerSerializer(many=True))
+class SubmissionAnswersField(serializers.Field):
+    """
+    The answers of a submission, validated in a single pass.
+
+    A list of `{"question_id", "selected_option"}` objects with distinct question
+    IDs, which must be questions the student is asked when the serializer context
+    has the `answer_key` of the student. The options are stripped, non blank
+    strings, as a `CharField` gives them. A `ListField` of `DictField`s runs a
+    field validation per value, which adds up on large exams.
+    """
+
+    default_error_messages = {
+        "not_a_list": "Expected a list of answers.",
+        "not_an_object": "Expected an object with a `question_id` and a `selected_option`.",
+        "invalid_question": "Expected a question ID.",
+        "unknown_question": "Not a question of the quiz.",
+        "duplicate_question": "The question is answered more than once.",
+        "invalid_option": "Expected a non blank string.",
+    }
+
+    def to_internal_value(self, data) -> list[dict]:
+        """
+        Validate the answers and get them as `{"question_id", "selected_option"}` strings.
+        """
+        if not isinstance(data, list):
+            self.fail("not_a_list")
+
+        answer_key = self.context.get("answer_key")
+        answers = []
+        seen = set()
+        errors = {}
+        for index, answer in enumerate(data):
+            if not isinstance(answer, dict):
+                errors[index] = [self.error_messages["not_an_object"]]
+                continue
+
+            question_id = answer.get("question_id")
+            option = answer.get("selected_option")
+            if isinstance(option, (int, float)) and not isinstance(option, bool):
+                option = str(option)
+
+            error = {}
+            if not isinstance(question_id, str) or not question_id:
+                error["question_id"] = [self.error_messages["invalid_question"]]
+            elif answer_key is not None and question_id not in answer_key:
+                error["question_id"] = [self.error_messages["unknown_question"]]
+            elif question_id in seen:
+                error["question_id"] = [self.error_messages["duplicate_question"]]
+            if not isinstance(option, str) or not (option := option.strip()):
+                error["selected_option"] = [self.error_messages["invalid_option"]]
+            if error:
+                errors[index] = error
+                continue
+
+            seen.add(question_id)
+            answers.append({"question_id": question_id, "selected_option": option})
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return answers
+
+    def to_representation(self, value):
+        """
+        Get the answers as they are.
+        """
+        return value
 
 
 class QuizSubmissionSerializer(BaseSerializer):
     """
     Serializer for quiz submission data.
+
+    Pass the `answer_key` of the student in the context to refuse the questions the student is not asked.
+    """
+
+    answers = SubmissionAnswersField(required=False, default=list)
+
+
+class QuizAttemptSerializer(BaseSerializer):
+    """
+    Serializer for a started quiz attempt.
+    """
+
+    attempt_id = serializers.UUIDField()
+    quiz_id = serializers.UUIDField()
+    deadline = serializers.DateTimeField(allow_null=True, help_text="No deadline when the quiz has no time limit.")
+    answers = serializers.ListField(
+        child=serializers.DictField(child=serializers.CharField(allow_null=True)), help_text="The saved answers."
+    )
+
+
+class AutosaveResultSerializer(BaseSerializer):
+    """
+    Serializer for the result of an answer save.
+    """
+
+    saved = serializers.IntegerField()
+    deadline = serializers.DateTimeField(allow_null=True)
+
+
+class SubmissionTicketSerializer(BaseSerializer):
+    """
+    Serializer for the status of a queued submission of an exam mode quiz.
+    """
+
+    ticket_id = serializers.UUIDField()
+    quiz_id = serializers.UUIDField()
+    status = serializers.ChoiceField(choices=SubmissionStatus.choices())
+    submission_id = serializers.UUIDField(allow_null=True)
+    score = serializers.FloatField(allow_null=True)
+    error_code = serializers.CharField(allow_null=True, help_text="The error code when the submission is rejected.")
+
+
+class QuizResultSerializer(BaseSerializer):
+    """
+    Serializer for the result of a student on a quiz.
+    """
+
+    quiz_id = serializers.UUIDField()
+    attempts = serializers.IntegerField()
+    attempts_left = serializers.IntegerField(allow_null=True, help_text="Unlimited when null.")
+    best_score = serializers.FloatField(allow_null=True)
+    latest_score = serializers.FloatField(allow_null=True)
+
+
+class GradebookEntryValuesSerializer(ValuesSerializer):
+    """
+    Read-only serializer for the result of a student in the gradebook of a quiz.
+    """
+
+    student_id = serializers.UUIDField(source="student.id")
+    email = serializers.EmailField(source="student.email")
+    attempts = serializers.IntegerField()
+    best_score = serializers.FloatField()
+    latest_score = serializers.FloatField()
+    latest_submission_id = serializers.UUIDField(allow_null=True)
+    updated_at = serializers.DateTimeField()
+
+
+class ScoreRankSerializer(BaseSerializer):
+    """
+    Serializer for where the best score of a student stands among the students of a quiz.
+    """
+
+    quiz_id = serializers.UUIDField()
+    best_score = serializers.FloatField(allow_null=True)
+    percentile_rank = serializers.FloatField(
+        allow_null=True, help_text="Share of the students below the score, plus half of the ones at it."
+    )
+    students = serializers.IntegerField()
+
+
+class ScoreDistributionParamSerializer(BaseSerializer):
+    """
+    Score distribution Parameter Serializer.
+    """
+
+    bin_width = serializers.IntegerField(
+        required=False, default=10, min_value=1, max_value=100, help_text="Points per bin."
+    )
+
+
+class ScoreBinSerializer(BaseSerializer):
+    """
+    Serializer for the number of students whose best score is in a bin.
+    """
+
+    min = serializers.IntegerField()
+    max = serializers.IntegerField(help_text="Excluded, but for the last bin.")
+    count = serializers.IntegerField()
+
+
+class ScoreDistributionSerializer(BaseSerializer):
+    """
+    Serializer for the distribution of the best scores of the students of a quiz.
+    """
+
+    quiz_id = serializers.UUIDField()
+    students = serializers.IntegerField()
+    bin_width = serializers.IntegerField()
+    bins = ScoreBinSerializer(many=True)
+
+
+class ItemAnalysisOptionSerializer(BaseSerializer):
+    """
+    Serializer for how often an option of a question was selected.
+    """
+
+    option = serializers.CharField()
+    count = serializers.IntegerField()
+    is_correct = serializers.BooleanField()
+
+
+class ItemAnalysisQuestionSerializer(BaseSerializer):
+    """
+    Serializer for the item analysis of a question.
+    """
+
+    question_id = serializers.UUIDField()
+    text = serializers.CharField()
+    answered = serializers.IntegerField(help_text="Submissions made since the question was added.")
+    difficulty = serializers.FloatField(allow_null=True, help_text="Share of correct answers.")
+    discrimination = serializers.FloatField(
+        allow_null=True,
+        help_text="Share of correct answers in the upper 27% of the scores minus in the lower 27%.",
+    )
+    options = ItemAnalysisOptionSerializer(many=True)
+    other = serializers.IntegerField(help_text="Answers which are none of the options.")
+
+
+class ItemAnalysisSerializer(BaseSerializer):
+    """
+    Serializer for the item analysis report of a quiz.
     """
 
-    answers = serializers.ListField(child=serializers.DictField(child=serializers.CharField()))
+    quiz_id = serializers.UUIDField()
+    submissions = serializers.IntegerField()
+    generated_at = serializers.DateTimeField()
+    questions = ItemAnalysisQuestionSerializer(many=True)
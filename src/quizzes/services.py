@@ -2,8 +2,261 @@
 Service functions for quizzes.
 """
 
+import hashlib
+import random
+import time
+import unicodedata
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, OuterRef, Prefetch, Subquery, Sum, Value, prefetch_related_objects
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from core.constants import SubmissionStatus
 from core.exception import QuizException
-from quizzes.models import Quiz, QuizSubmission
+from core.renderers import ORJSONRenderer
+from quizzes.models import (
+    ItemAnalysisReport,
+    Question,
+    QueuedSubmission,
+    Quiz,
+    QuizAttempt,
+    QuizResult,
+    QuizScoreBucket,
+    QuizSubmission,
+    StudentQuizStats,
+)
+from quizzes.serializers import QuizSerializer
+
+ANSWER_KEY_KEY = "quizzes:answer-key:{quiz_id}:{version}"
+QUESTION_POOL_KEY = "quizzes:question-pool:{quiz_id}:{version}"
+QUIZ_PAYLOAD_KEY = "quizzes:payload:{quiz_id}:{version}"
+ITEM_ANALYSIS_REFRESH_KEY = "quizzes:item-analysis-refresh:{quiz_id}"
+SUBMISSION_QUEUE_KEY = "quizzes:submission-queue:{quiz_id}"
+ATTEMPT_STATE_KEY = "quizzes:attempt-state:{quiz_id}:{student_id}"
+ATTEMPT_ANSWER_KEY = "quizzes:attempt-answer:{attempt_id}:{question_id}"
+ATTEMPT_FLUSH_KEY = "quizzes:attempt-flush:{attempt_id}"
+SCORE_DISTRIBUTION_CHECK_KEY = "quizzes:score-distribution-check:{quiz_id}"
+
+# Bytes of `QuizSubmission.selected_options` which are not an option index
+NOT_ASKED = 0xFE
+NO_OPTION = 0xFF
+# Share of the submissions in the upper and in the lower group of the discrimination index
+DISCRIMINATION_GROUP = 0.27
+# Buckets of the score distributions, one point wide, the last one holds the scores of 100
+SCORE_BUCKETS = 101
+
+
+def hash_answer(answer) -> bytes | None:
+    """
+    Hash an answer after normalizing its Unicode form and whitespace, None if it is not a string.
+
+    Args:
+        answer (str): The correct or the selected option.
+
+    Returns:
+        bytes | None: An 8 bytes digest.
+    """
+    if not isinstance(answer, str):
+        return None
+
+    normalized = " ".join(unicodedata.normalize("NFC", answer).split())
+    return hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+
+
+class AnswerKeyEntry(NamedTuple):
+    """
+    The answer key of one question.
+    """
+
+    position: int
+    correct: bytes | None
+    options: tuple[bytes | None, ...]
+
+
+class AnswerKeyService:
+    """
+    Compiled answer keys of the quizzes.
+
+    An answer key maps the question IDs of a quiz to their position and the hash
+    of their correct answer and options. It is compiled from a few columns of the
+    questions on first use and cached under `Quiz.answer_key_version`, a counter
+    bumped in the transaction of every question change, so grading a submission
+    does not load the questions and every process sees the new version at the commit.
+    """
+
+    def get_version(self, quiz: Quiz) -> int:
+        """
+        Get the answer key version of a quiz, as loaded with it.
+        """
+        return quiz.answer_key_version
+
+    def invalidate(self, quiz_id) -> None:
+        """
+        Start a new answer key version after the quiz or one of its questions changed.
+        """
+        Quiz.objects.filter(id=quiz_id).update(answer_key_version=F("answer_key_version") + 1)
+
+    def compile(self, quiz_id) -> dict[str, AnswerKeyEntry]:
+        """
+        Compile the answer key of a quiz from its questions.
+        """
+        questions = Question.objects.filter(quiz_id=quiz_id).values_list("id", "position", "correct_answer", "options")
+
+        return {
+            str(question_id): AnswerKeyEntry(
+                position, hash_answer(correct_answer), tuple(hash_answer(option) for option in options)
+            )
+            for question_id, position, correct_answer, options in questions
+        }
+
+    def get(self, quiz: Quiz) -> dict[str, AnswerKeyEntry]:
+        """
+        Get the answer key of a quiz, compiling it on a cache miss.
+
+        Args:
+            quiz (Quiz): The quiz.
+
+        Returns:
+            dict[str, AnswerKeyEntry]: The answer key entry per question ID.
+        """
+        key = ANSWER_KEY_KEY.format(quiz_id=quiz.id, version=self.get_version(quiz))
+        answer_key = cache.get(key)
+        if answer_key is None:
+            answer_key = self.compile(quiz.id)
+            cache.set(key, answer_key, timeout=settings.QUIZ_ANSWER_KEY_TIMEOUT)
+
+        return answer_key
+
+
+class QuestionPoolService:
+    """
+    Question pools of the quizzes which present a sample of their questions.
+
+    The pool of a quiz is the array of its question IDs, packed as 16 bytes UUIDs
+    in position order. It is built from the answer key and cached under the same
+    version, so a question change renews both. A sample is drawn in memory, never
+    with `ORDER BY RANDOM()`, by a generator seeded with the quiz and the student.
+    """
+
+    def __init__(self):
+        """
+        Initialize the QuestionPoolService with necessary dependencies.
+        """
+        self.answer_key_service = AnswerKeyService()
+
+    def get_pool(self, quiz: Quiz) -> bytes:
+        """
+        Get the pool of a quiz, building it on a cache miss.
+        """
+        key = QUESTION_POOL_KEY.format(quiz_id=quiz.id, version=self.answer_key_service.get_version(quiz))
+        pool = cache.get(key)
+        if pool is None:
+            answer_key = self.answer_key_service.get(quiz)
+            question_ids = sorted(answer_key, key=lambda question_id: answer_key[question_id].position)
+            pool = b"".join(uuid.UUID(question_id).bytes for question_id in question_ids)
+            cache.set(key, pool, timeout=settings.QUIZ_ANSWER_KEY_TIMEOUT)
+
+        return pool
+
+    def sample(self, quiz: Quiz, student_id) -> list[str] | None:
+        """
+        Draw the questions a student is asked from the pool of a quiz.
+
+        A student draws the same questions on every call as long as the pool does
+        not change.
+
+        Args:
+            quiz (Quiz): The quiz.
+            student_id (UUID): The student ID.
+
+        Returns:
+            list[str] | None: The question IDs in position order, None when every question is asked.
+        """
+        if not quiz.questions_per_attempt:
+            return None
+
+        pool = self.get_pool(quiz)
+        size = len(pool) // 16
+        if quiz.questions_per_attempt >= size:
+            return None
+
+        rng = random.Random(f"{quiz.id}:{student_id}")
+        indexes = sorted(rng.sample(range(size), quiz.questions_per_attempt))
+
+        return [str(uuid.UUID(bytes=pool[index * 16 : index * 16 + 16])) for index in indexes]
+
+
+class QuizPayloadService:
+    """
+    Rendered quiz payloads, the JSON a student gets when taking a quiz.
+
+    The payload of a quiz is serialized from its prefetched questions once per
+    `Quiz.answer_key_version`, which question and quiz changes bump, and cached as
+    rendered bytes: serving it is the quiz read and a payload read. A question
+    pool caches the payload head and every rendered question apart instead, and
+    a student's payload is joined from the fragments of the sampled questions.
+    """
+
+    def __init__(self):
+        """
+        Initialize the QuizPayloadService with necessary dependencies.
+        """
+        self.answer_key_service = AnswerKeyService()
+        self.question_pool_service = QuestionPoolService()
+
+    def render(self, quiz: Quiz) -> tuple[bytes, dict[str, bytes]]:
+        """
+        Render the payload of a quiz, without the correct answers.
+
+        Returns:
+            tuple[bytes, dict[str, bytes]]: The payload up to its question list,
+                and the rendered questions by ID in position order.
+        """
+        prefetch_related_objects([quiz], Prefetch("questions", queryset=Question.objects.order_by("position")))
+        renderer = ORJSONRenderer()
+        data = QuizSerializer(quiz).data
+        questions = {str(question["id"]): renderer.render(question) for question in data.pop("questions")}
+        # `questions` is the last field of the serializer, the head keeps the rendered order.
+        head = renderer.render(data)[:-1] + b',"questions":['
+
+        return head, questions
+
+    def get(self, quiz: Quiz, student) -> bytes:
+        """
+        Get the payload of a quiz for a student, rendering it on a cache miss.
+
+        Args:
+            quiz (Quiz): The quiz.
+            student (User): The student.
+
+        Returns:
+            bytes: The JSON payload.
+        """
+        key = QUIZ_PAYLOAD_KEY.format(quiz_id=quiz.id, version=self.answer_key_service.get_version(quiz))
+        payload = cache.get(key)
+        if payload is None:
+            head, questions = self.render(quiz)
+            payload = (head, questions) if quiz.questions_per_attempt else head + b",".join(questions.values()) + b"]}"
+            cache.set(key, payload, timeout=settings.QUIZ_ANSWER_KEY_TIMEOUT)
+
+        if isinstance(payload, bytes):
+            return payload
+
+        head, questions = payload
+        sample = self.question_pool_service.sample(quiz, student.id)
+        if sample is None:
+            return head + b",".join(questions.values()) + b"]}"
+
+        return head + b",".join(questions[question_id] for question_id in sample if question_id in questions) + b"]}"
 
 
 class QuizService:
@@ -11,49 +264,894 @@ class QuizService:
     Service class for managing quizzes.
     """
 
-    def create_quiz(self, course, title):
+    def __init__(self):
+        """
+        Initialize the QuizService with necessary dependencies.
+        """
+        self.answer_key_service = AnswerKeyService()
+        self.question_pool_service = QuestionPoolService()
+
+    def create_quiz(
+        self, course, title, exam_mode=False, questions_per_attempt=None, time_limit_minutes=None, max_attempts=1
+    ):
         """
         Create a new quiz for a course.
         """
-        return Quiz.objects.create(title=title, course=course)
+        return Quiz.objects.create(
+            title=title,
+            course=course,
+            exam_mode=exam_mode,
+            questions_per_attempt=questions_per_attempt,
+            time_limit_minutes=time_limit_minutes,
+            max_attempts=max_attempts,
+        )
 
-    def submit_quiz(self, answers, user, quiz):
+    def get_answer_key(self, quiz: Quiz, student_id, answer_key=None) -> dict[str, AnswerKeyEntry]:
         """
-        Submit a quiz for a student.
+        Get the answer key of the questions a student is asked, the sampled ones for a question pool.
+
+        Args:
+            quiz (Quiz): The quiz.
+            student_id (UUID): The student ID.
+            answer_key (dict[str, AnswerKeyEntry], optional): The answer key of the whole quiz, if already loaded.
+
+        Returns:
+            dict[str, AnswerKeyEntry]: The answer key entry per question ID.
+        """
+        answer_key = answer_key if answer_key is not None else self.answer_key_service.get(quiz)
+        sample = self.question_pool_service.sample(quiz, student_id)
+        if sample is None:
+            return answer_key
+
+        return {question_id: answer_key[question_id] for question_id in sample if question_id in answer_key}
+
+    def grade(self, answer_key: dict[str, AnswerKeyEntry], answers: list[dict]) -> tuple[float, bytes, bytes]:
+        """
+        Grade the answers of a submission.
+
+        The answers are stored by question position: a bitset of the correct
+        answers and one byte per question holding the index of the selected
+        option, `NO_OPTION` when it is not one of the options and `NOT_ASKED`
+        for the positions out of the answer key.
+
+        Args:
+            answer_key (dict[str, AnswerKeyEntry]): The answer key of the quiz.
+            answers (list[dict]): The `question_id` and `selected_option` of every answer.
+
+        Returns:
+            tuple[float, bytes, bytes]: The score, the correctness bitset and the selected options.
         """
-        questions = {str(q.id): q for q in quiz.questions.all()}
-        total_questions = len(questions)
-        correct_count = 0
+        width = max((entry.position for entry in answer_key.values()), default=-1) + 1
+        correctness = 0
+        selected_options = bytearray([NOT_ASKED]) * width
+        for entry in answer_key.values():
+            selected_options[entry.position] = NO_OPTION
 
         for answer in answers:
-            question_id = str(answer.get("question_id"))
-            selected_option = answer.get("selected_option")
+            entry = answer_key.get(str(answer.get("question_id")))
+            if entry is None:
+                continue
 
-            question = questions.get(question_id)
-            if question and question.correct_answer == selected_option:
-                correct_count += 1
+            selected_hash = hash_answer(answer.get("selected_option"))
+            if selected_hash is not None and selected_hash in entry.options:
+                index = entry.options.index(selected_hash)
+                selected_options[entry.position] = index if index < NOT_ASKED else NO_OPTION
+            if entry.correct is not None and entry.correct == selected_hash:
+                correctness |= 1 << entry.position
 
+        total_questions = len(answer_key)
+        correct_count = correctness.bit_count()
         score = round((correct_count / total_questions) * 100, 2) if total_questions > 0 else 0.0
 
+        return score, correctness.to_bytes((width + 7) // 8, "little"), bytes(selected_options)
+
+    def import_questions(self, quiz: Quiz, questions: list[dict]) -> list[Question]:
+        """
+        Add validated questions to a quiz in bulk.
+
+        The questions are inserted with `bulk_create`, which sends no signal, so
+        the caches of the quiz are invalidated once for the whole import.
+
+        Args:
+            quiz (Quiz): The quiz.
+            questions (list[dict]): The `text`, `options` and `correct_answer` of every question.
+
+        Returns:
+            list[Question]: The created questions.
+        """
+        with transaction.atomic():
+            start = Quiz.allocate_question_positions(quiz.id, len(questions))
+            created = Question.objects.bulk_create(
+                [Question(quiz=quiz, position=start + index, **question) for index, question in enumerate(questions)],
+                batch_size=settings.QUIZ_IMPORT_BATCH_SIZE,
+            )
+
+        self.invalidate_caches(quiz.id)
+
+        return created
+
+    def invalidate_caches(self, quiz_id) -> None:
+        """
+        Renew the answer key and the item analysis of a quiz after its questions changed.
+        """
+        self.answer_key_service.invalidate(quiz_id)
+
+    def submit_quiz(self, answers, user, quiz, answer_key=None):
+        """
+        Submit a quiz for a student.
+
+        Pass the `answer_key` of the student when the answers were validated with it.
+        The `post_save` signal of the submission updates the results of the student.
+        """
+        answer_key = answer_key if answer_key is not None else self.get_answer_key(quiz, user.id)
+        score, correctness, selected_options = self.grade(answer_key, answers)
+
         submission = QuizSubmission.objects.create(
             student=user,
             quiz=quiz,
             score=score,
+            correctness=correctness,
+            selected_options=selected_options,
         )
 
         return submission, score
 
-    def is_submitted(self, student, quiz):
+    def count_attempts(self, student, quiz) -> int:
+        """
+        Count the submissions of a student, the graded ones and the ones queued for grading.
+        """
+        attempts = QuizResult.objects.filter(student=student, quiz=quiz).values_list("attempts", flat=True).first()
+        if quiz.exam_mode:
+            queued = QueuedSubmission.objects.filter(student=student, quiz=quiz, status=SubmissionStatus.QUEUED.value)
+            return (attempts or 0) + queued.count()
+
+        return attempts or 0
+
+    def verify_attempts_left(self, student, quiz):
         """
-        Verify if a student has already submitted the quiz.
+        Verify if a student can submit the quiz again.
         """
-        if QuizSubmission.objects.filter(student=student, quiz=quiz).exists():
+        if quiz.max_attempts is not None and self.count_attempts(student, quiz) >= quiz.max_attempts:
             raise QuizException(code="ALREADY_COMPLETED")
 
-    def verify_all_questions_answered(self, answers, quiz):
+    def verify_all_questions_answered(self, answers, quiz, user, answer_key=None):
         """
-        Verify if all questions are answered.
+        Verify if all questions the student is asked are answered.
+
+        The answers must have distinct question IDs of the answer key, as `SubmissionAnswersField` validates them.
         """
-        questions = quiz.questions.count()
-        if len(answers) != questions:
+        answer_key = answer_key if answer_key is not None else self.get_answer_key(quiz, user.id)
+        if len(answers) != len(answer_key):
             raise QuizException(code="MISSING_ANSWER")
+
+
+class ItemAnalysisService:
+    """
+    Item analysis of the quizzes, computed from the stored answers of the submissions.
+
+    The stored answers of every submission are joined into one matrix, a row per
+    submission ordered by score and a column per question position, as a string
+    of correctness flags and a bytes object of selected options. A column is then
+    a strided slice and the statistics are `count` calls, which both run in C.
+    The last report is stored with the answer key version of its questions, so
+    any process serves it until a question changes.
+    """
+
+    def analyze(self, quiz_id) -> dict:
+        """
+        Compute the item analysis of a quiz.
+
+        Per question: the difficulty (share of correct answers), the
+        discrimination index (share of correct answers in the upper 27% of the
+        scores minus in the lower 27%) and how often every option was selected.
+        The submissions made before a question was added do not count for it.
+
+        Args:
+            quiz_id (UUID): The quiz ID.
+
+        Returns:
+            dict: The item analysis report.
+        """
+        questions = list(
+            Question.objects.filter(quiz_id=quiz_id)
+            .order_by("position")
+            .values_list("id", "position", "text", "options", "correct_answer")
+        )
+        width = questions[-1][1] + 1 if questions else 0
+        correct_rows = []
+        selected_rows = []
+        submissions = (
+            QuizSubmission.objects.filter(quiz_id=quiz_id)
+            .order_by("-score", "id")
+            .values_list("correctness", "selected_options")
+            .iterator(chunk_size=2000)
+        )
+        for correctness, selected_options in submissions:
+            selected_options = bytes(selected_options)
+            if not selected_options:
+                # Submitted before the answers were stored.
+                continue
+
+            bits = format(int.from_bytes(correctness, "little"), "b")
+            correct_rows.append(bits.zfill(width)[::-1][:width])
+            selected_rows.append(selected_options[:width].ljust(width, bytes([NOT_ASKED])))
+
+        correct_matrix = "".join(correct_rows)
+        selected_matrix = b"".join(selected_rows)
+        count = len(selected_rows)
+        group = max(round(count * DISCRIMINATION_GROUP), 1) if count > 1 else 0
+
+        items = []
+        for question_id, position, text, options, correct_answer in questions:
+            correct = correct_matrix[position::width]
+            selected = selected_matrix[position::width]
+            asked = count - selected.count(NOT_ASKED)
+            upper_asked = group - selected[:group].count(NOT_ASKED)
+            lower_asked = group - selected[count - group :].count(NOT_ASKED)
+            discrimination = None
+            if upper_asked and lower_asked:
+                discrimination = (
+                    correct[:group].count("1") / upper_asked - correct[count - group :].count("1") / lower_asked
+                )
+
+            items.append(
+                {
+                    "question_id": str(question_id),
+                    "text": text,
+                    "answered": asked,
+                    "difficulty": round(correct.count("1") / asked, 4) if asked else None,
+                    "discrimination": round(discrimination, 4) if discrimination is not None else None,
+                    "options": [
+                        {"option": option, "count": selected.count(index), "is_correct": option == correct_answer}
+                        for index, option in enumerate(options[:NOT_ASKED])
+                    ],
+                    "other": selected.count(NO_OPTION),
+                }
+            )
+
+        return {
+            "quiz_id": str(quiz_id),
+            "submissions": count,
+            "generated_at": timezone.now().isoformat(),
+            "questions": items,
+        }
+
+    def refresh(self, quiz_id) -> dict:
+        """
+        Compute the item analysis of a quiz and store it.
+        """
+        version = Quiz.objects.filter(id=quiz_id).values_list("answer_key_version", flat=True).get()
+        report = self.analyze(quiz_id)
+        ItemAnalysisReport.objects.update_or_create(
+            quiz_id=quiz_id, defaults={"answer_key_version": version, "report": report}
+        )
+
+        return report
+
+    def get(self, quiz: Quiz) -> dict:
+        """
+        Get the stored item analysis of a quiz, computing it when missing or older than its questions.
+        """
+        report = (
+            ItemAnalysisReport.objects.filter(quiz=quiz, answer_key_version=quiz.answer_key_version)
+            .values_list("report", flat=True)
+            .first()
+        )
+        if report is None:
+            report = self.refresh(quiz.id)
+
+        return report
+
+    def claim_refresh(self, quiz_id) -> bool:
+        """
+        Claim the next refresh of the item analysis of a quiz after a submission.
+
+        Only the first submission of every `QUIZ_ITEM_ANALYSIS_REFRESH_DELAY`
+        seconds claims it, so a busy quiz is analyzed once per delay.
+        """
+        return cache.add(
+            ITEM_ANALYSIS_REFRESH_KEY.format(quiz_id=quiz_id), True, timeout=settings.QUIZ_ITEM_ANALYSIS_REFRESH_DELAY
+        )
+
+
+class SubmissionQueueService:
+    """
+    Submission queue of the exam mode quizzes.
+
+    A submission is stored as a ticket, acknowledged right away, and graded by a
+    worker with the other tickets of the quiz in batches, the submissions
+    inserted with one `bulk_create` per batch. The unique ticket per student and
+    quiz replaces the check for an earlier submission on the request path.
+    """
+
+    def __init__(self):
+        """
+        Initialize the SubmissionQueueService with necessary dependencies.
+        """
+        self.quiz_service = QuizService()
+        self.result_service = QuizResultService()
+
+    def enqueue(self, answers, user, quiz) -> QueuedSubmission:
+        """
+        Queue the submission of a student.
+
+        Every ticket of a student takes the next number, the concurrent submissions
+        of a student take the same one and all but the first are refused.
+
+        Raises an exception if the student has no attempt left.
+        """
+        self.quiz_service.verify_attempts_left(user, quiz)
+        tickets = QueuedSubmission.objects.filter(student=user, quiz=quiz)
+        attempt = (tickets.aggregate(last=Max("attempt"))["last"] or 0) + 1
+        try:
+            with transaction.atomic():
+                return QueuedSubmission.objects.create(student=user, quiz=quiz, answers=answers, attempt=attempt)
+        except IntegrityError as exc:
+            raise QuizException(code="ALREADY_COMPLETED", developer_message=str(exc)) from exc
+
+    def claim_processing(self, quiz_id) -> bool:
+        """
+        Claim the next grading run of the queue of a quiz.
+
+        Only the first submission of every `QUIZ_EXAM_BATCH_DELAY` seconds claims
+        it, the run then grades what was queued meanwhile.
+        """
+        return cache.add(SUBMISSION_QUEUE_KEY.format(quiz_id=quiz_id), True, timeout=settings.QUIZ_EXAM_BATCH_DELAY)
+
+    def process(self, quiz_id) -> int:
+        """
+        Grade the queued submissions of a quiz, batch by batch, until the queue is empty.
+
+        Returns:
+            int: The number of tickets processed.
+        """
+        processed = 0
+        while True:
+            count = self.process_batch(quiz_id, settings.QUIZ_EXAM_BATCH_SIZE)
+            if not count:
+                # Let the submissions queued from now on schedule a new run.
+                cache.delete(SUBMISSION_QUEUE_KEY.format(quiz_id=quiz_id))
+                count = self.process_batch(quiz_id, settings.QUIZ_EXAM_BATCH_SIZE)
+                if not count:
+                    return processed
+            processed += count
+
+    @transaction.atomic
+    def process_batch(self, quiz_id, batch_size: int) -> int:
+        """
+        Grade the oldest queued submissions of a quiz.
+
+        The tickets are locked, skipping the ones another worker holds, so
+        concurrent runs grade distinct batches. The tickets of the students who
+        have no attempt left are rejected.
+
+        Args:
+            quiz_id (UUID): The quiz ID.
+            batch_size (int): The maximum number of tickets to grade.
+
+        Returns:
+            int: The number of tickets processed.
+        """
+        tickets = list(
+            QueuedSubmission.objects.select_for_update(skip_locked=True)
+            .filter(quiz_id=quiz_id, status=SubmissionStatus.QUEUED.value)
+            .order_by("created_at")[:batch_size]
+        )
+        if not tickets:
+            return 0
+
+        quiz = Quiz.objects.get(id=quiz_id)
+        answer_key = self.quiz_service.answer_key_service.get(quiz)
+        attempts = defaultdict(
+            int,
+            QuizResult.objects.filter(
+                quiz_id=quiz_id, student_id__in=[ticket.student_id for ticket in tickets]
+            ).values_list("student_id", "attempts"),
+        )
+        submissions = []
+        for ticket in tickets:
+            if quiz.max_attempts is not None and attempts[ticket.student_id] >= quiz.max_attempts:
+                ticket.status = SubmissionStatus.REJECTED.value
+                # The code of the error the synchronous submission returns
+                ticket.error_code = f"ERR_{QuizException.app_name}_ALREADY_COMPLETED"
+                continue
+            attempts[ticket.student_id] += 1
+
+            student_key = self.quiz_service.get_answer_key(quiz, ticket.student_id, answer_key)
+            score, correctness, selected_options = self.quiz_service.grade(student_key, ticket.answers)
+            ticket.submission = QuizSubmission(
+                id=uuid.uuid4(),
+                student_id=ticket.student_id,
+                quiz_id=quiz_id,
+                score=score,
+                correctness=correctness,
+                selected_options=selected_options,
+            )
+            ticket.status = SubmissionStatus.GRADED.value
+            submissions.append(ticket.submission)
+
+        QuizSubmission.objects.bulk_create(submissions)
+        # `bulk_create()` sends no signal.
+        self.result_service.record(submissions)
+        QueuedSubmission.objects.bulk_update(tickets, ["status", "error_code", "submission", "updated_at"])
+
+        return len(tickets)
+
+    def get_ticket(self, ticket_id, user, quiz_id) -> QueuedSubmission:
+        """
+        Get a submission ticket of a student.
+
+        Raises an exception if the ticket does not exist or is not the student's.
+        """
+        try:
+            return QueuedSubmission.objects.select_related("submission").get(
+                id=ticket_id, student=user, quiz_id=quiz_id
+            )
+        except (QueuedSubmission.DoesNotExist, ValidationError) as exc:
+            raise QuizException(code="TICKET_NOT_FOUND", developer_message=str(exc)) from exc
+
+
+class QuizAttemptService:
+    """
+    Attempts of the quizzes, timed when the quiz has a time limit.
+
+    Saving answers while taking a quiz only touches the cache: the attempt state
+    is cached when it starts and every answer is buffered under its own key, so
+    concurrent saves do not overwrite each other. The buffer is flushed to the
+    attempt at most once per `QUIZ_ATTEMPT_FLUSH_INTERVAL` seconds, and the
+    submission reads the last snapshot updated with the buffer. The buffer must
+    be seen by every API process, see core.cache.
+    """
+
+    def __init__(self):
+        """
+        Initialize the QuizAttemptService with necessary dependencies.
+        """
+        self.quiz_service = QuizService()
+
+    def start(self, quiz: Quiz, user) -> tuple[QuizAttempt, bool]:
+        """
+        Start an attempt of a student, or get the ongoing one.
+
+        Verify the student has an attempt left before starting a new one.
+
+        Returns:
+            tuple[QuizAttempt, bool]: The attempt, and whether it was created.
+        """
+        attempt = self.get_attempt(quiz.id, user)
+        created = attempt is None
+        if created:
+            deadline = timezone.now() + timedelta(minutes=quiz.time_limit_minutes) if quiz.time_limit_minutes else None
+            number = QuizAttempt.objects.filter(student=user, quiz=quiz).count() + 1
+            try:
+                with transaction.atomic():
+                    attempt = QuizAttempt.objects.create(student=user, quiz=quiz, number=number, deadline=deadline)
+            except IntegrityError:
+                # A concurrent request started it.
+                attempt, created = self.get_attempt(quiz.id, user), False
+                if attempt is None:
+                    raise
+
+        self.cache_state(attempt)
+        # The first flush is due one interval after the start.
+        self.claim_flush(attempt.id)
+
+        return attempt, created
+
+    def cache_state(self, attempt: QuizAttempt) -> dict:
+        """
+        Cache the state an answer save needs: the attempt ID and its deadline timestamp.
+        """
+        state = {
+            "attempt_id": str(attempt.id),
+            "deadline": attempt.deadline.timestamp() if attempt.deadline else None,
+        }
+        cache.set(
+            ATTEMPT_STATE_KEY.format(quiz_id=attempt.quiz_id, student_id=attempt.student_id),
+            state,
+            timeout=settings.QUIZ_ATTEMPT_BUFFER_TIMEOUT,
+        )
+
+        return state
+
+    def get_attempt(self, quiz_id, user) -> QuizAttempt | None:
+        """
+        Get the ongoing attempt of a student, None if there is none.
+        """
+        try:
+            return QuizAttempt.objects.filter(quiz_id=quiz_id, student=user, submitted_at__isnull=True).first()
+        except ValidationError:
+            # Not a quiz ID.
+            return None
+
+    def is_expired(self, deadline: float | None) -> bool:
+        """
+        Check if a deadline timestamp, plus the grace period, is over.
+        """
+        return deadline is not None and time.time() > deadline + settings.QUIZ_ATTEMPT_GRACE_SECONDS
+
+    def save_answers(self, quiz_id, user, answers: list[dict]) -> dict:
+        """
+        Buffer answers of the ongoing attempt of a student.
+
+        The database is only read when the cached state was evicted, and written
+        by the flush of the buffer once per interval.
+
+        Args:
+            quiz_id (UUID): The quiz ID.
+            user (User): The student.
+            answers (list[dict]): The `question_id` and `selected_option` of the changed answers.
+
+        Returns:
+            dict: The attempt state.
+        """
+        state = cache.get(ATTEMPT_STATE_KEY.format(quiz_id=quiz_id, student_id=user.id))
+        if state is None:
+            attempt = self.get_attempt(quiz_id, user)
+            if attempt is None:
+                raise QuizException(code="ATTEMPT_NOT_STARTED")
+            state = self.cache_state(attempt)
+
+        if self.is_expired(state["deadline"]):
+            raise QuizException(code="TIME_EXPIRED")
+
+        attempt_id = state["attempt_id"]
+        buffer = {
+            ATTEMPT_ANSWER_KEY.format(attempt_id=attempt_id, question_id=answer["question_id"]): answer.get(
+                "selected_option"
+            )
+            for answer in answers
+            if answer.get("question_id")
+        }
+        cache.set_many(buffer, timeout=settings.QUIZ_ATTEMPT_BUFFER_TIMEOUT)
+        if self.claim_flush(attempt_id):
+            self.flush(attempt_id)
+
+        return state
+
+    def claim_flush(self, attempt_id) -> bool:
+        """
+        Claim the flush of the buffer of an attempt, free once per `QUIZ_ATTEMPT_FLUSH_INTERVAL` seconds.
+        """
+        return cache.add(
+            ATTEMPT_FLUSH_KEY.format(attempt_id=attempt_id), True, timeout=settings.QUIZ_ATTEMPT_FLUSH_INTERVAL
+        )
+
+    def get_answers(self, attempt: QuizAttempt, quiz: Quiz) -> dict[str, str]:
+        """
+        Get the saved answers of an attempt by question ID, the snapshot updated with the buffer.
+
+        Only the questions the student is asked are read from the buffer.
+        """
+        question_ids = {
+            ATTEMPT_ANSWER_KEY.format(attempt_id=attempt.id, question_id=question_id): question_id
+            for question_id in self.quiz_service.get_answer_key(quiz, attempt.student_id)
+        }
+        buffered = cache.get_many(list(question_ids))
+
+        return {**attempt.answers, **{question_ids[key]: option for key, option in buffered.items()}}
+
+    def flush(self, attempt_id) -> None:
+        """
+        Write the buffered answers of an attempt to the database.
+
+        The attempt is locked before its snapshot and buffer are read, so concurrent
+        flushes write in turn, each from the snapshot of the previous one, and a
+        submitted attempt keeps the answers it was graded with.
+        """
+        with transaction.atomic():
+            attempt = (
+                QuizAttempt.objects.select_for_update(of=("self",))
+                .select_related("quiz")
+                .filter(id=attempt_id, submitted_at__isnull=True)
+                .first()
+            )
+            if attempt is None:
+                return
+
+            attempt.answers = self.get_answers(attempt, attempt.quiz)
+            attempt.save(update_fields=["answers", "updated_at"])
+
+    def collect_answers(self, attempt: QuizAttempt, quiz: Quiz, answers: list[dict]) -> list[dict]:
+        """
+        Get the answers to grade for the submission of an attempt.
+
+        The answers of the submission complete the saved ones until the deadline,
+        after it only the answers saved in time count.
+        """
+        saved = self.get_answers(attempt, quiz)
+        if not self.is_expired(attempt.deadline.timestamp() if attempt.deadline else None):
+            saved.update({str(answer["question_id"]): answer.get("selected_option") for answer in answers})
+        attempt.answers = saved
+
+        return [{"question_id": question_id, "selected_option": option} for question_id, option in saved.items()]
+
+    def finish(self, attempt: QuizAttempt) -> None:
+        """
+        Close a submitted attempt and drop its buffer.
+        """
+        attempt.submitted_at = timezone.now()
+        attempt.save(update_fields=["answers", "submitted_at", "updated_at"])
+
+        cache.delete_many(
+            [
+                ATTEMPT_STATE_KEY.format(quiz_id=attempt.quiz_id, student_id=attempt.student_id),
+                ATTEMPT_FLUSH_KEY.format(attempt_id=attempt.id),
+                *(
+                    ATTEMPT_ANSWER_KEY.format(attempt_id=attempt.id, question_id=question_id)
+                    for question_id in attempt.answers
+                ),
+            ]
+        )
+
+
+class QuizResultService:
+    """
+    Results of the students, maintained as the submissions are inserted.
+
+    The best and latest scores and the attempt count per student and quiz, and
+    the running total of the scores per student, are updated with `F()`
+    expressions on every insert, so reading them never scans the submissions.
+    The score distribution of the quiz follows the best scores. Deleting a quiz
+    takes its submissions out of the running totals, the results and the
+    distribution are deleted with it.
+    """
+
+    def __init__(self):
+        """
+        Initialize the QuizResultService with necessary dependencies.
+        """
+        self.distribution_service = ScoreDistributionService()
+
+    @transaction.atomic
+    def record(self, submissions: list[QuizSubmission]) -> None:
+        """
+        Add new submissions, in submission order, to the results of their students.
+
+        Args:
+            submissions (list[QuizSubmission]): The inserted submissions.
+        """
+        now = timezone.now()
+        totals = defaultdict(lambda: [0, Decimal(0)])
+        # The best scores before the submissions, locked until the commit
+        bests = {
+            (quiz_id, student_id): best_score
+            for quiz_id, student_id, best_score in QuizResult.objects.select_for_update()
+            .filter(
+                quiz_id__in={submission.quiz_id for submission in submissions},
+                student_id__in={submission.student_id for submission in submissions},
+            )
+            .values_list("quiz_id", "student_id", "best_score")
+        }
+        moves = defaultdict(lambda: defaultdict(int))
+        for submission in submissions:
+            score = Decimal(str(submission.score))
+            best_score = bests.get((submission.quiz_id, submission.student_id))
+            if best_score is None or score > best_score:
+                if best_score is not None:
+                    moves[submission.quiz_id][self.distribution_service.bucket(best_score)] -= 1
+                moves[submission.quiz_id][self.distribution_service.bucket(score)] += 1
+                bests[(submission.quiz_id, submission.student_id)] = score
+
+            self.upsert(
+                QuizResult.objects.filter(student_id=submission.student_id, quiz_id=submission.quiz_id),
+                {
+                    "attempts": F("attempts") + 1,
+                    "best_score": Greatest("best_score", Value(score)),
+                    "latest_score": score,
+                    "latest_submission": submission,
+                    "updated_at": now,
+                },
+                QuizResult(
+                    student_id=submission.student_id,
+                    quiz_id=submission.quiz_id,
+                    attempts=1,
+                    best_score=score,
+                    latest_score=score,
+                    latest_submission=submission,
+                ),
+            )
+            totals[submission.student_id][0] += 1
+            totals[submission.student_id][1] += score
+
+        for student_id, (count, total) in totals.items():
+            self.upsert(
+                StudentQuizStats.objects.filter(student_id=student_id),
+                {"submissions": F("submissions") + count, "total_score": F("total_score") + total, "updated_at": now},
+                StudentQuizStats(student_id=student_id, submissions=count, total_score=total),
+            )
+
+        for quiz_id, changes in moves.items():
+            self.distribution_service.merge(quiz_id, changes)
+
+    def forget(self, submissions) -> None:
+        """
+        Take submissions out of the running totals of their students, before they are deleted.
+
+        One update whatever the number of students, the count and the total of every
+        student are subqueries.
+
+        Args:
+            submissions (QuerySet[QuizSubmission]): The submissions about to be deleted.
+        """
+        per_student = submissions.filter(student_id=OuterRef("student_id")).order_by().values("student_id")
+        StudentQuizStats.objects.filter(student_id__in=submissions.values("student_id")).update(
+            submissions=F("submissions") - Subquery(per_student.annotate(count=Count("id")).values("count")),
+            total_score=F("total_score") - Subquery(per_student.annotate(total=Sum("score")).values("total")),
+            updated_at=timezone.now(),
+        )
+
+    def upsert(self, queryset, changes: dict, instance) -> None:
+        """
+        Update the row of a queryset, or insert `instance` when there is none.
+        """
+        if queryset.update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                instance.save(force_insert=True)
+        except IntegrityError:
+            # A concurrent submission inserted it.
+            queryset.update(**changes)
+
+    def get_result(self, student, quiz: Quiz) -> QuizResult | None:
+        """
+        Get the result of a student on a quiz, None if the student did not submit it.
+        """
+        return QuizResult.objects.filter(student=student, quiz=quiz).first()
+
+    def get_results(self, quiz: Quiz):
+        """
+        Get the results of the students on a quiz, the gradebook, best score first.
+        """
+        return QuizResult.objects.filter(quiz=quiz).order_by("-best_score", "student__email")
+
+    def get_average_score(self, student) -> Decimal:
+        """
+        Get the average score of all the submissions of a student.
+        """
+        stats = StudentQuizStats.objects.filter(student=student).first()
+
+        return stats.average_score if stats else Decimal(0)
+
+
+class ScoreDistributionService:
+    """
+    Distribution of the best scores of the students on every quiz, for percentile ranks and histograms.
+
+    The scores are bounded, so the sketch is a histogram of one point wide buckets:
+    its size is fixed, two of them merge by adding their counts, and a student whose
+    best score improves moves to another bucket, which a t-digest or a KLL sketch
+    can not do. Every bucket is a row updated with an `F()` expression, so concurrent
+    submissions only wait for each other when they change the same bucket, and
+    reading a rank costs at most `SCORE_BUCKETS` small rows whatever the number of students.
+    """
+
+    def bucket(self, score) -> int:
+        """
+        Get the bucket of a score.
+        """
+        return min(int(score), SCORE_BUCKETS - 1)
+
+    def add(self, quiz_id, bucket: int, change: int) -> bool:
+        """
+        Add a count change to a bucket of a quiz, False if the bucket has no row yet.
+        """
+        return bool(
+            QuizScoreBucket.objects.filter(quiz_id=quiz_id, bucket=bucket).update(
+                count=Greatest(F("count") + change, Value(0)), updated_at=timezone.now()
+            )
+        )
+
+    def merge(self, quiz_id, changes: dict[int, int]) -> None:
+        """
+        Add count changes by bucket to the distribution of a quiz, in the current transaction.
+
+        The buckets are updated in order, so two submissions moving students between
+        the same buckets lock them in the same order.
+
+        Args:
+            quiz_id (UUID): The quiz ID.
+            changes (dict[int, int]): The change of the count of every changed bucket.
+        """
+        missing = [
+            bucket for bucket in sorted(changes) if changes[bucket] and not self.add(quiz_id, bucket, changes[bucket])
+        ]
+        if not missing:
+            return
+
+        # A concurrent submission may insert the same buckets, the rows are only inserted empty.
+        QuizScoreBucket.objects.bulk_create(
+            [QuizScoreBucket(quiz_id=quiz_id, bucket=bucket) for bucket in missing], ignore_conflicts=True
+        )
+        for bucket in missing:
+            self.add(quiz_id, bucket, changes[bucket])
+
+    def get_counts(self, quiz_id) -> list[int]:
+        """
+        Get the number of students in every bucket of a quiz.
+        """
+        counts = [0] * SCORE_BUCKETS
+        for bucket, count in QuizScoreBucket.objects.filter(quiz_id=quiz_id).values_list("bucket", "count"):
+            counts[bucket] = count
+
+        return counts
+
+    def percentile_rank(self, counts: list[int], score) -> float | None:
+        """
+        Get the percentile rank of a score: the share of the students below it, plus half of the ones in its bucket.
+
+        Returns:
+            float | None: The rank, from 0 to 100, None if no student submitted the quiz.
+        """
+        total = sum(counts)
+        if not total:
+            return None
+
+        bucket = self.bucket(score)
+        return round((sum(counts[:bucket]) + counts[bucket] / 2) / total * 100, 2)
+
+    def histogram(self, counts: list[int], bin_width: int) -> list[dict]:
+        """
+        Group the buckets into bins of `bin_width` points, the last bin includes the scores of 100.
+        """
+        bins = [
+            {"min": start, "max": min(start + bin_width, 100), "count": sum(counts[start : start + bin_width])}
+            for start in range(0, 100, bin_width)
+        ]
+        bins[-1]["count"] += counts[100]
+
+        return bins
+
+    def compute(self, quiz_id) -> list[int]:
+        """
+        Compute the exact distribution of a quiz from the results of its students.
+        """
+        counts = [0] * SCORE_BUCKETS
+        for best_score in QuizResult.objects.filter(quiz_id=quiz_id).values_list("best_score", flat=True).iterator():
+            counts[self.bucket(best_score)] += 1
+
+        return counts
+
+    @transaction.atomic
+    def rebuild(self, quiz_id) -> int:
+        """
+        Replace the distribution of a quiz with the exact one.
+
+        The maintained counts drift when results are deleted or when concurrent
+        first submissions of a student race, the rebuild corrects them.
+
+        Returns:
+            int: The sum of the count errors of the buckets, 0 when the distribution was exact.
+        """
+        stored = dict(
+            QuizScoreBucket.objects.select_for_update().filter(quiz_id=quiz_id).values_list("bucket", "count")
+        )
+        counts = self.compute(quiz_id)
+        error = sum(abs(stored.get(bucket, 0) - count) for bucket, count in enumerate(counts))
+
+        QuizScoreBucket.objects.bulk_create(
+            [
+                QuizScoreBucket(quiz_id=quiz_id, bucket=bucket, count=count)
+                for bucket, count in enumerate(counts)
+                if stored.get(bucket, 0) != count
+            ],
+            update_conflicts=True,
+            unique_fields=["quiz", "bucket"],
+            update_fields=["count", "updated_at"],
+        )
+
+        return error
+
+    def claim_check(self, quiz_id) -> bool:
+        """
+        Claim the next accuracy check of the distribution of a quiz.
+
+        Only the first submission of every `QUIZ_SCORE_DISTRIBUTION_CHECK_DELAY`
+        seconds claims it, the check then rebuilds the distribution.
+        """
+        return cache.add(
+            SCORE_DISTRIBUTION_CHECK_KEY.format(quiz_id=quiz_id),
+            True,
+            timeout=settings.QUIZ_SCORE_DISTRIBUTION_CHECK_DELAY,
+        )
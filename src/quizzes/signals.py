@@ -0,0 +1,53 @@
+"""
+Signal receivers of the quizzes app.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from quizzes.models import Question, Quiz, QuizSubmission
+from quizzes.services import AnswerKeyService, QuizResultService, QuizService
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def invalidate_answer_key(sender, instance: Question, **kwargs) -> None:
+    """
+    Renew the compiled answer key and the item analysis of the quiz of a changed question.
+
+    `QuerySet.update()` and `bulk_create()` send no signal, call
+    `QuizService().invalidate_caches()` by hand.
+    """
+    QuizService().invalidate_caches(instance.quiz_id)
+
+
+@receiver(post_save, sender=Quiz)
+def invalidate_quiz_payload(sender, instance: Quiz, created: bool, **kwargs) -> None:
+    """
+    Start a new answer key version after a quiz changed, which renews its cached payload.
+    """
+    if not created:
+        AnswerKeyService().invalidate(instance.id)
+
+
+@receiver(post_save, sender=QuizSubmission)
+def record_quiz_result(sender, instance: QuizSubmission, created: bool, **kwargs) -> None:
+    """
+    Add a new submission to the results of its student.
+
+    `bulk_create()` sends no signal, call `QuizResultService().record()` by hand.
+    """
+    if created:
+        QuizResultService().record([instance])
+
+
+@receiver(pre_delete, sender=Quiz)
+def forget_quiz_submissions(sender, instance: Quiz, **kwargs) -> None:
+    """
+    Take the submissions of a deleted quiz, deleted course included, out of the averages of their students.
+
+    A receiver on the quiz rather than on every submission, so the cascade still deletes
+    the submissions in bulk. `QuerySet.delete()` of submissions sends no signal, call
+    `QuizResultService().forget()` by hand.
+    """
+    QuizResultService().forget(QuizSubmission.objects.filter(quiz=instance))
@@ -0,0 +1,46 @@
+"""
+Tasks for grading the queued submissions, the item analysis and the score distributions of quizzes.
+"""
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
+
+from config.celery import app
+from quizzes.services import ItemAnalysisService, ScoreDistributionService, SubmissionQueueService
+
+logger = get_task_logger(__name__)
+
+
+@app.task(name="build_item_analysis")
+def build_item_analysis(quiz_id):
+    """
+    Compute and store the item analysis of a quiz.
+    """
+    report = ItemAnalysisService().refresh(quiz_id)
+    logger.info(f"Analyzed {report['submissions']} submissions of quiz {quiz_id}.")
+
+
+@app.task(name="check_score_distribution")
+def check_score_distribution(quiz_id):
+    """
+    Compare the score distribution of a quiz with the exact one and correct it.
+    """
+    error = ScoreDistributionService().rebuild(quiz_id)
+    if error:
+        logger.warning(f"Corrected {error} counts of the score distribution of quiz {quiz_id}.")
+    else:
+        logger.info(f"The score distribution of quiz {quiz_id} is exact.")
+
+
+@app.task(name="grade_queued_submissions")
+def grade_queued_submissions(quiz_id):
+    """
+    Grade the queued submissions of an exam mode quiz.
+    """
+    processed = SubmissionQueueService().process(quiz_id)
+    logger.info(f"Graded {processed} queued submissions of quiz {quiz_id}.")
+
+    if processed and ItemAnalysisService().claim_refresh(quiz_id):
+        build_item_analysis.apply_async(args=[quiz_id], countdown=settings.QUIZ_ITEM_ANALYSIS_REFRESH_DELAY)
+    if processed and ScoreDistributionService().claim_check(quiz_id):
+        check_score_distribution.apply_async(args=[quiz_id], countdown=settings.QUIZ_SCORE_DISTRIBUTION_CHECK_DELAY)
@@ -2,12 +2,47 @@
 Test cases for the quizzes module.
 """
 
+import io
+import json
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
 from core.constants import UserRole
 from core.tests import BaseAPITestCase
 from courses.factories import CategoryFactory, CourseFactory
 from courses.models import Enrollment
 from quizzes.apis import QuizViewSet
-from quizzes.models import Question, Quiz
+from quizzes.models import (
+    ItemAnalysisReport,
+    Question,
+    QueuedSubmission,
+    Quiz,
+    QuizAttempt,
+    QuizResult,
+    QuizSubmission,
+)
+from quizzes.services import (
+    ATTEMPT_ANSWER_KEY,
+    ATTEMPT_FLUSH_KEY,
+    NOT_ASKED,
+    AnswerKeyEntry,
+    AnswerKeyService,
+    QuizAttemptService,
+    QuizService,
+    ScoreDistributionService,
+    SubmissionQueueService,
+    hash_answer,
+)
 
 
 class QuizAPITestCase(BaseAPITestCase):
@@ -35,6 +70,7 @@ class QuizAPITestCase(BaseAPITestCase):
             options=["3", "4", "5"],
             correct_answer="4",
         )
+        self.quiz.refresh_from_db()
 
     def test_create_quiz_success(self):
         """
@@ -101,7 +137,40 @@ class QuizAPITestCase(BaseAPITestCase):
         response = self.get_json_ok(fragment=f"{self.quiz.id}")
 
         assert response.status_code == 200
-        assert "questions" in response.data
+        assert "questions" in response.json()
+
+    def test_retrieve_quiz_serves_cached_payload(self):
+        """
+        Test the quiz payload is rendered once, without the correct answers, and renewed after a change.
+        """
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+        payload = self.get_json_ok(fragment=f"{self.quiz.id}/").content
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_json_ok(fragment=f"{self.quiz.id}/")
+        assert response.content == payload
+        assert not [query for query in context.captured_queries if "quizzes_question" in query["sql"]]
+        assert response.json() == {
+            "id": str(self.quiz.id),
+            "title": "Intro Quiz",
+            "exam_mode": False,
+            "questions_per_attempt": None,
+            "time_limit_minutes": None,
+            "max_attempts": 1,
+            "questions": [{"id": str(self.question.id), "text": "What is 2+2?", "options": ["3", "4", "5"]}],
+        }
+
+        Question.objects.create(quiz=self.quiz, text="What is 3+3?", options=["5", "6"], correct_answer="6")
+        self.quiz.title = "Renamed"
+        self.quiz.save()
+        data = self.get_json_ok(fragment=f"{self.quiz.id}/").json()
+        assert data["title"] == "Renamed"
+        assert [question["text"] for question in data["questions"]] == ["What is 2+2?", "What is 3+3?"]
+
+        # A change made by another process only bumps the version in the database.
+        Quiz.objects.filter(id=self.quiz.id).update(title="Elsewhere", answer_key_version=F("answer_key_version") + 1)
+        assert self.get_json_ok(fragment=f"{self.quiz.id}/").json()["title"] == "Elsewhere"
 
     def test_retrieve_quiz_forbidden_if_not_enrolled(self):
         """
@@ -111,6 +180,122 @@ class QuizAPITestCase(BaseAPITestCase):
         response = self.get_json_forbidden(fragment=f"{self.quiz.id}")
         assert response.status_code == 403
 
+    def test_import_questions_json(self):
+        """
+        Test importing a JSON file of questions with one insert and one answer key compilation.
+        """
+        self.set_authenticate(user=self.instructor)
+        assert len(AnswerKeyService().get(self.quiz)) == 1
+        questions = [
+            {"text": f"What is {number}+1?", "options": [str(number + 1), "0"], "correct_answer": str(number + 1)}
+            for number in range(3)
+        ]
+        upload = SimpleUploadedFile("bank.json", json.dumps({"questions": questions}).encode())
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.post_json(
+                data={"file": upload}, fragment=f"{self.quiz.id}/questions/import/", format_data="multipart"
+            )
+
+        assert response.status_code == 201
+        assert (response.data["format"], response.data["created"]) == ("json", 3)
+        sql = [query["sql"] for query in context.captured_queries]
+        assert len([query for query in sql if query.startswith('INSERT INTO "quizzes_question"')]) == 1
+        positions = Question.objects.filter(quiz=self.quiz).order_by("position").values_list("position", flat=True)
+        assert list(positions) == [0, 1, 2, 3]
+        self.quiz.refresh_from_db()
+        assert len(AnswerKeyService().get(self.quiz)) == 4
+
+    def test_import_questions_reports_invalid_rows(self):
+        """
+        Test an import with invalid rows reports them by row number and imports nothing.
+        """
+        self.set_authenticate(user=self.instructor)
+        content = "text,option_a,option_b,correct_answer\nWhat is 2+2?,3,4,4\nWhat is 3+3?,5,7,6\n"
+        upload = SimpleUploadedFile("bank.csv", content.encode())
+
+        response = self.post_json(
+            data={"file": upload}, fragment=f"{self.quiz.id}/questions/import/", format_data="multipart"
+        )
+
+        assert response.status_code == 400
+        [error] = response.data["errors"]
+        assert error["field"] == "questions"
+        assert list(error["message"]) == [2]
+        assert "correct_answer" in error["message"][2]
+        assert Question.objects.filter(quiz=self.quiz).count() == 1
+
+    def test_import_questions_command_qti(self):
+        """
+        Test the import command reads the multiple choice items of a QTI file.
+        """
+        content = """<?xml version="1.0"?>
+            <questestinterop xmlns="http://www.imsglobal.org/xsd/ims_qtiasiv1p2">
+              <item ident="q1">
+                <presentation>
+                  <material><mattext>What is 3+3?</mattext></material>
+                  <response_lid ident="answer"><render_choice>
+                    <response_label ident="A"><material><mattext>5</mattext></material></response_label>
+                    <response_label ident="B"><material><mattext>6</mattext></material></response_label>
+                  </render_choice></response_lid>
+                </presentation>
+                <resprocessing>
+                  <respcondition><conditionvar><varequal respident="answer">A</varequal></conditionvar>
+                    <setvar action="Set">0</setvar></respcondition>
+                  <respcondition><conditionvar><varequal respident="answer">B</varequal></conditionvar>
+                    <setvar action="Set">100</setvar></respcondition>
+                </resprocessing>
+              </item>
+            </questestinterop>"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "bank.xml"
+            path.write_text(content)
+            call_command("import_questions", str(self.quiz.id), str(path), stdout=io.StringIO())
+
+            # No option scores, so no correct answer.
+            path.write_text(content.replace(">100<", ">0<"))
+            with self.assertRaisesRegex(CommandError, "row 1: correct_answer"):
+                call_command("import_questions", str(self.quiz.id), str(path), "--dry-run")
+
+        question = Question.objects.get(quiz=self.quiz, position=1)
+        assert (question.text, question.options, question.correct_answer) == ("What is 3+3?", ["5", "6"], "6")
+
+    def test_question_pool_samples_per_student(self):
+        """
+        Test a question pool asks every student the same sample on every request, and grades against it.
+        """
+        quiz = Quiz.objects.create(title="Pool", course=self.course, questions_per_attempt=5)
+        QuizService().import_questions(
+            quiz,
+            [{"text": f"Question {number}", "options": ["A", "B"], "correct_answer": "A"} for number in range(20)],
+        )
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        with CaptureQueriesContext(connection) as context:
+            questions = self.get_json_ok(fragment=f"{quiz.id}/").json()["questions"]
+        assert len(questions) == 5
+        assert not [query for query in context.captured_queries if "RANDOM" in query["sql"].upper()]
+        assert self.get_json_ok(fragment=f"{quiz.id}/").json()["questions"] == questions
+        other_student = self.make_user()
+        assert QuizService().question_pool_service.sample(quiz, other_student.id) != [
+            question["id"] for question in questions
+        ]
+
+        answers = [{"question_id": question["id"], "selected_option": "A"} for question in questions]
+        response = self.post_json_bad_request(data={"answers": answers[:4]}, fragment=f"{quiz.id}/submit/")
+        assert response.data["errors"]["code"] == "ERR_QUIZ_MISSING_ANSWER"
+
+        response = self.post_json_ok(data={"answers": answers}, fragment=f"{quiz.id}/submit/")
+        assert response.data["score"] == 100
+        submission = QuizSubmission.objects.get(id=response.data["submission_id"])
+        positions = Question.objects.filter(id__in=[question["id"] for question in questions]).values_list(
+            "position", flat=True
+        )
+        asked = [index for index, value in enumerate(bytes(submission.selected_options)) if value != NOT_ASKED]
+        assert asked == sorted(positions)
+        assert int.from_bytes(submission.correctness, "little") == sum(1 << position for position in positions)
+
     def test_submit_quiz_success(self):
         """
         Test submitting a quiz with correct answers.
@@ -135,6 +320,34 @@ class QuizAPITestCase(BaseAPITestCase):
         assert response.status_code == 400
         assert response.data["errors"]["code"] == "ERR_QUIZ_MISSING_ANSWER"
 
+    def test_submit_quiz_rejects_unknown_and_duplicate_questions(self):
+        """
+        Test the answers are refused by index when a question is unknown, answered twice or the option is blank.
+        """
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        question_id = str(self.question.id)
+        payload = {
+            "answers": [
+                {"question_id": question_id, "selected_option": "4"},
+                {"question_id": question_id, "selected_option": "3"},
+                {"question_id": str(self.student.id), "selected_option": "4"},
+                {"question_id": question_id, "selected_option": " "},
+                "4",
+            ]
+        }
+        response = self.post_json(data=payload, fragment=f"{self.quiz.id}/submit/")
+
+        assert response.status_code == 400
+        [error] = response.data["errors"]
+        assert error["field"] == "answers"
+        assert list(error["message"]) == [1, 2, 3, 4]
+        assert "more than once" in error["message"][1]["question_id"][0]
+        assert "Not a question" in error["message"][2]["question_id"][0]
+        assert "selected_option" in error["message"][3]
+        assert not QuizSubmission.objects.exists()
+
     def test_submit_quiz_already_submitted(self):
         """
         Test submitting a quiz that has already been submitted.
@@ -149,6 +362,308 @@ class QuizAPITestCase(BaseAPITestCase):
         assert response.status_code == 400
         assert response.data["errors"]["code"] == "ERR_QUIZ_ALREADY_COMPLETED"
 
+    def test_submit_quiz_grades_without_loading_questions(self):
+        """
+        Test grading a submission from the compiled answer key, normalized answers included.
+        """
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+        AnswerKeyService().get(self.quiz)
+
+        payload = {"answers": [{"question_id": str(self.question.id), "selected_option": " 4 "}]}
+        with CaptureQueriesContext(connection) as context:
+            response = self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/submit/")
+
+        assert response.data["score"] == 100
+        assert not [query for query in context.captured_queries if "quizzes_question" in query["sql"]]
+
+    def test_answer_key_follows_question_changes(self):
+        """
+        Test the answer key is compiled again after a question is added, edited or deleted.
+        """
+        service = AnswerKeyService()
+        options = (hash_answer("3"), hash_answer("4"), hash_answer("5"))
+        assert service.get(self.quiz) == {str(self.question.id): AnswerKeyEntry(0, hash_answer("4"), options)}
+
+        self.set_authenticate(user=self.instructor)
+        payload = {"text": "What is 3+3?", "options": ["5", "6"], "correct_answer": "6"}
+        self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/questions/")
+        self.quiz.refresh_from_db()
+        assert len(service.get(self.quiz)) == 2
+
+        self.question.correct_answer = "5"
+        self.question.save()
+        self.quiz.refresh_from_db()
+        assert service.get(self.quiz)[str(self.question.id)].correct == hash_answer("5")
+
+        self.question.delete()
+        self.quiz.refresh_from_db()
+        assert len(service.get(self.quiz)) == 1
+
+    def test_submit_quiz_stores_answers_by_position(self):
+        """
+        Test a submission stores a correctness bitset and the index of the selected options.
+        """
+        question = Question.objects.create(quiz=self.quiz, text="What is 3+3?", options=["5", "6"], correct_answer="6")
+        assert (self.question.position, question.position) == (0, 1)
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        payload = {
+            "answers": [
+                {"question_id": str(self.question.id), "selected_option": "4"},
+                {"question_id": str(question.id), "selected_option": "5"},
+            ]
+        }
+        response = self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/submit/")
+
+        submission = QuizSubmission.objects.get(id=response.data["submission_id"])
+        assert bytes(submission.correctness) == bytes([0b01])
+        assert bytes(submission.selected_options) == bytes([1, 0])
+
+    def test_item_analysis(self):
+        """
+        Test the item analysis of a quiz from the stored answers, stored and refreshed after a submission.
+        """
+        question = Question.objects.create(quiz=self.quiz, text="What is 3+3?", options=["5", "6"], correct_answer="6")
+        service = QuizService()
+        for first, second in [("4", "6"), ("4", "5"), ("3", "6"), ("5", "7")]:
+            answers = [
+                {"question_id": str(self.question.id), "selected_option": first},
+                {"question_id": str(question.id), "selected_option": second},
+            ]
+            service.submit_quiz(answers, self.make_user(), self.quiz)
+        added = Question.objects.create(quiz=self.quiz, text="What is 1+1?", options=["2"], correct_answer="2")
+        self.set_authenticate(user=self.instructor)
+
+        report = self.get_json_ok(fragment=f"{self.quiz.id}/item-analysis/").data
+        assert report["submissions"] == 4
+        assert ItemAnalysisReport.objects.get(quiz=self.quiz).report == report
+        first, second, third = report["questions"]
+        assert (first["answered"], first["difficulty"], first["discrimination"]) == (4, 0.5, 1.0)
+        assert [option["count"] for option in first["options"]] == [1, 2, 1]
+        assert [option["is_correct"] for option in first["options"]] == [False, True, False]
+        assert (second["difficulty"], second["discrimination"], second["other"]) == (0.5, 1.0, 1)
+        assert [option["count"] for option in second["options"]] == [1, 2]
+        assert (third["answered"], third["difficulty"], third["discrimination"]) == (0, None, None)
+
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+        payload = {
+            "answers": [
+                {"question_id": str(self.question.id), "selected_option": "4"},
+                {"question_id": str(question.id), "selected_option": "6"},
+                {"question_id": str(added.id), "selected_option": "2"},
+            ]
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/submit/")
+        self.get_json_forbidden(fragment=f"{self.quiz.id}/item-analysis/")
+
+        self.set_authenticate(user=self.instructor)
+        report = self.get_json_ok(fragment=f"{self.quiz.id}/item-analysis/").data
+        assert report["submissions"] == 5
+        assert report["questions"][2]["answered"] == 1
+
+        Question.objects.create(quiz=self.quiz, text="What is 2+3?", options=["5"], correct_answer="5")
+        report = self.get_json_ok(fragment=f"{self.quiz.id}/item-analysis/").data
+        assert len(report["questions"]) == 4
+
+    def test_exam_mode_submission_is_queued_and_graded(self):
+        """
+        Test an exam mode submission is acknowledged with a ticket, graded by the worker and polled.
+        """
+        self.quiz.exam_mode = True
+        self.quiz.save()
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        payload = {"answers": [{"question_id": str(self.question.id), "selected_option": "4"}]}
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.post_json(data=payload, fragment=f"{self.quiz.id}/submit/")
+        assert response.status_code == 202
+        assert response.data["status"] == "Queued"
+        assert response.data["score"] is None
+        assert not QuizSubmission.objects.exists()
+
+        ticket_url = f"{self.quiz.id}/tickets/{response.data['ticket_id']}/"
+        assert self.get_json_ok(fragment=ticket_url).data["status"] == "Queued"
+
+        for callback in callbacks:
+            callback()
+        ticket = self.get_json_ok(fragment=ticket_url).data
+        assert (ticket["status"], ticket["score"]) == ("Graded", 100)
+        assert QuizSubmission.objects.get(id=ticket["submission_id"]).score == 100
+
+        response = self.post_json_bad_request(data=payload, fragment=f"{self.quiz.id}/submit/")
+        assert response.data["errors"]["code"] == "ERR_QUIZ_ALREADY_COMPLETED"
+
+        self.set_authenticate(user=self.make_user())
+        response = self.get_json_bad_request(fragment=ticket_url)
+        assert response.data["errors"]["code"] == "ERR_QUIZ_TICKET_NOT_FOUND"
+
+    def test_submission_queue_grades_in_batches(self):
+        """
+        Test the queue inserts the submissions of a batch at once and rejects the students who already submitted.
+        """
+        service = SubmissionQueueService()
+        answers = [{"question_id": str(self.question.id), "selected_option": "4"}]
+        students = [self.make_user() for _ in range(3)]
+        for student in students:
+            service.enqueue(answers, student, self.quiz)
+        QuizSubmission.objects.create(student=students[0], quiz=self.quiz, score=0)
+
+        with CaptureQueriesContext(connection) as context:
+            assert service.process_batch(self.quiz.id, batch_size=10) == 3
+        sql = [query["sql"] for query in context.captured_queries]
+        assert len([query for query in sql if query.startswith('INSERT INTO "quizzes_quizsubmission"')]) == 1
+
+        tickets = {ticket.student_id: ticket for ticket in QueuedSubmission.objects.all()}
+        assert tickets[students[0].id].status == "Rejected"
+        assert tickets[students[0].id].error_code == "ERR_QUIZ_ALREADY_COMPLETED"
+        assert [tickets[student.id].submission.score for student in students[1:]] == [100, 100]
+        assert service.process(self.quiz.id) == 0
+
+    def test_multiple_attempts_keep_best_and_latest_scores(self):
+        """
+        Test a quiz allowing retries keeps the best and latest scores and refuses the attempts over the limit.
+        """
+        self.quiz.max_attempts = 2
+        self.quiz.save()
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        for option in ["4", "3"]:
+            payload = {"answers": [{"question_id": str(self.question.id), "selected_option": option}]}
+            self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/submit/")
+        response = self.post_json_bad_request(data=payload, fragment=f"{self.quiz.id}/submit/")
+        assert response.data["errors"]["code"] == "ERR_QUIZ_ALREADY_COMPLETED"
+
+        with CaptureQueriesContext(connection) as context:
+            result = self.get_json_ok(fragment=f"{self.quiz.id}/result/").data
+        assert not [query for query in context.captured_queries if "quizzes_quizsubmission" in query["sql"]]
+        assert (result["attempts"], result["attempts_left"]) == (2, 0)
+        assert (result["best_score"], result["latest_score"]) == (100, 0)
+
+        self.get_json_forbidden(fragment=f"{self.quiz.id}/gradebook/")
+        self.set_authenticate(user=self.instructor)
+        response = self.get_json_ok(fragment=f"{self.quiz.id}/gradebook/")
+        [entry] = response.data["data"]
+        assert (entry["email"], entry["attempts"], entry["best_score"]) == (self.student.email, 2, 100)
+        assert response.data["pagination"]["total"] == 1
+
+        response = self.get_json_ok(fragment=f"{self.quiz.id}/gradebook/?fields=email,best_score")
+        assert response.data["data"] == [{"email": self.student.email, "best_score": 100}]
+
+    def test_score_distribution_follows_best_scores(self):
+        """
+        Test the percentile rank and the histogram follow the best scores, and the check corrects a drift.
+        """
+        self.quiz.max_attempts = None
+        self.quiz.save()
+        for score in [20, 55, 90]:
+            QuizSubmission.objects.create(student=self.make_user(), quiz=self.quiz, score=score)
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        for option in ["3", "4"]:
+            payload = {"answers": [{"question_id": str(self.question.id), "selected_option": option}]}
+            self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/submit/")
+
+        with CaptureQueriesContext(connection) as context:
+            rank = self.get_json_ok(fragment=f"{self.quiz.id}/rank/").data
+        assert not [query for query in context.captured_queries if "quizzes_quizsubmission" in query["sql"]]
+        assert (rank["best_score"], rank["percentile_rank"], rank["students"]) == (100, 87.5, 4)
+
+        self.get_json_forbidden(fragment=f"{self.quiz.id}/distribution/")
+        self.set_authenticate(user=self.instructor)
+        distribution = self.get_json_ok(fragment=f"{self.quiz.id}/distribution/?bin_width=50").data
+        assert [(item["min"], item["max"], item["count"]) for item in distribution["bins"]] == [
+            (0, 50, 1),
+            (50, 100, 3),
+        ]
+
+        service = ScoreDistributionService()
+        QuizResult.objects.filter(quiz=self.quiz, best_score=20).delete()
+        assert service.rebuild(self.quiz.id) == 1
+        assert service.rebuild(self.quiz.id) == 0
+        assert sum(service.get_counts(self.quiz.id)) == 3
+
+    def test_timed_attempt_buffers_autosaves(self):
+        """
+        Test the autosaves of a timed attempt only touch the cache until the flush interval is over.
+        """
+        self.quiz.time_limit_minutes = 10
+        self.quiz.save()
+        question = Question.objects.create(quiz=self.quiz, text="What is 3+3?", options=["5", "6"], correct_answer="6")
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        payload = {"answers": [{"question_id": str(self.question.id), "selected_option": "4"}]}
+        response = self.post_json_bad_request(data=payload, fragment=f"{self.quiz.id}/autosave/")
+        assert response.data["errors"]["code"] == "ERR_QUIZ_ATTEMPT_NOT_STARTED"
+        response = self.post_json_bad_request(data=payload, fragment=f"{self.quiz.id}/submit/")
+        assert response.data["errors"]["code"] == "ERR_QUIZ_ATTEMPT_NOT_STARTED"
+
+        response = self.post_json(data={}, fragment=f"{self.quiz.id}/start/")
+        assert response.status_code == 201
+        assert response.data["deadline"] is not None
+        attempt = QuizAttempt.objects.get(id=response.data["attempt_id"])
+
+        with CaptureQueriesContext(connection) as context:
+            for option in ["3", "5", "4"]:
+                payload = {"answers": [{"question_id": str(self.question.id), "selected_option": option}]}
+                assert self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/autosave/").data["saved"] == 1
+        assert not [query for query in context.captured_queries if "quizzes_" in query["sql"]]
+
+        # Once the interval is over, the next save flushes the buffer.
+        cache.delete(ATTEMPT_FLUSH_KEY.format(attempt_id=attempt.id))
+        payload = {"answers": [{"question_id": str(question.id), "selected_option": "6"}]}
+        self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/autosave/")
+        attempt.refresh_from_db()
+        assert attempt.answers == {str(self.question.id): "4", str(question.id): "6"}
+
+        response = self.post_json(data={}, fragment=f"{self.quiz.id}/start/")
+        assert response.status_code == 200
+        assert len(response.data["answers"]) == 2
+
+        response = self.post_json_ok(data={}, fragment=f"{self.quiz.id}/submit/")
+        assert response.data["score"] == 100
+        attempt.refresh_from_db()
+        assert attempt.submitted_at is not None
+
+        # A flush claimed before the submission does not overwrite the graded answers.
+        cache.set(ATTEMPT_ANSWER_KEY.format(attempt_id=attempt.id, question_id=self.question.id), "5")
+        QuizAttemptService().flush(attempt.id)
+        attempt.refresh_from_db()
+        assert attempt.answers == {str(self.question.id): "4", str(question.id): "6"}
+
+    def test_timed_attempt_after_deadline(self):
+        """
+        Test the answers are refused after the deadline and the submission only grades the ones saved in time.
+        """
+        self.quiz.time_limit_minutes = 10
+        self.quiz.save()
+        question = Question.objects.create(quiz=self.quiz, text="What is 3+3?", options=["5", "6"], correct_answer="6")
+        Enrollment.objects.create(course=self.course, student=self.student)
+        self.set_authenticate(user=self.student)
+
+        response = self.post_json(data={}, fragment=f"{self.quiz.id}/start/")
+        payload = {"answers": [{"question_id": str(self.question.id), "selected_option": "4"}]}
+        self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/autosave/")
+
+        attempt = QuizAttempt.objects.get(id=response.data["attempt_id"])
+        attempt.deadline = timezone.now() - timedelta(minutes=1)
+        attempt.save()
+        QuizAttemptService().cache_state(attempt)
+
+        payload = {"answers": [{"question_id": str(question.id), "selected_option": "6"}]}
+        response = self.post_json_bad_request(data=payload, fragment=f"{self.quiz.id}/autosave/")
+        assert response.data["errors"]["code"] == "ERR_QUIZ_TIME_EXPIRED"
+
+        response = self.post_json_ok(data=payload, fragment=f"{self.quiz.id}/submit/")
+        assert response.data["score"] == 50
+
     def test_delete_quiz_success(self):
         """
         Test deleting a quiz as an instructor.
@@ -196,4 +711,4 @@ class QuizAPITestCase(BaseAPITestCase):
 
         response = self.get_json_ok(fragment=f"{self.quiz.id}/")
         assert response.status_code == 200
-        assert "questions" in response.data
+        assert "questions" in response.json()